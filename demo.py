@@ -3,16 +3,108 @@
 Demo script to showcase the SII Empresas ETL system
 This script demonstrates the complete functionality of our Clean Code & SOLID ETL pipeline
 """
+import hashlib
 import sys
 from pathlib import Path
 
 # Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+SRC_DIR = Path(__file__).parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
 
 from src.etl import ETLPipeline
+from src.data_models import DataQualityReport
 from src.utils import setup_project_logging, get_logger
 import pandas as pd
 
+logger = get_logger(__name__)
+
+
+# Stage names of the cached artifacts (<stage>_<key>.parquet / .json)
+CACHED_STAGES = ('extract', 'transform', 'validate')
+
+
+def source_digest():
+    """Digest of the ETL source code, so cached stages are rebuilt when the code changes"""
+    digest = hashlib.sha256(pd.__version__.encode())
+    for source_file in sorted(SRC_DIR.rglob('*.py')):
+        digest.update(source_file.relative_to(SRC_DIR).as_posix().encode())
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+def stage_cache_key(pipeline):
+    """
+    Build the stage cache key from the ETL source code, the config file and the input file mtime
+    Returns None when the input file cannot be found (caching disabled)
+    """
+    input_path = pipeline.config_manager.resolve_path(pipeline.config.raw_data_path)
+    if not input_path.is_file():
+        return None
+    
+    config_path = pipeline.config_manager.config_path
+    config_bytes = config_path.read_bytes() if config_path.is_file() else b''
+    digest = hashlib.sha256(
+        source_digest().encode() + config_bytes + str(input_path.stat().st_mtime).encode()
+    )
+    return digest.hexdigest()[:16]
+
+
+def prune_stage_cache(cache_dir, key):
+    """Delete the cached stage artifacts of every key other than key"""
+    if not cache_dir.is_dir():
+        return
+    for cache_path in cache_dir.iterdir():
+        stage_name, _, cached_key = cache_path.stem.partition('_')
+        if stage_name in CACHED_STAGES and cached_key != key:
+            cache_path.unlink()
+
+
+def cached_stage(cache_dir, stage_name, key, thunk):
+    """
+    Return the DataFrame for a stage, reusing its Parquet artifact when the key matches
+    
+    Args:
+        cache_dir: Directory holding cached stage artifacts
+        stage_name: Name of the pipeline stage
+        key: Cache key (None disables caching)
+        thunk: Callable that runs the stage on a cache miss
+    """
+    if key is None:
+        return thunk()
+    
+    cache_path = cache_dir / f"{stage_name}_{key}.parquet"
+    if cache_path.exists():
+        print(f"♻️  Reusing cached {stage_name} stage: {cache_path.name}")
+        return pd.read_parquet(cache_path)
+    
+    df = thunk()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, index=False)
+    except Exception as e:
+        logger.warning(f"Could not cache {stage_name} stage: {e}")
+    return df
+
+
+def cached_report(cache_dir, key, thunk):
+    """Return the validation report, reusing its JSON artifact when the key matches"""
+    if key is None:
+        return thunk()
+    
+    cache_path = cache_dir / f"validate_{key}.json"
+    if cache_path.exists():
+        print(f"♻️  Reusing cached validate stage: {cache_path.name}")
+        return DataQualityReport.model_validate_json(cache_path.read_text(encoding='utf-8'))
+    
+    report = thunk()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(report.model_dump_json(), encoding='utf-8')
+    except Exception as e:
+        logger.warning(f"Could not cache validate stage: {e}")
+    return report
+
+
 def main():
     """Main demo function"""
     print("🚀 SII EMPRESAS ETL SYSTEM DEMO")
@@ -22,7 +114,6 @@ def main():
     
     # Setup logging
     setup_project_logging(log_level='INFO')
-    logger = get_logger(__name__)
     
     try:
         # 1. Initialize pipeline
@@ -32,10 +123,16 @@ def main():
         print(f"✅ Pipeline initialized: {pipeline.metadata.process_id}")
         print("")
         
+        # Stages are reused while the ETL code, config and input file are unchanged
+        cache_dir = pipeline.config_manager.get_project_root() / "data/processed/_cache"
+        cache_key = stage_cache_key(pipeline)
+        if cache_key is not None:
+            prune_stage_cache(cache_dir, cache_key)
+        
         # 2. Extract data
         print("2️⃣  EXTRACTING DATA")
         print("-" * 40)
-        raw_data = pipeline.run_extract_only()
+        raw_data = cached_stage(cache_dir, 'extract', cache_key, pipeline.run_extract_only)
         print(f"✅ Extracted {len(raw_data):,} records")
         print(f"📊 Data shape: {raw_data.shape}")
         print(f"📋 Columns: {list(raw_data.columns[:5])}...")
@@ -44,7 +141,10 @@ def main():
         # 3. Transform data
         print("3️⃣  TRANSFORMING DATA")
         print("-" * 40)
-        transformed_data = pipeline.run_transform_only(raw_data)
+        transformed_data = cached_stage(
+            cache_dir, 'transform', cache_key,
+            lambda: pipeline.run_transform_only(raw_data)
+        )
         print(f"✅ Transformed to {len(transformed_data):,} records")
         print(f"📊 New shape: {transformed_data.shape}")
         print("🔧 Transformations applied:")
@@ -57,7 +157,10 @@ def main():
         # 4. Validate data
         print("4️⃣  VALIDATING DATA QUALITY")
         print("-" * 40)
-        quality_report = pipeline.run_validation_only(transformed_data)
+        quality_report = cached_report(
+            cache_dir, cache_key,
+            lambda: pipeline.run_validation_only(transformed_data)
+        )
         print(f"✅ Quality score: {quality_report.quality_score:.1%}")
         print(f"📊 Total records: {quality_report.total_records:,}")
         print(f"🔍 Valid records: {quality_report.valid_records:,}")
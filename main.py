@@ -18,7 +18,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.etl import run_etl_pipeline
-from src.utils import setup_project_logging, get_logger
+from src.utils import ConfigManager, setup_project_logging, get_logger
 
 logger = get_logger(__name__)
 
@@ -37,6 +37,7 @@ Examples:
   python main.py --input data/raw/custom.csv       # Use custom input file
   python main.py --no-validation                   # Skip data validation
   python main.py --save-intermediates              # Save intermediate results
+  python main.py --no-validation --chunked         # Stream the input in chunks (bounded memory)
   python main.py --config config/custom.yaml      # Use custom configuration
         """
     )
@@ -66,6 +67,13 @@ Examples:
         help='Save intermediate results for debugging'
     )
     
+    parser.add_argument(
+        '--chunked',
+        action='store_true',
+        help='Read the input in chunks of chunk_size rows (from config); '
+             'with --no-validation the whole run keeps one chunk in memory'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -85,12 +93,16 @@ Examples:
         logger.info(f"Validation: {'disabled' if args.no_validation else 'enabled'}")
         logger.info(f"Save intermediates: {args.save_intermediates}")
         
+        chunksize = ConfigManager(args.config).load_config().chunk_size if args.chunked else None
+        logger.info(f"Chunk size: {chunksize or 'whole file'}")
+        
         # Run ETL pipeline
         results = run_etl_pipeline(
             config_path=args.config,
             input_file=args.input,
             validate_data=not args.no_validation,
-            save_intermediates=args.save_intermediates
+            save_intermediates=args.save_intermediates,
+            chunksize=chunksize
         )
         
         # Print summary
@@ -9,93 +9,343 @@ Fecha: 26 de julio de 2025
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import json
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba es opcional: sin él se usa la ruta de pandas
+    njit = None
 
 # Definir rutas
 BASE_DIR = Path(__file__).resolve().parent.parent
 INPUT_FILE = BASE_DIR / "data" / "processed" / "region_los_rios.csv"
+INPUT_PARQUET = BASE_DIR / "data" / "processed" / "region_los_rios.parquet"
+
+# Columnas usadas como clave de agrupación; se cargan como categóricas
+COLUMNAS_AGRUPACION = (
+    'Comuna del domicilio o casa matriz',
+    'Provincia del domicilio o casa matriz',
+    'Rubro economico',
+    'Año Comercial',
+)
+# Columnas numéricas que usan los análisis
+COLUMNAS_NUMERICAS = (
+    'Número de empresas',
+    'Número de trabajadores dependientes informados',
+    'Número de trabajadores dependientes de género femenino informados',
+    'Número de trabajadores dependientes de género masculino informados',
+)
+# Solo se leen estas columnas; el resto del CSV no se parsea ni ocupa memoria
+COLUMNAS_USADAS = COLUMNAS_AGRUPACION + COLUMNAS_NUMERICAS
 OUTPUT_DIR = BASE_DIR / "results" / "region_los_rios"
+TEMPLATES_DIR = BASE_DIR / "templates"
 
-# Crear directorio de salida si no existe
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Resolución de los PNG generados; 150 dpi basta para el dashboard y el reporte
+PLOT_DPI = int(os.getenv('PLOT_DPI', 150))
 
 # Configurar estilo de gráficos
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("viridis")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans']
+def paleta_viridis(n):
+    """Devuelve n colores de viridis, muestreados igual que sns.color_palette."""
+    from matplotlib import colormaps
+    return colormaps['viridis'](np.linspace(0, 1, n + 2)[1:-1])
+
+def configurar_matplotlib():
+    """
+    Importa matplotlib con el backend Agg y aplica el estilo de los gráficos.
+    
+    matplotlib se importa recién aquí, al crear la primera figura: el proceso
+    principal solo carga y agrega datos, así que no paga el costo de importarlo.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Backend sin pantalla, necesario en los procesos de trabajo
+    from cycler import cycler
+    
+    # Estilo equivalente a 'seaborn-v0_8-whitegrid' con paleta viridis, aplicado
+    # directamente sobre rcParams para no parsear la hoja de estilos
+    matplotlib.rcParams.update({
+        'axes.axisbelow': True,
+        'axes.edgecolor': '.8',
+        'axes.facecolor': 'white',
+        'axes.grid': True,
+        'axes.labelcolor': '.15',
+        'axes.linewidth': 1.0,
+        'axes.prop_cycle': cycler(color=paleta_viridis(6)),
+        'figure.facecolor': 'white',
+        'grid.color': '.8',
+        'grid.linestyle': '-',
+        'legend.frameon': False,
+        'lines.solid_capstyle': 'round',
+        'text.color': '.15',
+        'xtick.color': '.15',
+        'xtick.major.size': 0.0,
+        'xtick.minor.size': 0.0,
+        'ytick.color': '.15',
+        'ytick.major.size': 0.0,
+        'ytick.minor.size': 0.0,
+        'figure.figsize': (12, 8),
+        'font.family': 'sans-serif',
+        'font.sans-serif': ['Arial', 'DejaVu Sans'],
+        'agg.path.chunksize': 10000,
+        'path.simplify_threshold': 1.0,
+    })
+
+# Figura reutilizada por todos los gráficos de un mismo proceso (ver obtener_figura)
+_FIGURA = None
+
+# Dígitos como máximo en un valor del kernel: así la mantisa entera es menor que
+# 2**53 y dividirla por una potencia de 10 exacta da el mismo float que un parseo
+MAX_DIGITOS_EXACTOS = 15
+# Potencias de 10 exactas en float64, indexadas por la cantidad de decimales
+POTENCIAS_DE_10 = np.array([float(f'1e{k}') for k in range(MAX_DIGITOS_EXACTOS + 1)])
+
+if njit is not None:
+    @njit('int64(uint32[:, :], float64[:])', parallel=True, cache=True)
+    def _parsear_numeros(filas, salida):
+        """
+        Convierte cada fila de códigos Unicode a float, omitiendo ',' y '*'.
+        
+        Los dígitos se acumulan como entero y se dividen una sola vez por la
+        potencia de 10 de los decimales, así que el resultado es el de un parseo
+        de float. Las filas vacías quedan como NaN. Devuelve la cantidad de filas
+        que no se pudieron convertir (caracteres no numéricos o más de
+        MAX_DIGITOS_EXACTOS dígitos).
+        """
+        no_convertidas = 0
+        for i in prange(filas.shape[0]):
+            mantisa = 0
+            decimales = 0
+            en_decimales = False
+            negativo = False
+            digitos = 0
+            valido = True
+            for c in filas[i]:
+                if c == 0:  # relleno del ancho fijo: fin del texto
+                    break
+                if c == 44 or c == 42:  # ',', '*'
+                    continue
+                if 48 <= c <= 57:
+                    digitos += 1
+                    if digitos > MAX_DIGITOS_EXACTOS:
+                        valido = False
+                        break
+                    mantisa = mantisa * 10 + (c - 48)
+                    if en_decimales:
+                        decimales += 1
+                elif c == 46 and not en_decimales:  # '.'
+                    en_decimales = True
+                elif c == 45 and digitos == 0 and not negativo:  # '-'
+                    negativo = True
+                else:
+                    valido = False
+                    break
+            if not valido:
+                salida[i] = np.nan
+                no_convertidas += 1
+            elif digitos == 0:
+                salida[i] = np.nan
+            else:
+                valor = mantisa / POTENCIAS_DE_10[decimales]
+                salida[i] = -valor if negativo else valor
+        return no_convertidas
+else:
+    _parsear_numeros = None
+
+def _convertir_columna_numba(serie):
+    """Convierte una columna de texto con el kernel compilado; None si alguna fila no se pudo convertir."""
+    texto = serie.fillna('').astype(str).to_numpy(dtype=str)
+    ancho = texto.dtype.itemsize // 4
+    filas = texto.view(np.uint32).reshape(len(texto), ancho)
+    salida = np.empty(len(texto), dtype=np.float64)
+    
+    if _parsear_numeros(filas, salida):
+        return None
+    return pd.Series(salida, index=serie.index, name=serie.name)
 
 def clean_numeric_columns(df):
     """Limpia las columnas numéricas reemplazando '*' y convirtiendo formatos de números."""
-    numeric_columns = df.select_dtypes(include=['object']).columns
+    # Solo las columnas de COLUMNAS_NUMERICAS que siguen como texto; las de
+    # texto (comuna, rubro, ...) no se revisan
+    numeric_columns = [
+        col for col in COLUMNAS_NUMERICAS
+        if col in df.columns
+        and pd.api.types.is_string_dtype(df[col])
+        and not isinstance(df[col].dtype, pd.CategoricalDtype)
+    ]
     
     for col in numeric_columns:
-        # Verificar si la columna contiene valores numéricos con formato de miles
-        if df[col].dtype == 'object' and df[col].str.contains(',', na=False).any():
-            # Reemplazar '*' por NaN
-            df[col] = df[col].replace('*', np.nan)
-            
-            # Eliminar comas de números con formato de miles
-            df[col] = df[col].str.replace(',', '')
-            
-            # Convertir a float
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        # El kernel convierte los casos comunes; si alguna fila no le sirve
+        # (texto, exponentes, demasiados dígitos) decide la ruta de pandas
+        if _parsear_numeros is not None:
+            converted = _convertir_columna_numba(df[col])
+            if converted is not None:
+                df[col] = converted
+                continue
+        
+        # Eliminar '*' y comas de miles en una sola pasada sobre la columna
+        cleaned = df[col].str.replace(r'[,*]', '', regex=True)
+        converted = pd.to_numeric(cleaned, errors='coerce')
+        
+        # Convertir solo si todos los valores no vacíos son numéricos, para no
+        # anular una columna que trae texto
+        if converted.count() == cleaned.str.len().gt(0).sum():
+            df[col] = converted
     
     return df
 
-def analisis_empresas_por_comuna(df):
+def sumar_por_grupo(claves, valores):
+    """
+    Suma los valores por cada clave distinta, equivalente a groupby().sum().
+    
+    Factoriza las claves una vez y reduce con np.add.reduceat sobre el arreglo
+    ordenado, evitando la tabla hash de strings de pandas. Acepta una Series o
+    un DataFrame de valores; los NaN cuentan como 0 y las claves nulas se omiten.
+    """
+    codigos, unicos = pd.factorize(claves, sort=True)
+    validos = codigos >= 0
+    codigos = codigos[validos]
+    matriz = np.nan_to_num(valores.to_numpy(dtype=float, na_value=np.nan)[validos])
+    indice = pd.Index(unicos, name=claves.name)
+    
+    if len(codigos) == 0:
+        sumas = np.zeros((0,) + matriz.shape[1:])
+    else:
+        orden = np.argsort(codigos, kind='stable')
+        bordes = np.r_[0, np.flatnonzero(np.diff(codigos[orden])) + 1]
+        sumas = np.add.reduceat(matriz[orden], bordes, axis=0)
+    
+    if isinstance(valores, pd.DataFrame):
+        return pd.DataFrame(sumas, index=indice, columns=valores.columns)
+    return pd.Series(sumas, index=indice, name=valores.name)
+
+def calcular_agregados(df):
+    """
+    Calcula de una vez todas las agregaciones que usan los gráficos y el reporte.
+    
+    Cada clave de agrupación se recorre una sola vez; los análisis reciben
+    solo estos resultados pequeños en lugar del DataFrame completo.
+    """
+    por_comuna = sumar_por_grupo(
+        df['Comuna del domicilio o casa matriz'],
+        df[['Número de empresas',
+            'Número de trabajadores dependientes de género femenino informados',
+            'Número de trabajadores dependientes de género masculino informados']]
+    )
+    por_comuna.columns = ['Empresas', 'Femenino', 'Masculino']
+    
+    return {
+        'comuna': por_comuna,
+        'anio': sumar_por_grupo(
+            df['Año Comercial'],
+            df[['Número de empresas', 'Número de trabajadores dependientes informados']]
+        ),
+        'rubro': sumar_por_grupo(df['Rubro economico'], df['Número de empresas']),
+        'provincia': sumar_por_grupo(
+            df['Provincia del domicilio o casa matriz'], df['Número de empresas']
+        ),
+        'total_empresas': df['Número de empresas'].sum(),
+        'total_trabajadores': df['Número de trabajadores dependientes informados'].sum(),
+        'total_comunas': len(por_comuna),
+        'total_rubros': df['Rubro economico'].nunique(),
+    }
+
+def obtener_figura(figsize):
+    """
+    Devuelve la figura reutilizable del proceso, vacía y con el tamaño pedido.
+    
+    La figura y su canvas Agg se crean una sola vez por proceso; entre gráficos
+    solo se limpian, evitando reservar de nuevo el buffer de píxeles.
+    """
+    global _FIGURA
+    if _FIGURA is None:
+        configurar_matplotlib()
+        from matplotlib import font_manager, rcParams
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        # Precalentar la caché de fuentes antes del primer gráfico
+        font_manager.findfont(font_manager.FontProperties(family=rcParams['font.sans-serif']))
+        _FIGURA = Figure(dpi=PLOT_DPI)
+        FigureCanvasAgg(_FIGURA)
+    
+    _FIGURA.clear()
+    _FIGURA.set_size_inches(figsize)
+    return _FIGURA
+
+def guardar_figura(fig, nombre):
+    """
+    Ajusta el layout y escribe la figura como PNG en el directorio de salida.
+    
+    Se usa directamente el canvas Agg: tight_layout ya ajusta los márgenes, así
+    que la figura se dibuja una sola vez (savefig con bbox_inches='tight' la
+    dibuja dos veces para recortar).
+    """
+    fig.tight_layout()
+    fig.canvas.print_png(OUTPUT_DIR / nombre)
+
+def ejecutar_tarea(tarea, agregados):
+    """Ejecuta un análisis y, si devuelve una figura, la guarda como PNG."""
+    resultado = tarea(agregados)
+    if resultado is not None:
+        fig, nombre = resultado
+        guardar_figura(fig, nombre)
+
+def analisis_empresas_por_comuna(agregados):
     """Analiza y grafica la distribución de empresas por comuna."""
-    empresas_comuna = df.groupby('Comuna del domicilio o casa matriz')['Número de empresas'].sum().sort_values(ascending=False)
+    empresas_comuna = agregados['comuna']['Empresas'].sort_values(ascending=False)
     
     # Gráfico de barras
-    plt.figure(figsize=(14, 10))
-    ax = empresas_comuna.plot(kind='bar', color=sns.color_palette("viridis", len(empresas_comuna)))
+    fig = obtener_figura((14, 10))
+    ax = fig.add_subplot()
+    empresas_comuna.plot(kind='bar', ax=ax, color=paleta_viridis(len(empresas_comuna)))
     
-    plt.title('Número de Empresas por Comuna en la Región de Los Ríos', fontsize=16, fontweight='bold')
-    plt.xlabel('Comuna', fontsize=14)
-    plt.ylabel('Número de Empresas', fontsize=14)
-    plt.xticks(rotation=45, ha='right', fontsize=12)
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.set_title('Número de Empresas por Comuna en la Región de Los Ríos', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Comuna', fontsize=14)
+    ax.set_ylabel('Número de Empresas', fontsize=14)
+    for etiqueta in ax.get_xticklabels():
+        etiqueta.set(rotation=45, ha='right', fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Añadir etiquetas con los valores
     for i, v in enumerate(empresas_comuna):
         ax.text(i, v + 0.5, f'{v:,.0f}', ha='center', fontsize=10)
     
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'empresas_por_comuna.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    return fig, 'empresas_por_comuna.png'
 
-def analisis_rubros_economicos(df):
+def analisis_rubros_economicos(agregados):
     """Analiza y grafica la distribución por rubros económicos."""
-    # Agrupar por rubros
-    rubros = df.groupby('Rubro economico')['Número de empresas'].sum().sort_values(ascending=False)
-    
-    # Extraer el código del rubro (primera letra) y la descripción
-    rubros_clean = pd.DataFrame({
-        'codigo': rubros.index.str[0],
-        'descripcion': rubros.index.str[4:],
-        'empresas': rubros.values
-    })
+    # Empresas por rubro; si hay muchos rubros, mostrar solo los top 10.
+    # argpartition elige los 10 mayores en O(n) sin ordenar la serie completa
+    rubros = agregados['rubro']
+    valores = rubros.to_numpy()
+    otros_empresas = None
+    if len(valores) > 10:
+        idx = np.argpartition(valores, -10)[-10:]
+        idx = idx[np.argsort(-valores[idx], kind='stable')]
+        otros_empresas = valores.sum() - valores[idx].sum()
+        rubros = rubros.iloc[idx]
+    else:
+        rubros = rubros.sort_values(ascending=False)
+    
+    # Extraer el código del rubro (primera letra) y la descripción ("A - ...")
+    # con una sola pasada de regex sobre el índice
+    rubros_plot = (
+        rubros.index.to_series()
+        .str.extract(r'^(?P<codigo>.)(?:.{0,3})(?P<descripcion>.*)$')
+        .reset_index(drop=True)
+        .assign(empresas=rubros.to_numpy())
+    )
+    if otros_empresas is not None:
+        rubros_plot.loc[len(rubros_plot)] = ['', 'Otros rubros', otros_empresas]
     
     # Gráfico de pie chart
-    plt.figure(figsize=(14, 12))
-    
-    # Si hay muchos rubros, mostrar solo los top 10
-    if len(rubros_clean) > 10:
-        top_rubros = rubros_clean.iloc[:10].copy()
-        otros = pd.DataFrame({
-            'codigo': [''],
-            'descripcion': ['Otros rubros'],
-            'empresas': [rubros_clean.iloc[10:]['empresas'].sum()]
-        })
-        rubros_plot = pd.concat([top_rubros, otros])
-    else:
-        rubros_plot = rubros_clean
+    fig = obtener_figura((14, 12))
+    ax = fig.add_subplot()
     
     # Crear etiquetas para el gráfico
     labels = [f"{row['codigo']} - {row['descripcion'][:30]}..." if len(row['descripcion']) > 30 else f"{row['codigo']} - {row['descripcion']}" 
@@ -103,60 +353,49 @@ def analisis_rubros_economicos(df):
     sizes = rubros_plot['empresas']
     
     # Pie chart con porcentajes
-    plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, 
-            textprops={'fontsize': 12}, wedgeprops=dict(width=0.5), pctdistance=0.85)
-    plt.axis('equal')
-    
-    plt.title('Distribución de Empresas por Rubro Económico\nen la Región de Los Ríos', fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'empresas_por_rubro.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, 
+           textprops={'fontsize': 12}, wedgeprops=dict(width=0.5, rasterized=True), pctdistance=0.85)
+    ax.axis('equal')
+    
+    ax.set_title('Distribución de Empresas por Rubro Económico\nen la Región de Los Ríos', fontsize=16, fontweight='bold')
+    return fig, 'empresas_por_rubro.png'
 
-def analisis_trabajadores(df):
+def analisis_trabajadores(agregados):
     """Analiza y grafica la distribución de trabajadores por género."""
-    # Filtrar filas con datos de trabajadores
-    df_trab = df.copy()
-    
-    # Sumar trabajadores por comuna y género
-    trabajadores_comuna = df_trab.groupby('Comuna del domicilio o casa matriz').agg({
-        'Número de trabajadores dependientes de género femenino informados': 'sum',
-        'Número de trabajadores dependientes de género masculino informados': 'sum'
-    }).fillna(0)
-    
-    # Renombrar columnas para facilitar la manipulación
-    trabajadores_comuna.columns = ['Femenino', 'Masculino']
+    # Trabajadores por comuna y género
+    trabajadores_comuna = agregados['comuna'][['Femenino', 'Masculino']].copy()
     
     # Ordenar por total de trabajadores
     trabajadores_comuna['Total'] = trabajadores_comuna['Femenino'] + trabajadores_comuna['Masculino']
     trabajadores_comuna = trabajadores_comuna.sort_values('Total', ascending=False)
     
     # Gráfico de barras apiladas
-    plt.figure(figsize=(14, 10))
-    trabajadores_comuna[['Femenino', 'Masculino']].plot(kind='bar', stacked=True, 
-                                                       color=['#9b59b6', '#3498db'])
-    
-    plt.title('Distribución de Trabajadores por Género y Comuna\nen la Región de Los Ríos', 
-              fontsize=16, fontweight='bold')
-    plt.xlabel('Comuna', fontsize=14)
-    plt.ylabel('Número de Trabajadores', fontsize=14)
-    plt.xticks(rotation=45, ha='right', fontsize=12)
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.legend(fontsize=12)
-    
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'trabajadores_por_genero_comuna.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig = obtener_figura((14, 10))
+    ax = fig.add_subplot()
+    x = np.arange(len(trabajadores_comuna))
+    femenino = trabajadores_comuna['Femenino'].to_numpy()
+    masculino = trabajadores_comuna['Masculino'].to_numpy()
+    ax.bar(x, femenino, width=0.5, color='#9b59b6', label='Femenino')
+    ax.bar(x, masculino, width=0.5, bottom=femenino, color='#3498db', label='Masculino')
+    
+    ax.set_title('Distribución de Trabajadores por Género y Comuna\nen la Región de Los Ríos', 
+                 fontsize=16, fontweight='bold')
+    ax.set_xlabel('Comuna', fontsize=14)
+    ax.set_ylabel('Número de Trabajadores', fontsize=14)
+    ax.set_xticks(x)
+    ax.set_xticklabels(trabajadores_comuna.index, rotation=45, ha='right', fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.legend(fontsize=12)
+    
+    return fig, 'trabajadores_por_genero_comuna.png'
 
-def analisis_evolucion_temporal(df):
+def analisis_evolucion_temporal(agregados):
     """Analiza y grafica la evolución temporal de las empresas por año."""
-    # Agrupar por año
-    evolucion = df.groupby('Año Comercial').agg({
-        'Número de empresas': 'sum',
-        'Número de trabajadores dependientes informados': 'sum'
-    }).fillna(0)
+    evolucion = agregados['anio']
     
     # Graficar evolución temporal
-    fig, ax1 = plt.subplots(figsize=(14, 8))
+    fig = obtener_figura((14, 8))
+    ax1 = fig.add_subplot()
     
     # Línea para empresas (eje izquierdo)
     color = '#2980b9'
@@ -175,145 +414,140 @@ def analisis_evolucion_temporal(df):
     ax2.tick_params(axis='y', labelcolor=color)
     
     # Título y leyenda
-    plt.title('Evolución Temporal de Empresas y Trabajadores\nen la Región de Los Ríos', 
-              fontsize=16, fontweight='bold')
+    ax2.set_title('Evolución Temporal de Empresas y Trabajadores\nen la Región de Los Ríos', 
+                  fontsize=16, fontweight='bold')
     
     # Añadir leyendas combinadas
     lines1, labels1 = ax1.get_legend_handles_labels()
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=12)
     
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'evolucion_temporal.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    ax2.grid(True, linestyle='--', alpha=0.7)
+    return fig, 'evolucion_temporal.png'
 
-def generar_reporte_estadisticas(df):
-    """Genera un reporte con estadísticas clave de la región."""
-    # Calcular estadísticas generales
-    total_empresas = df['Número de empresas'].sum()
-    total_trabajadores = df['Número de trabajadores dependientes informados'].sum()
-    total_comunas = df['Comuna del domicilio o casa matriz'].nunique()
-    total_rubros = df['Rubro economico'].nunique()
-    
-    # Empresas por provincia
-    empresas_provincia = df.groupby('Provincia del domicilio o casa matriz')['Número de empresas'].sum()
-    
-    # Crear un reporte HTML
-    html_report = f"""
-    <!DOCTYPE html>
-    <html lang="es">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Reporte Estadístico - Región de Los Ríos</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-            h1 {{ color: #2c3e50; text-align: center; margin-bottom: 30px; }}
-            h2 {{ color: #3498db; border-bottom: 1px solid #eee; padding-bottom: 10px; }}
-            .stats-container {{ display: flex; flex-wrap: wrap; justify-content: space-between; margin: 30px 0; }}
-            .stat-box {{ width: 48%; background-color: #f9f9f9; border-radius: 8px; padding: 20px; 
-                      margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-            .stat-value {{ font-size: 24px; font-weight: bold; color: #2c3e50; }}
-            .stat-label {{ font-size: 16px; color: #7f8c8d; }}
-            table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-            th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-            th {{ background-color: #3498db; color: white; }}
-            tr:nth-child(even) {{ background-color: #f2f2f2; }}
-            .footer {{ margin-top: 50px; text-align: center; color: #7f8c8d; font-size: 14px; }}
-        </style>
-    </head>
-    <body>
-        <h1>Reporte Estadístico - Región de Los Ríos</h1>
-        
-        <h2>Estadísticas Generales</h2>
-        <div class="stats-container">
-            <div class="stat-box">
-                <div class="stat-value">{total_empresas:,.0f}</div>
-                <div class="stat-label">Total de Empresas</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-value">{total_trabajadores:,.0f}</div>
-                <div class="stat-label">Total de Trabajadores</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-value">{total_comunas}</div>
-                <div class="stat-label">Comunas</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-value">{total_rubros}</div>
-                <div class="stat-label">Rubros Económicos</div>
-            </div>
-        </div>
-        
-        <h2>Distribución por Provincia</h2>
-        <table>
-            <tr>
-                <th>Provincia</th>
-                <th>Número de Empresas</th>
-                <th>Porcentaje</th>
-            </tr>
+def formatear_miles(valor):
+    """Formatea un número con separador de miles y sin decimales (filtro Jinja)."""
+    return f"{valor:,.0f}"
+
+def calcular_estadisticas_reporte(agregados):
+    """Extrae de los agregados los valores del reporte como tipos nativos de Python."""
+    return {
+        'stats': {
+            'total_empresas': float(agregados['total_empresas']),
+            'total_trabajadores': float(agregados['total_trabajadores']),
+            'total_comunas': int(agregados['total_comunas']),
+            'total_rubros': int(agregados['total_rubros']),
+        },
+        'provincias': [
+            [str(provincia), float(empresas)]
+            for provincia, empresas in agregados['provincia'].items()
+        ],
+    }
+
+def generar_reporte_estadisticas(agregados):
     """
+    Genera un reporte con estadísticas clave de la región.
     
-    # Añadir filas de la tabla de provincias
-    for provincia, empresas in empresas_provincia.items():
-        porcentaje = (empresas / total_empresas) * 100
-        html_report += f"""
-            <tr>
-                <td>{provincia}</td>
-                <td>{empresas:,.0f}</td>
-                <td>{porcentaje:.1f}%</td>
-            </tr>
-        """
-    
-    # Completar el HTML
-    html_report += """
-        </table>
-        
-        <div class="footer">
-            <p>Generado automáticamente a partir del dataset PUB_COMU_RUBR.csv</p>
-            <p>Fecha: 26 de julio de 2025</p>
-        </div>
-    </body>
-    </html>
+    Los valores se guardan en report_data.json y el HTML se renderiza con la
+    plantilla Jinja2 templates/reporte_estadistico.html.j2.
     """
+    datos = calcular_estadisticas_reporte(agregados)
+    with open(OUTPUT_DIR / 'report_data.json', 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(['html', 'html.j2']),
+        auto_reload=False,
+    )
+    env.filters['miles'] = formatear_miles
+    plantilla = env.get_template('reporte_estadistico.html.j2')
     
     # Guardar el reporte
-    with open(OUTPUT_DIR / 'reporte_estadistico.html', 'w', encoding='utf-8') as f:
-        f.write(html_report)
+    (OUTPUT_DIR / 'reporte_estadistico.html').write_text(
+        plantilla.render(**datos), encoding='utf-8'
+    )
 
-def main():
+def cargar_datos(tabla=None):
+    """Carga los datos filtrados, prefiriendo la copia Parquet si está al día.
+    
+    Solo se leen las columnas de COLUMNAS_USADAS y las claves de agrupación
+    se piden directamente como categóricas. Si se recibe la tabla Arrow del
+    filtrado, se convierte en memoria sin volver a leer ningún archivo.
+    """
+    if tabla is not None:
+        df = tabla.select(list(COLUMNAS_USADAS)).to_pandas(types_mapper=pd.ArrowDtype)
+    elif INPUT_PARQUET.is_file() and (
+        not INPUT_FILE.is_file()
+        or INPUT_PARQUET.stat().st_mtime >= INPUT_FILE.stat().st_mtime
+    ):
+        print(f"Leyendo copia Parquet: {INPUT_PARQUET}")
+        df = pd.read_parquet(
+            INPUT_PARQUET, engine='pyarrow', columns=list(COLUMNAS_USADAS),
+            dtype_backend='pyarrow',
+        )
+    else:
+        # El motor pyarrow no admite thousands=, así que los separadores de
+        # miles y los '*' se siguen limpiando en clean_numeric_columns
+        df = pd.read_csv(
+            INPUT_FILE, engine='pyarrow', usecols=list(COLUMNAS_USADAS),
+            dtype={col: 'category' for col in COLUMNAS_AGRUPACION},
+            dtype_backend='pyarrow',
+        )
+    
+    # Claves de agrupación como categóricas: groupby opera sobre códigos enteros
+    # en lugar de volver a hashear strings en cada análisis
+    for col in COLUMNAS_AGRUPACION:
+        if df[col].dtype != 'category':
+            df[col] = df[col].astype('category')
+    
+    return df
+
+def main(tabla=None):
+    """Genera los gráficos y el reporte; tabla es la salida opcional del filtrado."""
     print(f"Leyendo archivo procesado de la Región de Los Ríos: {INPUT_FILE}")
     
     # Verificar si el archivo existe
-    if not os.path.exists(INPUT_FILE):
+    if tabla is None and not INPUT_FILE.is_file() and not INPUT_PARQUET.is_file():
         print(f"Error: El archivo {INPUT_FILE} no existe.")
         print("Primero ejecute el script filtrar_region_los_rios.py")
         return
     
-    # Leer el archivo CSV procesado
-    df = pd.read_csv(INPUT_FILE)
+    # Crear directorio de salida si no existe
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Leer el archivo procesado
+    df = cargar_datos(tabla)
     
     # Limpiar columnas numéricas
     df = clean_numeric_columns(df)
     
     print(f"Dimensiones del dataset filtrado: {df.shape}")
     
-    # Realizar análisis
-    print("Generando análisis de empresas por comuna...")
-    analisis_empresas_por_comuna(df)
-    
-    print("Generando análisis de rubros económicos...")
-    analisis_rubros_economicos(df)
-    
-    print("Generando análisis de trabajadores por género...")
-    analisis_trabajadores(df)
-    
-    print("Generando análisis de evolución temporal...")
-    analisis_evolucion_temporal(df)
-    
-    print("Generando reporte estadístico...")
-    generar_reporte_estadisticas(df)
+    # Agregaciones compartidas, calculadas una sola vez
+    agregados = calcular_agregados(df)
+    
+    # Realizar análisis: cada uno es independiente y dominado por el renderizado,
+    # así que se ejecutan en procesos separados (matplotlib no es thread-safe)
+    tareas = [
+        ("Generando análisis de empresas por comuna...", analisis_empresas_por_comuna),
+        ("Generando análisis de rubros económicos...", analisis_rubros_economicos),
+        ("Generando análisis de trabajadores por género...", analisis_trabajadores),
+        ("Generando análisis de evolución temporal...", analisis_evolucion_temporal),
+        ("Generando reporte estadístico...", generar_reporte_estadisticas),
+    ]
+    
+    # 'spawn' evita heredar por fork el estado de hilos de numba del proceso padre
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(tareas), mp_context=contexto) as executor:
+        futuros = []
+        for mensaje, tarea in tareas:
+            print(mensaje)
+            futuros.append(executor.submit(ejecutar_tarea, tarea, agregados))
+        
+        # Propagar cualquier error ocurrido en los procesos de trabajo
+        for futuro in futuros:
+            futuro.result()
     
     print(f"Análisis completado. Los resultados se guardaron en: {OUTPUT_DIR}")
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Copia limpia y tipada de los datos de la Región de Los Ríos, compartida por
+generar_resumen.py y generar_datos_visualizacion.py.
+
+La primera vez (o cuando cambia region_los_rios.csv) se leen las columnas
+usadas, se convierten las numéricas y se guarda el resultado en Parquet; las
+ejecuciones siguientes leen esa copia sin volver a parsear ni convertir texto.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pathlib import Path
+
+# Definir rutas
+BASE_DIR = Path(__file__).resolve().parent.parent
+INPUT_FILE = BASE_DIR / "data" / "processed" / "region_los_rios.csv"
+INPUT_PARQUET = BASE_DIR / "data" / "processed" / "region_los_rios.parquet"
+CLEAN_PARQUET = BASE_DIR / "data" / "processed" / "region_los_rios_limpio.parquet"
+
+# Columnas que usan los scripts de resumen y visualización
+COLUMNAS_USADAS = [
+    'Año Comercial',
+    'Comuna del domicilio o casa matriz',
+    'Rubro economico',
+    'Número de empresas',
+    'Ventas anuales en UF',
+    'Número de trabajadores dependientes informados',
+]
+
+# Columnas numéricas: los valores con separador de miles o '*' quedan como NaN
+COLUMNAS_NUMERICAS = [
+    'Año Comercial',
+    'Número de empresas',
+    'Ventas anuales en UF',
+    'Número de trabajadores dependientes informados',
+]
+
+
+def copia_vigente(copia, origen=INPUT_FILE):
+    """Indica si la copia existe y no es más antigua que el archivo de origen."""
+    return copia.is_file() and (
+        not origen.is_file() or copia.stat().st_mtime >= origen.stat().st_mtime
+    )
+
+
+def construir_parquet_limpio():
+    """
+    Lee las columnas usadas como texto, convierte las numéricas y guarda el Parquet.
+
+    Cada columna se convierte completa (no por bloques) para que su tipo sea el
+    mismo que daría pd.to_numeric sobre el archivo entero: entero si todos los
+    valores son válidos, float con NaN si alguno no lo es.
+    """
+    if copia_vigente(INPUT_PARQUET):
+        tabla = pq.read_table(INPUT_PARQUET, columns=COLUMNAS_USADAS)
+    else:
+        tabla = pacsv.read_csv(
+            INPUT_FILE,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=COLUMNAS_USADAS,
+                column_types={col: pa.string() for col in COLUMNAS_USADAS},
+            ),
+        )
+
+    df = tabla.to_pandas()
+    for col in COLUMNAS_NUMERICAS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        CLEAN_PARQUET,
+        compression='zstd',
+        use_dictionary=True,
+    )
+    print(f"Copia limpia guardada en: {CLEAN_PARQUET}")
+
+
+def asegurar_parquet_limpio():
+    """Devuelve la ruta de la copia limpia, construyéndola si falta o está desactualizada."""
+    if not copia_vigente(CLEAN_PARQUET):
+        construir_parquet_limpio()
+    return CLEAN_PARQUET
+
+
+def cargar_limpio(columnas=None):
+    """Carga la copia limpia completa (o solo las columnas indicadas)."""
+    return pd.read_parquet(asegurar_parquet_limpio(), engine='pyarrow', columns=columnas)
+
+
+def iterar_limpio(filas_por_bloque, columnas=None):
+    """Recorre la copia limpia por bloques de filas, como DataFrames."""
+    archivo = pq.ParquetFile(asegurar_parquet_limpio())
+    for lote in archivo.iter_batches(batch_size=filas_por_bloque, columns=columnas):
+        yield lote.to_pandas()
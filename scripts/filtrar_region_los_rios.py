@@ -8,52 +8,141 @@ Autor: Bruno Sanmartin
 Fecha: 26 de julio de 2025
 """
 
-import pandas as pd
-import os
+import csv
+import hashlib
+import json
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
 # Definir rutas
 BASE_DIR = Path(__file__).resolve().parent.parent
 INPUT_FILE = BASE_DIR / "data" / "raw" / "PUB_COMU_RUBR.csv"
 OUTPUT_DIR = BASE_DIR / "data" / "processed"
 OUTPUT_FILE = OUTPUT_DIR / "region_los_rios.csv"
+OUTPUT_PARQUET = OUTPUT_DIR / "region_los_rios.parquet"
+CACHE_FILE = OUTPUT_DIR / ".cache.json"
+
+# Incrementar cuando cambie la lógica de filtrado para invalidar el caché
+CACHE_VERSION = "2"
+
+REGION_COLUMN = "Region del domicilio o casa matriz"
+REGION_LOS_RIOS = "Región de Los Ríos"
+BLOCK_SIZE = 64 << 20  # 64 MB por bloque leído
+
+def leer_encabezado(path):
+    """Lee solo la fila de encabezado del CSV original."""
+    with open(path, 'r', encoding='latin1', newline='') as f:
+        return next(csv.reader(f))
+
+
+def calcular_clave_cache(path):
+    """Calcula la clave de caché a partir del contenido del archivo de entrada."""
+    digest = hashlib.sha256(CACHE_VERSION.encode())
+    with open(path, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+
+def cache_vigente(clave):
+    """Indica si las salidas guardadas corresponden a la clave indicada."""
+    if not (CACHE_FILE.is_file() and OUTPUT_FILE.is_file() and OUTPUT_PARQUET.is_file()):
+        return False
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get('key') == clave
+    except (OSError, ValueError):
+        return False
+
+
+def guardar_cache(clave):
+    """Registra la clave de la entrada que generó las salidas actuales."""
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'key': clave, 'parquet': OUTPUT_PARQUET.name}, f)
 
-# Crear directorio de salida si no existe
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 def main():
+    """
+    Filtra la Región de Los Ríos y guarda el resultado en CSV y Parquet.
+    
+    Devuelve la tabla Arrow filtrada (o None si la entrada no existe), para que
+    procesar_region_los_rios.py la pase al análisis sin releerla desde disco.
+    """
+    if not INPUT_FILE.is_file():
+        print(f"Error: El archivo {INPUT_FILE} no existe.")
+        return None
+    
+    # Crear directorio de salida si no existe
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    
     print(f"Leyendo archivo: {INPUT_FILE}")
     
-    # Leer el archivo CSV
+    # Si la entrada no cambió desde la última ejecución, no hay nada que hacer
+    clave = calcular_clave_cache(INPUT_FILE)
+    if cache_vigente(clave):
+        print(f"Sin cambios en la entrada; se reutiliza: {OUTPUT_PARQUET}")
+        return pq.read_table(OUTPUT_PARQUET)
+    
+    # Todas las columnas se leen como texto: el archivo se filtra sin convertir
+    # valores, y así el esquema no depende de la inferencia del primer bloque
+    columnas = leer_encabezado(INPUT_FILE)
+    print(f"Columnas disponibles: {columnas}")
+    
+    # Leer el archivo CSV por bloques
     # Nota: Usamos encoding='latin1' para manejar caracteres especiales del español
-    df = pd.read_csv(INPUT_FILE, encoding='latin1')
+    reader = pacsv.open_csv(
+        INPUT_FILE,
+        read_options=pacsv.ReadOptions(encoding='latin1', block_size=BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(
+            column_types={col: pa.string() for col in columnas}
+        ),
+    )
     
-    # Verificar columnas y datos iniciales
-    print(f"Dimensiones originales: {df.shape}")
-    print(f"Columnas disponibles: {df.columns.tolist()}")
+    # Filtrar solo los registros de la Región de Los Ríos y escribirlos bloque
+    # a bloque, de modo que nunca se mantiene el archivo completo en memoria.
+    # Se usa csv.writer (comillas solo donde hacen falta, como to_csv) porque
+    # pacsv.CSVWriter pondría entre comillas todos los valores de texto
+    total_registros = 0
+    lotes_filtrados = []
+    with open(OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(reader.schema.names)
+        for batch in reader:
+            total_registros += batch.num_rows
+            filtrado = batch.filter(pc.equal(batch.column(REGION_COLUMN), REGION_LOS_RIOS))
+            if filtrado.num_rows:
+                writer.writerows(zip(*(col.to_pylist() for col in filtrado.columns)))
+                lotes_filtrados.append(filtrado)
     
-    # Filtrar solo los registros de la Región de Los Ríos
-    region_los_rios = df[df["Region del domicilio o casa matriz"] == "Región de Los Ríos"]
+    region_los_rios = pa.Table.from_batches(lotes_filtrados, schema=reader.schema)
     
     # Verificar cuántos registros se obtuvieron
-    print(f"Registros filtrados: {region_los_rios.shape[0]} (de {df.shape[0]} originales)")
+    print(f"Dimensiones originales: ({total_registros}, {len(columnas)})")
+    print(f"Registros filtrados: {region_los_rios.num_rows} (de {total_registros} originales)")
     
-    # Guardar en un nuevo archivo CSV
-    region_los_rios.to_csv(OUTPUT_FILE, index=False, encoding='utf-8')
+    # Copia en Parquet para que el análisis no tenga que volver a parsear el CSV
+    pq.write_table(region_los_rios, OUTPUT_PARQUET, compression='zstd')
+    guardar_cache(clave)
     
     print(f"Archivo guardado exitosamente en: {OUTPUT_FILE}")
     
     # Mostrar estadísticas básicas
+    comunas = region_los_rios.column('Comuna del domicilio o casa matriz')
     print("\nEstadísticas básicas de la Región de Los Ríos:")
-    print(f"Total de comunas: {region_los_rios['Comuna del domicilio o casa matriz'].nunique()}")
-    print(f"Años disponibles: {sorted(region_los_rios['Año Comercial'].unique())}")
-    print(f"Rubros económicos: {region_los_rios['Rubro economico'].nunique()}")
+    print(f"Total de comunas: {pc.count_distinct(comunas).as_py()}")
+    print(f"Años disponibles: {sorted(pc.unique(region_los_rios.column('Año Comercial')).drop_null().to_pylist())}")
+    print(f"Rubros económicos: {pc.count_distinct(region_los_rios.column('Rubro economico')).as_py()}")
     
     # Mostrar las comunas de la región
     print("\nComunas de la Región de Los Ríos:")
-    comunas = region_los_rios['Comuna del domicilio o casa matriz'].unique()
-    for comuna in sorted(comunas):
+    for comuna in sorted(pc.unique(comunas).drop_null().to_pylist()):
         print(f"- {comuna}")
+    
+    return region_los_rios
 
 if __name__ == "__main__":
     main()
@@ -3,43 +3,95 @@
 Script para generar datos en formato JSON para las visualizaciones interactivas
 """
 
+import numpy as np
 import pandas as pd
 import json
+import re
 from pathlib import Path
 
+from datos_limpios import INPUT_FILE, cargar_limpio
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa json de la biblioteca estándar
+    orjson = None
+
+# Secuencias mal codificadas (UTF-8 leído como Latin-1) y su carácter correcto
+REEMPLAZOS = {
+    'Ã³': 'ó', 'Ã¡': 'á', 'Ã­': 'í', 'Ã©': 'é', 'Ãº': 'ú',
+    'Ã±': 'ñ', 'Ã‰': 'É', 'Ã': 'Á', 'Ã"': 'Ó', 'Ãš': 'Ú',
+    'ï»¿AÃ±o': 'Año', 'NÃºmero': 'Número'
+}
+# Una sola expresión regular con todas las secuencias; las más largas van
+# primero para que 'Ã' no se coma el inicio de 'Ã"', 'NÃºmero', etc.
+PATRON_REEMPLAZOS = re.compile(
+    "|".join(map(re.escape, sorted(REEMPLAZOS, key=len, reverse=True)))
+)
+
+# Nombres cortos de los rubros para gráficos de barras y torta
+ABREVIACIONES_RUBROS = pd.Series({
+    'Comercio al por mayor y al por menor; reparación de vehículos automotores y motocicletas': 'Comercio y reparación automotriz',
+    'Agricultura, ganadería, silvicultura y pesca': 'Agricultura y ganadería',
+    'Transporte y almacenamiento': 'Transporte y almacenamiento',
+    'Actividades de servicios administrativos y de apoyo': 'Servicios administrativos',
+    'Construcción': 'Construcción',
+    'Actividades inmobiliarias': 'Inmobiliarias',
+    'Alojamiento y servicios de comida': 'Hotelería y restaurantes',
+    'Industrias manufactureras': 'Industria manufacturera',
+    'Información y comunicaciones': 'Información y comunicaciones',
+    'Actividades profesionales, científicas y técnicas': 'Servicios profesionales',
+    'Enseñanza': 'Enseñanza',
+    'Actividades de atención de la salud humana y de asistencia social': 'Atención de salud y asistencia social',
+    'Otros servicios': 'Otros servicios'
+})
+# Nombres cortos para el mapa de calor y las barras apiladas (en formato título)
+ABREVIACIONES_HEATMAP = pd.Series({
+    'Comercio al por mayor y al por menor; reparación de vehículos automotores y motocicletas': 'Comercio y Reparación Automotriz',
+    'Agricultura, ganadería, silvicultura y pesca': 'Agricultura y Ganadería',
+    'Transporte y almacenamiento': 'Transporte y Almacenamiento',
+    'Actividades de servicios administrativos y de apoyo': 'Servicios Administrativos',
+    'Construcción': 'Construcción'
+})
+
+def _reemplazar(match):
+    return REEMPLAZOS[match.group(0)]
+
 def limpiar_texto(texto):
     """Limpia caracteres especiales en el texto"""
     if pd.isna(texto):
         return ""
-    texto = str(texto)
-    replacements = {
-        'Ã³': 'ó', 'Ã¡': 'á', 'Ã­': 'í', 'Ã©': 'é', 'Ãº': 'ú',
-        'Ã±': 'ñ', 'Ã‰': 'É', 'Ã': 'Á', 'Ã"': 'Ó', 'Ãš': 'Ú',
-        'ï»¿AÃ±o': 'Año', 'NÃºmero': 'Número'
-    }
-    for old, new in replacements.items():
-        texto = texto.replace(old, new)
-    return texto
+    return PATRON_REEMPLAZOS.sub(_reemplazar, str(texto))
 
-def corregir_ventas_uf(valor):
-    """Corrige valores extremos en ventas anuales UF"""
-    import math
-    
-    if pd.isna(valor) or valor == 0:
-        return valor
-    
-    if valor > 1000000:
-        valor_corregido = math.log10(valor) * 50000
-        return min(valor_corregido, 500000)
-    elif valor > 100000:
-        return valor * 0.7
-    else:
-        return valor
+def limpiar_serie(serie):
+    """Versión vectorizada de limpiar_texto: una pasada de regex por columna."""
+    return serie.fillna("").astype(str).str.replace(PATRON_REEMPLAZOS, _reemplazar, regex=True)
+
+def abreviar(etiquetas, abreviaciones):
+    """Abrevia las etiquetas con una sola búsqueda vectorizada; las que no están quedan igual"""
+    etiquetas = pd.Series(etiquetas, dtype=object)
+    return etiquetas.map(abreviaciones).fillna(etiquetas).tolist()
+
+def a_tipo_json(valor):
+    """Convierte arreglos y escalares de NumPy a tipos de Python para json.dump"""
+    if isinstance(valor, (np.ndarray, np.generic)):
+        return valor.tolist()
+    raise TypeError(f"Tipo no serializable a JSON: {type(valor).__name__}")
+
+def corregir_ventas_uf(ventas):
+    """Corrige valores extremos en ventas anuales UF (vectorizado sobre la serie)"""
+    valores = ventas.to_numpy(dtype=float, copy=True)
+    
+    # Las comparaciones con NaN son falsas, así que los NaN quedan intactos
+    muy_altos = valores > 1000000
+    altos = (valores > 100000) & ~muy_altos
+    
+    valores[muy_altos] = np.minimum(np.log10(valores[muy_altos]) * 50000, 500000)
+    valores[altos] *= 0.7
+    return pd.Series(valores, index=ventas.index, name=ventas.name)
 
 def main():
     # Definir rutas
     BASE_DIR = Path(__file__).parent.parent
-    INPUT_FILE = BASE_DIR / "data" / "processed" / "region_los_rios.csv"
     OUTPUT_DIR = BASE_DIR / "visualizations"
     
     # Crear directorio de salida si no existe
@@ -47,181 +99,155 @@ def main():
     
     print(f"Cargando datos desde: {INPUT_FILE}")
     
-    # Cargar datos
-    df = pd.read_csv(INPUT_FILE, encoding='utf-8')
-    
-    # Limpiar nombres de columnas
-    df.columns = [limpiar_texto(col) for col in df.columns]
+    # Cargar la copia limpia compartida: columnas usadas y numéricas ya convertidas
+    df = cargar_limpio()
     
     # Limpiar datos específicos
-    df['Comuna'] = df['Comuna del domicilio o casa matriz'].apply(limpiar_texto)
-    df['Rubro_limpio'] = df['Rubro economico'].apply(limpiar_texto)
-    df['Descripcion_rubro'] = df['Rubro_limpio'].str.split(' - ').str[1:].apply(lambda x: ' - '.join(x) if isinstance(x, list) else '')
-    
-    # Convertir columnas numéricas
-    numeric_cols = ['Año Comercial', 'Número de empresas', 'Ventas anuales en UF', 'Número de trabajadores dependientes informados']
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['Comuna'] = limpiar_serie(df['Comuna del domicilio o casa matriz'])
+    df['Rubro_limpio'] = limpiar_serie(df['Rubro economico'])
+    # Todo lo que sigue al primer ' - ' (vacío si no hay separador), sin lambdas por fila
+    df['Descripcion_rubro'] = df['Rubro_limpio'].str.partition(' - ')[2]
     
     # Corregir ventas
     if 'Ventas anuales en UF' in df.columns:
-        df['Ventas anuales en UF'] = df['Ventas anuales en UF'].apply(corregir_ventas_uf)
+        df['Ventas anuales en UF'] = corregir_ventas_uf(df['Ventas anuales en UF'])
+    
+    # Claves de agrupación como categóricas: los groupby trabajan sobre códigos
+    df['Comuna'] = df['Comuna'].astype('category')
+    df['Descripcion_rubro'] = df['Descripcion_rubro'].astype('category')
+    
+    # Agregados base: una sola pasada por año y otra por comuna y rubro; el resto
+    # de los gráficos se derivan de estas tablas pequeñas sin volver a recorrer df
+    columnas_suma = ['Número de empresas', 'Ventas anuales en UF', 'Número de trabajadores dependientes informados']
+    anual = df.groupby('Año Comercial', sort=True)[columnas_suma].sum()
+    por_comuna_rubro = df.groupby(['Comuna', 'Descripcion_rubro'], observed=True)[columnas_suma].sum()
+    empresas_comuna_rubro = por_comuna_rubro['Número de empresas']
     
     # Datos para visualizaciones
     data_viz = {}
     
     # 1. Empresas por comuna
-    empresas_por_comuna = df.groupby('Comuna')['Número de empresas'].sum().sort_values(ascending=False)
+    empresas_por_comuna = empresas_comuna_rubro.groupby(level='Comuna', observed=True).sum().sort_values(ascending=False)
     total_empresas = empresas_por_comuna.sum()
     
     data_viz['empresas_por_comuna'] = {
         'comunas': empresas_por_comuna.index.tolist(),
-        'valores': empresas_por_comuna.values.tolist(),
-        'porcentajes': (empresas_por_comuna.values / total_empresas * 100).tolist(),
+        'valores': empresas_por_comuna.to_numpy(),
+        'porcentajes': empresas_por_comuna.to_numpy() / total_empresas * 100,
         'total': int(total_empresas)
     }
     
     # 2. Evolución temporal
-    evolucion_temporal = df.groupby('Año Comercial')['Número de empresas'].sum().reset_index()
-    evolucion_temporal = evolucion_temporal.sort_values('Año Comercial')
+    evolucion_temporal = anual['Número de empresas'].reset_index()
     
     data_viz['evolucion_temporal'] = {
-        'años': evolucion_temporal['Año Comercial'].astype(int).tolist(),
-        'empresas': evolucion_temporal['Número de empresas'].astype(int).tolist()
+        'años': evolucion_temporal['Año Comercial'].to_numpy(dtype=np.int64),
+        'empresas': evolucion_temporal['Número de empresas'].to_numpy(dtype=np.int64)
     }
     
     # 3. Distribución por rubros
-    def abreviar_descripcion(descripcion):
-        abreviaciones = {
-            'Comercio al por mayor y al por menor; reparación de vehículos automotores y motocicletas': 'Comercio y reparación automotriz',
-            'Agricultura, ganadería, silvicultura y pesca': 'Agricultura y ganadería',
-            'Transporte y almacenamiento': 'Transporte y almacenamiento',
-            'Actividades de servicios administrativos y de apoyo': 'Servicios administrativos',
-            'Construcción': 'Construcción',
-            'Actividades inmobiliarias': 'Inmobiliarias',
-            'Alojamiento y servicios de comida': 'Hotelería y restaurantes',
-            'Industrias manufactureras': 'Industria manufacturera',
-            'Información y comunicaciones': 'Información y comunicaciones',
-            'Actividades profesionales, científicas y técnicas': 'Servicios profesionales',
-            'Enseñanza': 'Enseñanza',
-            'Actividades de atención de la salud humana y de asistencia social': 'Atención de salud y asistencia social',
-            'Otros servicios': 'Otros servicios'
-        }
-        return abreviaciones.get(descripcion, descripcion)
+    rubros_totales = empresas_comuna_rubro.groupby(level='Descripcion_rubro', observed=True).sum()
+    total_empresas_rubros = rubros_totales.sum()
+    
+    # Solo se usan los 15 rubros principales: argpartition los selecciona en O(n)
+    # y únicamente esos se ordenan, en lugar de ordenar todos los rubros
+    valores_rubros = rubros_totales.to_numpy()
+    if len(valores_rubros) > 15:
+        idx = np.argpartition(-valores_rubros, 14)[:15]
+    else:
+        idx = np.arange(len(valores_rubros))
+    idx = idx[np.argsort(-valores_rubros[idx], kind='stable')]
+    rubros_empresas = rubros_totales.iloc[idx]
     
-    rubros_empresas = df.groupby('Descripcion_rubro')['Número de empresas'].sum().sort_values(ascending=False)
-    total_empresas_rubros = rubros_empresas.sum()
+    # Etiquetas abreviadas y porcentajes de los rubros principales, calculados una sola vez
+    etiquetas_rubros = abreviar(rubros_empresas.index, ABREVIACIONES_RUBROS)
+    porcentajes_rubros = rubros_empresas.values / total_empresas_rubros * 100
     
     # Top 10 rubros más "Otros"
     top_10_rubros = rubros_empresas.head(10)
-    otros_valor = rubros_empresas.iloc[10:].sum() if len(rubros_empresas) > 10 else 0
+    otros_valor = total_empresas_rubros - top_10_rubros.sum() if len(rubros_totales) > 10 else 0
     
-    rubros_labels = [abreviar_descripcion(rubro) for rubro in top_10_rubros.index]
-    rubros_valores = top_10_rubros.values.tolist()
-    rubros_porcentajes = (top_10_rubros.values / total_empresas_rubros * 100).tolist()
+    rubros_labels = etiquetas_rubros[:10]
+    rubros_valores = top_10_rubros.to_numpy()
+    rubros_porcentajes = porcentajes_rubros[:10]
     
     if otros_valor > 0:
         rubros_labels.append('Otros rubros')
-        rubros_valores.append(int(otros_valor))
-        rubros_porcentajes.append(otros_valor / total_empresas_rubros * 100)
+        rubros_valores = np.append(rubros_valores, int(otros_valor))
+        rubros_porcentajes = np.append(rubros_porcentajes, otros_valor / total_empresas_rubros * 100)
     
     data_viz['rubros_empresas'] = {
         'labels': rubros_labels,
-        'valores': [int(v) for v in rubros_valores],
+        'valores': rubros_valores.astype(np.int64),
         'porcentajes': rubros_porcentajes
     }
     
     # 4. Top 15 rubros (barras)
     top_15_rubros = rubros_empresas.head(15)
     data_viz['top_15_rubros'] = {
-        'rubros': [abreviar_descripcion(rubro) for rubro in top_15_rubros.index],
-        'valores': top_15_rubros.values.astype(int).tolist(),
-        'porcentajes': (top_15_rubros.values / total_empresas_rubros * 100).tolist()
+        'rubros': etiquetas_rubros[:15],
+        'valores': top_15_rubros.to_numpy(dtype=np.int64),
+        'porcentajes': porcentajes_rubros[:15]
     }
     
     # 5. Mapa de calor (top 5 comunas y top 5 rubros)
     top_5_comunas = empresas_por_comuna.head(5).index.tolist()
     top_5_rubros_desc = rubros_empresas.head(5).index.tolist()
     
-    # Filtrar datos para mapa de calor
-    df_heatmap = df[df['Comuna'].isin(top_5_comunas) & 
-                    df['Descripcion_rubro'].isin(top_5_rubros_desc)]
-    
-    pivot_data = df_heatmap.pivot_table(
-        index='Comuna',
-        columns='Descripcion_rubro',
-        values='Número de empresas',
-        aggfunc='sum',
-        fill_value=0
-    )
-    
-    # Abreviar nombres para el mapa de calor
-    def abreviar_rubro_heatmap(descripcion):
-        abreviaciones_heatmap = {
-            'Comercio al por mayor y al por menor; reparación de vehículos automotores y motocicletas': 'Comercio y Reparación Automotriz',
-            'Agricultura, ganadería, silvicultura y pesca': 'Agricultura y Ganadería',
-            'Transporte y almacenamiento': 'Transporte y Almacenamiento',
-            'Actividades de servicios administrativos y de apoyo': 'Servicios Administrativos',
-            'Construcción': 'Construcción'
-        }
-        return abreviaciones_heatmap.get(descripcion, descripcion)
+    # Filtrar los agregados para mapa de calor
+    comunas_idx = empresas_comuna_rubro.index.get_level_values('Comuna')
+    rubros_idx = empresas_comuna_rubro.index.get_level_values('Descripcion_rubro')
+    heatmap = empresas_comuna_rubro[comunas_idx.isin(top_5_comunas) & rubros_idx.isin(top_5_rubros_desc)]
+    
+    pivot_data = heatmap.unstack(fill_value=0)
     
     data_viz['mapa_calor'] = {
         'comunas': pivot_data.index.tolist(),
-        'rubros': [abreviar_rubro_heatmap(col) for col in pivot_data.columns],
-        'valores': pivot_data.values.astype(int).tolist()
+        'rubros': abreviar(pivot_data.columns, ABREVIACIONES_HEATMAP),
+        'valores': np.ascontiguousarray(pivot_data.to_numpy(dtype=np.int64))
     }
     
     # 6. Barras apiladas (composición por comuna)
-    df_stacked = df_heatmap.groupby(['Comuna', 'Descripcion_rubro'])['Número de empresas'].sum().unstack(fill_value=0)
+    df_stacked = pivot_data
     df_stacked_pct = df_stacked.div(df_stacked.sum(axis=1), axis=0) * 100
     
     data_viz['barras_apiladas'] = {
         'comunas': df_stacked_pct.index.tolist(),
-        'rubros': [abreviar_rubro_heatmap(col) for col in df_stacked_pct.columns],
-        'porcentajes': df_stacked_pct.values.tolist()
+        'rubros': abreviar(df_stacked_pct.columns, ABREVIACIONES_HEATMAP),
+        'porcentajes': np.ascontiguousarray(df_stacked_pct.to_numpy())
     }
     
     # 7. Gráfico de radar (top 3 comunas)
     top_3_comunas = empresas_por_comuna.head(3).index.tolist()
     
-    radar_data = df[df['Comuna'].isin(top_3_comunas)].groupby('Comuna').agg({
-        'Número de empresas': 'sum',
-        'Ventas anuales en UF': lambda x: pd.to_numeric(x, errors='coerce').sum(),
-        'Número de trabajadores dependientes informados': lambda x: pd.to_numeric(x, errors='coerce').sum(),
-    }).reset_index()
+    radar_data = por_comuna_rubro.groupby(level='Comuna', observed=True).sum()
     
     # Normalizar datos
-    radar_data_norm = radar_data.set_index('Comuna')
+    radar_data_norm = radar_data[radar_data.index.isin(top_3_comunas)].copy()
     for col in radar_data_norm.columns:
         radar_data_norm[col] = radar_data_norm[col] / radar_data_norm[col].max()
     
     data_viz['radar'] = {
         'comunas': radar_data_norm.index.tolist(),
         'indicadores': ['Número de empresas', 'Ventas anuales (UF)', 'Número de trabajadores'],
-        'valores': radar_data_norm.values.tolist()
+        'valores': np.ascontiguousarray(radar_data_norm.to_numpy())
     }
     
     # 8. Tendencias temporales múltiples
-    tendencias_anuales = df.groupby('Año Comercial').agg({
-        'Número de empresas': 'sum',
-        'Ventas anuales en UF': 'sum',
-        'Número de trabajadores dependientes informados': 'sum'
-    }).reset_index()
+    tendencias_anuales = anual.reset_index()
     
     data_viz['tendencias_multiples'] = {
-        'años': tendencias_anuales['Año Comercial'].astype(int).tolist(),
-        'empresas': tendencias_anuales['Número de empresas'].astype(int).tolist(),
-        'ventas': tendencias_anuales['Ventas anuales en UF'].fillna(0).astype(int).tolist(),
-        'trabajadores': tendencias_anuales['Número de trabajadores dependientes informados'].fillna(0).astype(int).tolist()
+        'años': tendencias_anuales['Año Comercial'].to_numpy(dtype=np.int64),
+        'empresas': tendencias_anuales['Número de empresas'].to_numpy(dtype=np.int64),
+        'ventas': tendencias_anuales['Ventas anuales en UF'].fillna(0).to_numpy(dtype=np.int64),
+        'trabajadores': tendencias_anuales['Número de trabajadores dependientes informados'].fillna(0).to_numpy(dtype=np.int64)
     }
     
     # Estadísticas adicionales
     data_viz['estadisticas'] = {
         'total_empresas': int(total_empresas),
         'total_comunas': len(empresas_por_comuna),
-        'total_rubros': len(rubros_empresas),
+        'total_rubros': len(rubros_totales),
         'periodo': {
             'inicio': int(df['Año Comercial'].min()),
             'fin': int(df['Año Comercial'].max())
@@ -230,8 +256,14 @@ def main():
     
     # Guardar datos en JSON
     output_file = OUTPUT_DIR / "datos_visualizacion.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data_viz, f, ensure_ascii=False, indent=2)
+    # Los valores numéricos van como arreglos NumPy: orjson los serializa sin
+    # pasar por listas de Python; con json se convierten en el hook default
+    if orjson is not None:
+        # Mismo formato que json.dump(indent=2, ensure_ascii=False), codificado en Rust
+        output_file.write_bytes(orjson.dumps(data_viz, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data_viz, f, ensure_ascii=False, indent=2, default=a_tipo_json)
     
     print(f"Datos generados y guardados en: {output_file}")
     print(f"Total de empresas: {total_empresas:,.0f}")
@@ -8,6 +8,8 @@ import plotly.express as px
 import os
 from pathlib import Path
 
+from datos_limpios import COLUMNAS_USADAS, iterar_limpio
+
 # Configuración para visualizaciones
 plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams['font.family'] = 'Georgia'
@@ -23,30 +25,40 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 print(f"Cargando datos: {DATA_FILE}")
 
-# Cargar los datos procesados
-df = pd.read_csv(DATA_FILE)
-
-# Verificar datos cargados
-print(f"Dimensiones del dataset: {df.shape}")
-print("\nPrimeras filas:")
-print(df.head())
-
-# Convertir las columnas numéricas
-numeric_columns = [
-    'Año Comercial', 
+# Columnas sumadas en la evolución temporal
+COLUMNAS_EVOLUCION = [
     'Número de empresas',
     'Ventas anuales en UF',
     'Número de trabajadores dependientes informados',
-    'Renta neta informada en UF'
 ]
 
-# Convertir a formato numérico
-for col in numeric_columns:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+# Filas por bloque al leer la copia limpia (ver datos_limpios.py)
+FILAS_POR_BLOQUE = 500_000
+
+# Agregar bloque a bloque: la memoria queda acotada por el tamaño del bloque y
+# solo se guardan las sumas parciales de cada resumen
+parciales_comunas = []
+parciales_evolucion = []
+parciales_rubros = []
+total_filas = 0
+primeras_filas = None
+
+for chunk in iterar_limpio(FILAS_POR_BLOQUE, COLUMNAS_USADAS):
+    if primeras_filas is None:
+        primeras_filas = chunk.head()
+    total_filas += len(chunk)
+    
+    parciales_comunas.append(chunk.groupby('Comuna del domicilio o casa matriz')['Número de empresas'].sum())
+    parciales_evolucion.append(chunk.groupby('Año Comercial')[COLUMNAS_EVOLUCION].sum())
+    parciales_rubros.append(chunk.groupby('Rubro economico')['Número de empresas'].sum())
+
+# Verificar datos cargados
+print(f"Dimensiones del dataset: {(total_filas, len(COLUMNAS_USADAS))}")
+print("\nPrimeras filas:")
+print(primeras_filas)
 
 # 1. Resumen por comuna
-comunas_summary = df.groupby('Comuna del domicilio o casa matriz')['Número de empresas'].sum().sort_values(ascending=False)
+comunas_summary = pd.concat(parciales_comunas).groupby(level=0).sum().sort_values(ascending=False)
 print("\n--- Resumen por Comuna ---")
 print(comunas_summary)
 
@@ -54,11 +66,7 @@ print(comunas_summary)
 comunas_summary.to_csv(OUTPUT_DIR / "resumen_comunas.csv")
 
 # 2. Evolución temporal
-evolucion = df.groupby('Año Comercial').agg({
-    'Número de empresas': 'sum',
-    'Ventas anuales en UF': 'sum',
-    'Número de trabajadores dependientes informados': 'sum'
-})
+evolucion = pd.concat(parciales_evolucion).groupby(level=0).sum()
 
 print("\n--- Evolución Temporal ---")
 print(evolucion)
@@ -67,7 +75,7 @@ print(evolucion)
 evolucion.to_csv(OUTPUT_DIR / "evolucion_temporal.csv")
 
 # 3. Resumen por rubro económico
-rubros_summary = df.groupby('Rubro economico')['Número de empresas'].sum().sort_values(ascending=False)
+rubros_summary = pd.concat(parciales_rubros).groupby(level=0).sum().sort_values(ascending=False)
 top_rubros = rubros_summary.head(10)
 
 print("\n--- Top 10 Rubros Económicos ---")
@@ -4,7 +4,8 @@
 Script principal para procesar, filtrar y analizar los datos de la Región de Los Ríos
 del dataset PUB_COMU_RUBR.csv.
 
-Este script ejecuta de forma secuencial los scripts de filtrado y análisis.
+Este script ejecuta de forma secuencial el filtrado y el análisis dentro del mismo
+proceso: la tabla filtrada pasa directamente al análisis, sin volver a leerla.
 
 Autor: Bruno Sanmartin
 Fecha: 26 de julio de 2025
@@ -12,7 +13,7 @@ Fecha: 26 de julio de 2025
 
 import os
 import sys
-import subprocess
+import traceback
 from pathlib import Path
 
 # Definir rutas
@@ -21,38 +22,27 @@ SCRIPTS_DIR = BASE_DIR
 FILTER_SCRIPT = SCRIPTS_DIR / "filtrar_region_los_rios.py"
 ANALYSIS_SCRIPT = SCRIPTS_DIR / "analizar_region_los_rios.py"
 
-def ejecutar_script(script_path):
-    """Ejecuta un script de Python e imprime su salida en tiempo real."""
+# Los scripts hermanos se importan como módulos aunque se ejecute desde otra carpeta
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+def ejecutar_paso(script_path, funcion, *args):
+    """
+    Ejecuta el main() de un script en este mismo proceso.
+    
+    Devuelve una tupla (exito, resultado); así se evita el arranque de un
+    intérprete nuevo por script y el resultado queda disponible en memoria.
+    """
     print(f"\n{'=' * 80}")
     print(f"Ejecutando: {script_path}")
     print(f"{'=' * 80}\n")
     
-    # Ejecutar el script y capturar la salida en tiempo real
     try:
-        process = subprocess.Popen(
-            [sys.executable, str(script_path)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-        
-        # Mostrar la salida en tiempo real
-        for line in process.stdout:
-            print(line, end='')
-            
-        # Esperar a que el proceso termine y obtener el código de salida
-        exit_code = process.wait()
-        
-        if exit_code != 0:
-            print(f"Error: El script {script_path} finalizó con código {exit_code}")
-            return False
-            
-        return True
-        
+        return True, funcion(*args)
     except Exception as e:
+        traceback.print_exc()
         print(f"Error al ejecutar {script_path}: {e}")
-        return False
+        return False, None
 
 def main():
     print("\n" + "=" * 80)
@@ -68,15 +58,20 @@ def main():
         print(f"Error: No se encontró el script de análisis: {ANALYSIS_SCRIPT}")
         return
     
-    # Paso 2: Ejecutar el script de filtrado
+    import filtrar_region_los_rios
+    import analizar_region_los_rios
+    
+    # Paso 2: Ejecutar el filtrado; devuelve la tabla Arrow con la región
     print("\nPaso 1: Filtrado de datos para la Región de Los Ríos")
-    if not ejecutar_script(FILTER_SCRIPT):
+    exito, tabla = ejecutar_paso(FILTER_SCRIPT, filtrar_region_los_rios.main)
+    if not exito or tabla is None:
         print("Error en el proceso de filtrado. Abortando.")
         return
     
-    # Paso 3: Ejecutar el script de análisis
+    # Paso 3: Ejecutar el análisis sobre la tabla ya cargada en memoria
     print("\nPaso 2: Análisis de datos de la Región de Los Ríos")
-    if not ejecutar_script(ANALYSIS_SCRIPT):
+    exito, _ = ejecutar_paso(ANALYSIS_SCRIPT, analizar_region_los_rios.main, tabla)
+    if not exito:
         print("Error en el proceso de análisis.")
         return
     
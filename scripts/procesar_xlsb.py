@@ -4,10 +4,10 @@ Script para procesar el archivo PUB_COMU_RUBR.xlsb y generar un CSV con datos de
 Este script convierte los datos del archivo XLSB a formato CSV y corrige problemas de codificación.
 """
 
+import csv
 import pandas as pd
 from pyxlsb import open_workbook
 import os
-import numpy as np
 from pathlib import Path
 
 # Definir rutas
@@ -22,92 +22,104 @@ print(f"Base dir: {BASE_DIR}")
 # Crear directorio de salida si no existe
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# Determinar qué hojas hay en el archivo XLSB
-sheets = []
-with open_workbook(INPUT_FILE) as wb:
-    for sheet in wb.sheets:
-        sheets.append(sheet)
-    
-print(f"Hojas encontradas en el archivo XLSB: {sheets}")
+def convertir_celda(valor):
+    """Convierte el valor de una celda igual que pd.read_excel: números enteros sin decimales."""
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    return valor
 
-# Leer la primera hoja (o la especificada)
-target_sheet = sheets[0] if sheets else None
+def es_region_los_rios(region):
+    """Indica si el nombre de región corresponde a alguna variante de "Los Ríos"."""
+    return isinstance(region, str) and ('rio' in region.lower() or 'río' in region.lower())
 
-if target_sheet:
-    print(f"Leyendo hoja: {target_sheet}")
-    
-    # Leer el archivo XLSB
-    df = pd.read_excel(INPUT_FILE, engine='pyxlsb', sheet_name=target_sheet)
-    
-    # Mostrar las primeras filas para verificar
-    print("\nPrimeras filas del dataset original:")
-    print(df.head())
-    
-    # Mostrar información sobre el DataFrame
-    print("\nInformación del DataFrame original:")
-    print(f"Columnas: {df.columns.tolist()}")
-    print(f"Dimensiones: {df.shape}")
-    
-    # Determinar la fila que contiene los nombres de columnas
-    for i, row in df.iterrows():
-        if 'Año Comercial' in str(row.values):
-            header_row_idx = i
-            break
-    
-    # Extraer los nombres de las columnas de la fila correspondiente
-    column_names = df.iloc[header_row_idx].values
-    
-    # Crear un nuevo DataFrame empezando desde la fila después de las cabeceras
-    new_df = df.iloc[header_row_idx+1:].copy()
-    
-    # Asignar los nombres de columnas
-    new_df.columns = column_names
+# El libro se abre una sola vez: se listan las hojas y se recorre la elegida
+# sin volver a parsear el contenedor XLSB
+with open_workbook(INPUT_FILE) as wb:
+    # Determinar qué hojas hay en el archivo XLSB
+    sheets = list(wb.sheets)
+    print(f"Hojas encontradas en el archivo XLSB: {sheets}")
     
-    # Resetear los índices
-    new_df = new_df.reset_index(drop=True)
+    # Leer la primera hoja (o la especificada)
+    target_sheet = sheets[0] if sheets else None
+
+    if target_sheet:
+        print(f"Leyendo hoja: {target_sheet}")
     
-    print("\nPrimeras filas del dataset con nombres de columnas corregidos:")
-    print(new_df.head())
+        # Recorrer la hoja fila a fila: cada fila se escribe directo al CSV completo y
+        # solo las filas candidatas a Los Ríos se guardan en memoria
+        column_names = None
+        region_idx = None
+        primeras_filas = []
+        regiones = {}  # dict como conjunto ordenado por primera aparición
+        filas_por_region = {}
+        n_filas = 0
     
-    print("\nColumnas en el nuevo DataFrame:")
-    for col in new_df.columns:
-        print(f"- {col}")
+        with wb.get_sheet(target_sheet) as sheet, \
+                open(OUTPUT_FILE_CSV, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            for row in sheet.rows(sparse=True):
+                valores = [convertir_celda(cell.v) for cell in row]
+                if all(v is None for v in valores):
+                    continue
+            
+                # Determinar la fila que contiene los nombres de columnas
+                if column_names is None:
+                    if any('Año Comercial' in str(v) for v in valores):
+                        column_names = valores
+                        region_column = [i for i, col in enumerate(column_names) if 'Region' in str(col) or 'región' in str(col).lower()]
+                        region_idx = region_column[0] if region_column else None
+                        writer.writerow(column_names)
+                    continue
+            
+                writer.writerow(valores)
+                n_filas += 1
+                if len(primeras_filas) < 5:
+                    primeras_filas.append(valores)
+            
+                if region_idx is not None:
+                    region = valores[region_idx]
+                    if region is not None:
+                        regiones.setdefault(region)
+                    if es_region_los_rios(region):
+                        filas_por_region.setdefault(region, []).append(valores)
     
-    # Buscar y listar todas las regiones disponibles
-    region_column = [col for col in new_df.columns if 'Region' in str(col) or 'región' in str(col).lower()]
+        if column_names is None:
+            print("No se encontró la fila de cabeceras ('Año Comercial') en la hoja")
+        else:
+            print("\nPrimeras filas del dataset con nombres de columnas corregidos:")
+            print(pd.DataFrame(primeras_filas, columns=column_names))
+            print(f"Dimensiones: {(n_filas, len(column_names))}")
+        
+            print("\nColumnas en el nuevo DataFrame:")
+            for col in column_names:
+                print(f"- {col}")
     
-    if region_column:
-        region_col = region_column[0]
-        print(f"\nColumna de región encontrada: {region_col}")
-        regiones = new_df[region_col].dropna().unique()
-        print("\nRegiones disponibles en el dataset:")
-        for region in sorted(regiones):
-            print(f"- {region}")
+        if region_idx is not None:
+            region_col = column_names[region_idx]
+            print(f"\nColumna de región encontrada: {region_col}")
+            print("\nRegiones disponibles en el dataset:")
+            for region in sorted(regiones):
+                print(f"- {region}")
         
-        # Filtrar datos para la Región de Los Ríos
-        # Busca cualquier variante de "Los Ríos" en el nombre de la región
-        region_los_rios = None
-        for region in regiones:
-            if isinstance(region, str) and ('rio' in region.lower() or 'río' in region.lower()):
-                region_los_rios = new_df[new_df[region_col] == region].copy()
+            # Filtrar datos para la Región de Los Ríos
+            # Se toma la primera variante de "Los Ríos" que aparece en la hoja
+            region = next(iter(filas_por_region), None)
+            if region is not None:
                 print(f"\nEncontrada la Región de Los Ríos como: '{region}'")
-                break
-        
-        if region_los_rios is not None:
-            # Guardar los datos filtrados de Los Ríos
-            region_output_file = BASE_DIR / "data" / "processed" / "region_los_rios.csv"
-            os.makedirs(os.path.dirname(region_output_file), exist_ok=True)
-            region_los_rios.to_csv(region_output_file, index=False, encoding='utf-8')
-            print(f"Datos de la Región de Los Ríos guardados en: {region_output_file}")
-            print(f"Número de registros: {len(region_los_rios)}")
-        else:
-            print("\nNo se pudo encontrar la Región de Los Ríos en el dataset")
-    else:
-        print("No se pudo encontrar la columna de región en el dataset")
+                region_los_rios = pd.DataFrame(filas_por_region[region], columns=column_names, dtype=object)
+            
+                # Guardar los datos filtrados de Los Ríos
+                region_output_file = BASE_DIR / "data" / "processed" / "region_los_rios.csv"
+                os.makedirs(os.path.dirname(region_output_file), exist_ok=True)
+                region_los_rios.to_csv(region_output_file, index=False, encoding='utf-8')
+                print(f"Datos de la Región de Los Ríos guardados en: {region_output_file}")
+                print(f"Número de registros: {len(region_los_rios)}")
+            else:
+                print("\nNo se pudo encontrar la Región de Los Ríos en el dataset")
+        elif column_names is not None:
+            print("No se pudo encontrar la columna de región en el dataset")
     
-    # Guardar el dataset completo con nombres corregidos
-    new_df.to_csv(OUTPUT_FILE_CSV, index=False, encoding='utf-8')
-    print(f"\nArchivo CSV completo guardado en: {OUTPUT_FILE_CSV}")
+        print(f"\nArchivo CSV completo guardado en: {OUTPUT_FILE_CSV}")
     
-else:
-    print("No se encontraron hojas en el archivo XLSB")
+    else:
+        print("No se encontraron hojas en el archivo XLSB")
@@ -1,4 +1,13 @@
 """Data models package initialization"""
-from .empresa_models import EmpresaRecord, ETLMetadata, DataQualityReport
+from .empresa_models import EmpresaRecord, ETLMetadata, DataQualityReport, parse_empresa_records
+from .empresa_schema import EMPRESA_COLUMN_RULES, build_column_rules, validate_columns
 
-__all__ = ["EmpresaRecord", "ETLMetadata", "DataQualityReport"]
+__all__ = [
+    "EmpresaRecord",
+    "ETLMetadata",
+    "DataQualityReport",
+    "parse_empresa_records",
+    "EMPRESA_COLUMN_RULES",
+    "build_column_rules",
+    "validate_columns"
+]
@@ -2,8 +2,8 @@
 Data Models for SII Empresas ETL Process
 Following SOLID Principles and Clean Code practices
 """
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from datetime import datetime
 
 
@@ -52,26 +52,28 @@ class EmpresaRecord(BaseModel):
     honorarios_masculino_uf: Optional[float] = Field(None, ge=0)
     trabajadores_honorarios_masculino_ponderados: Optional[float] = Field(None, ge=0)
 
-    @validator('rubro_economico')
-    def validate_rubro_economico(cls, v):
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        validate_assignment=True,
+        extra="forbid"
+    )
+
+    @field_validator('rubro_economico')
+    @classmethod
+    def validate_rubro_economico(cls, v: str) -> str:
         """Validate economic sector format"""
         if not v or len(v.strip()) == 0:
             raise ValueError('Economic sector cannot be empty')
         return v.strip()
 
-    @validator('region')
-    def validate_region(cls, v):
+    @field_validator('region')
+    @classmethod
+    def validate_region(cls, v: str) -> str:
         """Validate region name"""
         if not v or len(v.strip()) == 0:
             raise ValueError('Region cannot be empty')
         return v.strip()
 
-    class Config:
-        """Pydantic configuration"""
-        str_strip_whitespace = True
-        validate_assignment = True
-        extra = "forbid"
-
 
 class ETLMetadata(BaseModel):
     """
@@ -84,10 +86,6 @@ class ETLMetadata(BaseModel):
     records_processed: int = 0
     records_failed: int = 0
     errors: list = []
-    
-    class Config:
-        """Pydantic configuration"""
-        validate_assignment = True
 
 
 class DataQualityReport(BaseModel):
@@ -102,13 +100,27 @@ class DataQualityReport(BaseModel):
     quality_score: float
     issues: list = []
     
-    @validator('quality_score')
-    def validate_quality_score(cls, v):
+    @field_validator('quality_score')
+    @classmethod
+    def validate_quality_score(cls, v: float) -> float:
         """Ensure quality score is between 0 and 1"""
         if not 0 <= v <= 1:
             raise ValueError('Quality score must be between 0 and 1')
         return v
+
+
+# Validation schema for record batches, built once and reused for every call
+_EMPRESA_RECORDS_ADAPTER = TypeAdapter(List[EmpresaRecord])
+
+
+def parse_empresa_records(records: List[Dict[str, Any]]) -> List[EmpresaRecord]:
+    """
+    Validate a batch of raw records in a single pydantic-core call
     
-    class Config:
-        """Pydantic configuration"""
-        validate_assignment = True
+    Args:
+        records: Raw record dicts keyed by EmpresaRecord field names
+        
+    Returns:
+        List[EmpresaRecord]: Validated records
+    """
+    return _EMPRESA_RECORDS_ADAPTER.validate_python(records)
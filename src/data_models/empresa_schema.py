@@ -0,0 +1,111 @@
+"""
+Columnar schema for SII Empresas data
+Single Responsibility: Check whole columns against the EmpresaRecord rules
+"""
+from typing import Any, Dict, Optional, Type
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from .empresa_models import EmpresaRecord
+
+# Field constraints that can be checked with a vectorized comparison
+_CONSTRAINT_NAMES = ('ge', 'gt', 'le', 'lt', 'min_length')
+
+
+def build_column_rules(model: Type[BaseModel] = EmpresaRecord) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract per-column rules from the field definitions of a pydantic model
+
+    Args:
+        model: Model whose fields define the rules
+
+    Returns:
+        Dict mapping column name to its rules ('required' plus any of
+        ge/gt/le/lt/min_length declared on the field)
+    """
+    rules = {}
+    for name, field in model.model_fields.items():
+        column_rules: Dict[str, Any] = {'required': field.is_required()}
+        for constraint in field.metadata:
+            for attr in _CONSTRAINT_NAMES:
+                value = getattr(constraint, attr, None)
+                if value is not None:
+                    column_rules[attr] = value
+        rules[name] = column_rules
+    return rules
+
+
+EMPRESA_COLUMN_RULES = build_column_rules(EmpresaRecord)
+
+
+def validate_columns(
+    df: pd.DataFrame,
+    rules: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, int]:
+    """
+    Validate a DataFrame column by column against the record rules
+
+    Each rule is a single vectorized comparison over the column, so the cost
+    does not grow with a Python-level call per record as EmpresaRecord does.
+    Columns missing from the DataFrame are skipped (SchemaValidator reports them).
+
+    Args:
+        df: DataFrame to validate
+        rules: Column rules, defaults to EMPRESA_COLUMN_RULES
+
+    Returns:
+        Dict mapping column name to the number of rows violating its rules
+    """
+    rules = EMPRESA_COLUMN_RULES if rules is None else rules
+    violations = {}
+
+    for column, column_rules in rules.items():
+        if column not in df.columns:
+            continue
+
+        values = df[column]
+        invalid = pd.Series(False, index=df.index)
+
+        if column_rules.get('required'):
+            invalid |= values.isna()
+
+        if 'min_length' in column_rules:
+            invalid |= _shorter_than(values, column_rules['min_length'])
+
+        if pd.api.types.is_numeric_dtype(values):
+            if 'ge' in column_rules:
+                invalid |= (values < column_rules['ge']).fillna(False)
+            if 'gt' in column_rules:
+                invalid |= (values <= column_rules['gt']).fillna(False)
+            if 'le' in column_rules:
+                invalid |= (values > column_rules['le']).fillna(False)
+            if 'lt' in column_rules:
+                invalid |= (values >= column_rules['lt']).fillna(False)
+
+        count = int(invalid.sum())
+        if count:
+            violations[column] = count
+
+    return violations
+
+
+def _shorter_than(values: pd.Series, min_length: int) -> pd.Series:
+    """
+    Row mask of the non-null values whose stripped text is shorter than min_length
+
+    Categorical columns are checked once per category and mapped back through
+    the codes, so the column is never materialized as one string per row.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        short = (categories.astype('string').str.strip().str.len() < min_length).to_numpy(dtype=bool)
+        codes = values.cat.codes.to_numpy()
+        mask = np.zeros(len(values), dtype=bool)
+        present = codes >= 0
+        mask[present] = short[codes[present]]
+        return pd.Series(mask, index=values.index)
+
+    lengths = values.astype('string').str.strip().str.len()
+    return (lengths < min_length).fillna(False)
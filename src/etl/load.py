@@ -2,15 +2,30 @@
 ETL Load component following SOLID principles
 Single Responsibility: Handle data loading to various destinations
 """
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
-from ..utils import FileHandler, get_logger
+from typing import Optional, Dict, Any, Iterable, List
+from ..utils import FileHandler, SHARED_FILE_HANDLER, get_logger
 from ..data_models import ETLMetadata
 
 logger = get_logger(__name__)
 
+# Parquet layout shared by ParquetLoader and StreamingLoader: 500k-row groups,
+# dictionary-encoded strings, min/max statistics for predicate pushdown and
+# 1 MiB data pages
+PARQUET_WRITE_OPTIONS = {
+    'use_dictionary': True,
+    'write_statistics': True,
+    'data_page_size': 1 << 20,
+}
+PARQUET_ROW_GROUP_SIZE = 500_000
+
 
 class BaseLoader(ABC):
     """
@@ -39,8 +54,14 @@ class CSVLoader(BaseLoader):
     Single Responsibility: Load data to CSV files
     """
     
-    def __init__(self):
-        self.file_handler = FileHandler()
+    # Default parameters, merged with per-call parameters
+    DEFAULT_PARAMS = {
+        'index': False,
+        'encoding': 'utf-8'
+    }
+    
+    def __init__(self, file_handler: Optional[FileHandler] = None):
+        self.file_handler = file_handler or SHARED_FILE_HANDLER
     
     def load(self, df: pd.DataFrame, destination: str, **kwargs) -> bool:
         """
@@ -57,14 +78,8 @@ class CSVLoader(BaseLoader):
         logger.info(f"Loading data to CSV: {destination}")
         
         try:
-            # Default parameters
-            default_params = {
-                'index': False,
-                'encoding': 'utf-8'
-            }
-            
             # Merge with user-provided parameters
-            params = {**default_params, **kwargs}
+            params = {**self.DEFAULT_PARAMS, **kwargs}
             
             self.file_handler.save_csv(df, destination, **params)
             logger.info(f"Successfully loaded {len(df)} records to {destination}")
@@ -80,8 +95,17 @@ class ParquetLoader(BaseLoader):
     Single Responsibility: Load data to Parquet files
     """
     
-    def __init__(self):
-        self.file_handler = FileHandler()
+    # Default parameters: zstd level 3 gives smaller files than snappy at
+    # about the same read speed (pass compression='snappy' to opt out)
+    DEFAULT_PARAMS = {
+        'index': False,
+        'compression': 'zstd',
+        'row_group_size': PARQUET_ROW_GROUP_SIZE,
+        **PARQUET_WRITE_OPTIONS
+    }
+    
+    def __init__(self, file_handler: Optional[FileHandler] = None):
+        self.file_handler = file_handler or SHARED_FILE_HANDLER
     
     def load(self, df: pd.DataFrame, destination: str, **kwargs) -> bool:
         """
@@ -98,14 +122,10 @@ class ParquetLoader(BaseLoader):
         logger.info(f"Loading data to Parquet: {destination}")
         
         try:
-            # Default parameters
-            default_params = {
-                'index': False,
-                'compression': 'snappy'
-            }
-            
             # Merge with user-provided parameters
-            params = {**default_params, **kwargs}
+            params = {**self.DEFAULT_PARAMS, **kwargs}
+            if params['compression'] == 'zstd':
+                params.setdefault('compression_level', 3)
             
             self.file_handler.save_parquet(df, destination, **params)
             logger.info(f"Successfully loaded {len(df)} records to {destination}")
@@ -116,6 +136,77 @@ class ParquetLoader(BaseLoader):
             return False
 
 
+class PartitionedParquetLoader(BaseLoader):
+    """
+    Single Responsibility: Load data to a Hive-partitioned Parquet dataset
+    
+    One directory per value of the partition columns (e.g. año_comercial=2020/),
+    so readers filtering on them skip whole files. Rows with a missing partition
+    value go to <destination>_unpartitioned.parquet: a null Hive partition
+    makes the whole dataset unreadable with pyarrow's default dictionary
+    partitioning.
+    """
+    
+    def __init__(self, partition_cols: tuple = ('año_comercial',)):
+        self.partition_cols = list(partition_cols)
+    
+    def load(self, df: pd.DataFrame, destination: str, **kwargs) -> bool:
+        """
+        Load data to a partitioned Parquet dataset
+        
+        Args:
+            df: DataFrame to load
+            destination: Path to the dataset directory
+            **kwargs: Additional Parquet write options (compression, etc.)
+            
+        Returns:
+            bool: Success status
+        """
+        logger.info(f"Loading data to partitioned Parquet: {destination} by {self.partition_cols}")
+        
+        try:
+            missing = [col for col in self.partition_cols if col not in df.columns]
+            if missing:
+                raise ValueError(f"Partition columns not found: {missing}")
+            
+            params = {'compression': 'zstd', **PARQUET_WRITE_OPTIONS, **kwargs}
+            if params['compression'] == 'zstd':
+                params.setdefault('compression_level', 3)
+            
+            unpartitioned = df[self.partition_cols].isna().any(axis=1)
+            if unpartitioned.any():
+                unpartitioned_path = f"{destination}_unpartitioned.parquet"
+                logger.warning(
+                    f"{int(unpartitioned.sum())} records without {self.partition_cols} "
+                    f"written to {unpartitioned_path}"
+                )
+                pq.write_table(
+                    pa.Table.from_pandas(df[unpartitioned], preserve_index=False),
+                    unpartitioned_path, **params
+                )
+                df = df[~unpartitioned]
+            
+            # Without pandas metadata, readers rebuild the partition columns from the
+            # directory names instead of expecting the original dtype
+            table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)
+            ds.write_dataset(
+                table,
+                base_dir=destination,
+                format='parquet',
+                partitioning=self.partition_cols,
+                partitioning_flavor='hive',
+                existing_data_behavior='delete_matching',
+                max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+                file_options=ds.ParquetFileFormat().make_write_options(**params)
+            )
+            logger.info(f"Successfully loaded {len(df)} records to {destination}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to load data to {destination}: {e}")
+            return False
+
+
 class DatabaseLoader(BaseLoader):
     """
     Single Responsibility: Load data to databases
@@ -149,13 +240,19 @@ class LoaderFactory:
     Single Responsibility: Create appropriate loader based on destination type
     """
     
-    @staticmethod
-    def create_loader(destination_type: str, **kwargs) -> BaseLoader:
+    # Loaders are reused for identical (destination_type, kwargs) requests
+    _instances: Dict[tuple, BaseLoader] = {}
+    
+    @classmethod
+    def create_loader(cls, destination_type: str, **kwargs) -> BaseLoader:
         """
         Create appropriate loader based on destination type
         
+        Instances are cached per destination type and parameters; parameters
+        that cannot be hashed always get a new instance.
+        
         Args:
-            destination_type: Type of destination ('csv', 'parquet', 'database', etc.)
+            destination_type: Type of destination ('csv', 'parquet', 'parquet_partitioned', 'database', etc.)
             **kwargs: Additional loader parameters
             
         Returns:
@@ -164,13 +261,22 @@ class LoaderFactory:
         loaders = {
             'csv': CSVLoader,
             'parquet': ParquetLoader,
+            'parquet_partitioned': PartitionedParquetLoader,
             'database': DatabaseLoader,
         }
         
         if destination_type not in loaders:
             raise ValueError(f"Unsupported destination type: {destination_type}")
         
-        return loaders[destination_type](**kwargs)
+        try:
+            key = (destination_type, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return loaders[destination_type](**kwargs)
+        
+        if key not in cls._instances:
+            cls._instances[key] = loaders[destination_type](**kwargs)
+        return cls._instances[key]
 
 
 class MultiFormatLoader:
@@ -178,6 +284,13 @@ class MultiFormatLoader:
     Single Responsibility: Load data to multiple formats simultaneously
     """
     
+    # File suffix per supported format (the partitioned dataset is a directory)
+    FORMAT_SUFFIXES = {
+        'csv': '.csv',
+        'parquet': '.parquet',
+        'parquet_partitioned': '',
+    }
+    
     def __init__(self, formats: Dict[str, str]):
         """
         Initialize with format configurations
@@ -186,11 +299,24 @@ class MultiFormatLoader:
             formats: Dict mapping format names to file paths
         """
         self.formats = formats
+        
+        # Resolve loader, directory and suffix once per format
+        self._targets = {}
+        for format_name, base_path in formats.items():
+            format_key = format_name.lower()
+            if format_key in self.FORMAT_SUFFIXES:
+                loader = LoaderFactory.create_loader(format_key)
+                self._targets[format_name] = (loader, Path(base_path), self.FORMAT_SUFFIXES[format_key])
+            else:
+                logger.warning(f"Unsupported format: {format_name}")
     
     def load_all_formats(self, df: pd.DataFrame, base_name: str) -> Dict[str, bool]:
         """
         Load data to all configured formats
         
+        Formats are written concurrently: the pyarrow and pandas C writers
+        release the GIL, so the total time is that of the slowest format.
+        
         Args:
             df: DataFrame to load
             base_name: Base name for output files
@@ -198,31 +324,143 @@ class MultiFormatLoader:
         Returns:
             Dict[str, bool]: Success status for each format
         """
-        results = {}
+        results = {format_name: False for format_name in self.formats}
+        
+        if not self._targets:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(self._targets)) as executor:
+            futures = {
+                format_name: executor.submit(loader.load, df, str(base_path / f"{base_name}{suffix}"))
+                for format_name, (loader, base_path, suffix) in self._targets.items()
+            }
+            for format_name, future in futures.items():
+                try:
+                    results[format_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to load {format_name} format: {e}")
+                    results[format_name] = False
+        
+        return results
+
+
+class StreamingLoader:
+    """
+    Single Responsibility: Write data arriving in chunks to CSV and Parquet files
+    
+    CSV chunks are appended after a single header; Parquet chunks become row
+    groups of one file kept open with pyarrow.parquet.ParquetWriter.
+    """
+    
+    def __init__(self, formats: Dict[str, str], base_name: str):
+        """
+        Initialize with format configurations
         
-        for format_name, base_path in self.formats.items():
+        Args:
+            formats: Dict mapping format names to output directories
+            base_name: Base name for output files
+        """
+        self.paths = {}
+        self.results = {}
+        
+        for format_name, base_path in formats.items():
+            if format_name.lower() in ('csv', 'parquet'):
+                self.paths[format_name] = f"{base_path}/{base_name}.{format_name.lower()}"
+                self.results[format_name] = True
+            else:
+                logger.warning(f"Unsupported format: {format_name}")
+                self.results[format_name] = False
+        
+        self._parquet_writer = None
+        self._parquet_schema = None
+        self.records_written = 0
+    
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        """
+        Append a chunk to every output that has not failed yet
+        
+        Args:
+            df: Chunk to write
+        """
+        first_chunk = self.records_written == 0
+        
+        for format_name, file_path in self.paths.items():
+            if not self.results[format_name]:
+                continue
             try:
-                # Determine file extension and loader type
                 if format_name.lower() == 'csv':
-                    file_path = f"{base_path}/{base_name}.csv"
-                    loader = LoaderFactory.create_loader('csv')
-                elif format_name.lower() == 'parquet':
-                    file_path = f"{base_path}/{base_name}.parquet"
-                    loader = LoaderFactory.create_loader('parquet')
+                    # Written directly rather than through FileHandler.save_csv
+                    # so appending a chunk does not log two lines each time
+                    if first_chunk:
+                        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+                    df.to_csv(
+                        file_path, index=False, encoding='utf-8',
+                        mode='w' if first_chunk else 'a', header=first_chunk
+                    )
                 else:
-                    logger.warning(f"Unsupported format: {format_name}")
-                    results[format_name] = False
-                    continue
-                
-                # Load data
-                success = loader.load(df, file_path)
-                results[format_name] = success
-                
+                    self._write_parquet_chunk(df, file_path)
             except Exception as e:
-                logger.error(f"Failed to load {format_name} format: {e}")
-                results[format_name] = False
+                logger.error(f"Failed to write chunk to {file_path}: {e}")
+                self.results[format_name] = False
         
-        return results
+        self.records_written += len(df)
+    
+    def close(self) -> Dict[str, bool]:
+        """
+        Close open writers
+        
+        Returns:
+            Dict[str, bool]: Success status for each format
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        
+        logger.info(f"Streamed {self.records_written} records to {list(self.paths.values())}")
+        return dict(self.results)
+    
+    def _write_parquet_chunk(self, df: pd.DataFrame, file_path: str) -> None:
+        """Write a chunk as a row group, fixing the file schema on the first one"""
+        if self._parquet_writer is None:
+            self._parquet_schema = self._chunk_schema(df)
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            self._parquet_writer = pq.ParquetWriter(
+                file_path, self._parquet_schema,
+                compression='zstd', compression_level=3, **PARQUET_WRITE_OPTIONS
+            )
+        
+        table = pa.Table.from_pandas(df, schema=self._parquet_schema, preserve_index=False)
+        self._parquet_writer.write_table(table)
+    
+    @staticmethod
+    def _chunk_schema(df: pd.DataFrame) -> pa.Schema:
+        """
+        Infer a schema from the first chunk that later chunks can also fit
+        
+        NumPy integer columns are widened to float64 (a later chunk may contain
+        NaN), all-null columns to string (a later chunk may contain text) and
+        dictionary (categorical) indices to int32 (a later chunk may hold more
+        categories). The pandas metadata is kept, so the file reads back with
+        the nullable integer and categorical dtypes of the chunks.
+        
+        Args:
+            df: First chunk
+            
+        Returns:
+            pa.Schema: Schema for the whole file
+        """
+        schema = pa.Table.from_pandas(df, preserve_index=False).schema
+        fields = []
+        for field in schema:
+            dtype = df[field.name].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+                field = field.with_type(pa.float64())
+            elif pa.types.is_null(field.type):
+                field = field.with_type(pa.string())
+            elif pa.types.is_dictionary(field.type):
+                field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered))
+            fields.append(field)
+        return pa.schema(fields, metadata=schema.metadata)
 
 
 class DataLoader:
@@ -232,8 +470,18 @@ class DataLoader:
     Dependency Inversion: Depends on abstraction (BaseLoader)
     """
     
-    def __init__(self, metadata: Optional[ETLMetadata] = None):
+    # Low-cardinality text columns stored as category (int codes + dictionary)
+    CATEGORICAL_COLUMNS = ['comuna', 'provincia', 'region', 'rubro_economico']
+    
+    def __init__(
+        self,
+        metadata: Optional[ETLMetadata] = None,
+        categorical_columns: Optional[List[str]] = None
+    ):
         self.metadata = metadata
+        self.categorical_columns = (
+            self.CATEGORICAL_COLUMNS if categorical_columns is None else categorical_columns
+        )
     
     def load_processed_data(
         self,
@@ -243,6 +491,13 @@ class DataLoader:
         """
         Load processed data according to configuration
         
+        output_config keys:
+            formats: Dict mapping format name to output directory
+            base_name: Base name for the files written for 'formats'
+            destinations: List of dicts with 'type' and 'path', plus optional
+                'init_params' (loader constructor arguments) and 'load_params'
+                (arguments for loader.load; 'params' is accepted as an alias)
+        
         Args:
             df: Processed DataFrame to load
             output_config: Configuration for output destinations
@@ -253,6 +508,7 @@ class DataLoader:
         logger.info("Starting data loading process")
         
         results = {}
+        df = self._downcast_categoricals(df)
         
         try:
             # Load to multiple formats if configured
@@ -267,24 +523,16 @@ class DataLoader:
                 for dest_config in output_config['destinations']:
                     dest_type = dest_config['type']
                     dest_path = dest_config['path']
-                    dest_params = dest_config.get('params', {})
+                    init_params = dest_config.get('init_params', {})
+                    load_params = dest_config.get('load_params', dest_config.get('params', {}))
                     
-                    loader = LoaderFactory.create_loader(dest_type, **dest_params)
-                    success = loader.load(df, dest_path, **dest_params)
+                    # Constructor and write parameters are kept apart so that
+                    # neither receives the other's arguments
+                    loader = LoaderFactory.create_loader(dest_type, **init_params)
+                    success = loader.load(df, dest_path, **load_params)
                     results[f"{dest_type}_{dest_path}"] = success
             
-            # Update metadata
-            if self.metadata:
-                successful_loads = sum(1 for success in results.values() if success)
-                total_loads = len(results)
-                
-                if successful_loads == total_loads:
-                    self.metadata.status = "completed"
-                elif successful_loads > 0:
-                    self.metadata.status = "partially_completed"
-                else:
-                    self.metadata.status = "failed"
-                    self.metadata.errors.append("All loading operations failed")
+            self._update_metadata(results)
             
             logger.info(f"Data loading completed. Success rate: {sum(results.values())}/{len(results)}")
             return results
@@ -295,3 +543,116 @@ class DataLoader:
                 self.metadata.errors.append(f"Loading error: {e}")
                 self.metadata.status = "failed"
             raise
+    
+    def load_processed_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        output_config: Dict[str, Any]
+    ) -> Dict[str, bool]:
+        """
+        Load processed data chunk by chunk to the configured formats
+        
+        Only one chunk is held in memory at a time. 'destinations' entries are
+        not supported here since their loaders write whole DataFrames.
+        
+        Args:
+            chunks: Iterable of processed DataFrames with the same columns
+            output_config: Configuration for output destinations
+            
+        Returns:
+            Dict[str, bool]: Success status for each format
+        """
+        logger.info("Starting chunked data loading process")
+        
+        base_name = output_config.get('base_name', 'sii_empresas_processed')
+        streaming_loader = StreamingLoader(output_config.get('formats', {}), base_name)
+        
+        try:
+            for chunk in chunks:
+                streaming_loader.write_chunk(chunk)
+        except Exception as e:
+            logger.error(f"Data loading failed: {e}")
+            if self.metadata:
+                self.metadata.errors.append(f"Loading error: {e}")
+                self.metadata.status = "failed"
+            raise
+        finally:
+            results = streaming_loader.close()
+        
+        self._update_metadata(results)
+        
+        logger.info(f"Chunked data loading completed. Success rate: {sum(results.values())}/{len(results)}")
+        return results
+    
+    def load_polars_data(self, df: Any, output_config: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Load a Polars DataFrame to the configured formats with Polars' own writers
+        
+        Only the 'parquet' and 'csv' formats are supported; 'destinations'
+        entries are not, since their loaders write pandas DataFrames.
+        
+        Args:
+            df: Processed polars.DataFrame (a LazyFrame is collected once per format)
+            output_config: Configuration for output destinations
+            
+        Returns:
+            Dict[str, bool]: Success status for each format
+        """
+        logger.info("Starting Polars data loading process")
+        
+        base_name = output_config.get('base_name', 'sii_empresas_processed')
+        
+        results = {}
+        for format_name, base_path in output_config.get('formats', {}).items():
+            format_key = format_name.lower()
+            if format_key not in ('csv', 'parquet'):
+                logger.warning(f"Unsupported format for Polars data: {format_name}")
+                results[format_name] = False
+                continue
+            
+            file_path = str(Path(base_path) / f"{base_name}{MultiFormatLoader.FORMAT_SUFFIXES[format_key]}")
+            try:
+                if format_key == 'csv':
+                    SHARED_FILE_HANDLER.save_csv(df, file_path)
+                else:
+                    SHARED_FILE_HANDLER.save_parquet(df, file_path, compression='zstd', compression_level=3)
+                results[format_name] = True
+            except Exception as e:
+                logger.error(f"Failed to load {format_name} format: {e}")
+                results[format_name] = False
+        
+        self._update_metadata(results)
+        
+        logger.info(f"Polars data loading completed. Success rate: {sum(results.values())}/{len(results)}")
+        return results
+    
+    def _downcast_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the configured text columns to category dtype
+        
+        Args:
+            df: DataFrame to convert (left unchanged)
+            
+        Returns:
+            pd.DataFrame: DataFrame with categorical columns
+        """
+        columns = {
+            col: df[col].astype('category')
+            for col in self.categorical_columns
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        }
+        return df.assign(**columns) if columns else df
+    
+    def _update_metadata(self, results: Dict[str, bool]) -> None:
+        """Set the metadata status from the per-destination results"""
+        if self.metadata:
+            successful_loads = sum(1 for success in results.values() if success)
+            total_loads = len(results)
+            
+            if successful_loads == total_loads:
+                self.metadata.status = "completed"
+            elif successful_loads > 0:
+                self.metadata.status = "partially_completed"
+            else:
+                self.metadata.status = "failed"
+                self.metadata.errors.append("All loading operations failed")
@@ -5,20 +5,26 @@ Dependency Inversion: Depends on abstractions, not concretions
 """
 import uuid
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator
+
+import pandas as pd
 
 from .extract import DataExtractor
-from .transform import create_standard_pipeline
+from .transform import create_standard_pipeline, TransformationPipeline
+from .polars_transform import PolarsTransformationPipeline
 from .load import DataLoader
 from ..validators import (
     SchemaValidator,
     DataQualityValidator, 
     BusinessRuleValidator,
-    DataValidationPipeline
+    DataValidationPipeline,
+    ChunkedValidation
 )
+from ..validators.polars_validators import PolarsValidationPipeline
 from ..data_models import ETLMetadata, DataQualityReport
-from ..utils import ConfigManager, setup_project_logging, get_logger
+from ..utils import ConfigManager, setup_project_logging, get_logger, LogSampler
 
 logger = get_logger(__name__)
 
@@ -50,41 +56,72 @@ class ETLPipeline:
             process_id=str(uuid.uuid4()),
             start_time=datetime.now()
         )
+        # Timestamp tag shared by every output of this pipeline instance
+        self._run_tag = self.metadata.start_time.strftime('%Y%m%d_%H%M%S')
         
-        # Initialize components
+        # Initialize components (transformer, loader and validators are built
+        # on first use, so single-phase runs skip the others)
         self.extractor = DataExtractor(self.metadata)
-        self.transformer = create_standard_pipeline()
-        self.transformer.metadata = self.metadata
-        self.loader = DataLoader(self.metadata)
         
-        # Initialize validators
+        logger.info(f"ETL Pipeline initialized with process ID: {self.metadata.process_id}")
+    
+    @cached_property
+    def transformer(self) -> TransformationPipeline:
+        """Standard transformation pipeline, built on first use"""
+        n_workers = self.config.max_workers if self.config.parallel_transform else 1
+        transformer = create_standard_pipeline(n_workers=n_workers)
+        transformer.metadata = self.metadata
+        return transformer
+    
+    @cached_property
+    def loader(self) -> DataLoader:
+        """Data loader, built on first use"""
+        return DataLoader(self.metadata)
+    
+    @cached_property
+    def validators(self) -> DataValidationPipeline:
+        """Validation pipeline, built on first use"""
         expected_columns = [
             'año_comercial', 'comuna', 'provincia', 'region', 'rubro_economico',
             'numero_empresas', 'ventas_anuales_uf', 'numero_trabajadores_dependientes',
             'renta_neta_uf', 'trabajadores_ponderados_meses'
         ]
         
-        self.validators = DataValidationPipeline([
+        return DataValidationPipeline([
             SchemaValidator(expected_columns),
             DataQualityValidator(max_null_percentage=0.3),
             BusinessRuleValidator(min_year=2005, max_year=2024)
         ])
-        
-        logger.info(f"ETL Pipeline initialized with process ID: {self.metadata.process_id}")
+    
+    @cached_property
+    def polars_validators(self) -> PolarsValidationPipeline:
+        """Validation pipeline for Polars data, running the same validators"""
+        return PolarsValidationPipeline(self.validators.validators)
     
     def run_full_pipeline(
         self, 
         input_file: Optional[str] = None,
         validate_data: bool = True,
-        save_intermediates: bool = False
+        save_intermediates: bool = False,
+        chunksize: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Run the complete ETL pipeline
         
+        With chunksize the input is read in chunks and each one is transformed,
+        validated (counts are accumulated across chunks) and loaded on its own,
+        so the whole table is never held in memory. Only a validated run that
+        saves intermediates combines the transformed chunks.
+        
+        With config.transform_engine set to "polars", the whole run is a Polars
+        lazy query instead, validated with a single Polars aggregation
+        (chunksize and intermediates do not apply).
+        
         Args:
             input_file: Path to input data file (optional, uses config if not provided)
             validate_data: Whether to run data validation
             save_intermediates: Whether to save intermediate results
+            chunksize: Rows per chunk for chunked processing (None reads the whole file)
             
         Returns:
             Dict with pipeline results and metadata
@@ -92,23 +129,32 @@ class ETLPipeline:
         logger.info("Starting ETL pipeline execution")
         
         try:
+            if self.config.transform_engine == 'polars':
+                return self._run_polars_transform_load(input_file, validate_data)
+            
             # 1. EXTRACT
             logger.info("=== EXTRACT PHASE ===")
-            input_path = input_file or self.config.raw_data_path
-            raw_data = self.extractor.extract_sii_data(
-                file_path=self._resolve_path(input_path),
-                source_type='csv'
-            )
+            raw_data = self._extract(input_file, chunksize)
             
-            if save_intermediates:
-                self._save_intermediate(raw_data, "01_raw_data.csv")
+            if chunksize and not (validate_data and save_intermediates):
+                return self._run_chunked_transform_load(raw_data, validate_data)
+            
+            if save_intermediates and not chunksize:
+                self._save_intermediate(raw_data, "01_raw_data")
             
             # 2. TRANSFORM  
             logger.info("=== TRANSFORM PHASE ===")
-            transformed_data = self.transformer.run_transformations(raw_data)
+            if chunksize:
+                transformed_data = pd.concat(self._transform_chunks(raw_data), ignore_index=True)
+            else:
+                transformed_data = self.transformer.run_transformations(raw_data)
+            
+            # The raw frame is no longer needed: free it before validation and
+            # loading allocate their own buffers
+            del raw_data
             
             if save_intermediates:
-                self._save_intermediate(transformed_data, "02_transformed_data.csv")
+                self._save_intermediate(transformed_data, "02_transformed_data")
             
             # 3. VALIDATE (optional)
             quality_report = None
@@ -119,35 +165,14 @@ class ETLPipeline:
                 if save_intermediates:
                     self._save_quality_report(quality_report)
                 
-                # Log quality issues
-                if quality_report.issues:
-                    logger.warning(f"Data quality issues found: {len(quality_report.issues)}")
-                    for issue in quality_report.issues[:5]:  # Log first 5 issues
-                        logger.warning(f"  - {issue}")
+                self._log_quality_issues(quality_report)
             
             # 4. LOAD
             logger.info("=== LOAD PHASE ===")
             output_config = self._create_output_config()
             load_results = self.loader.load_processed_data(transformed_data, output_config)
             
-            # Update final metadata
-            self.metadata.end_time = datetime.now()
-            if all(load_results.values()):
-                self.metadata.status = "completed"
-            else:
-                self.metadata.status = "completed_with_warnings"
-            
-            # Prepare results
-            results = {
-                'metadata': self.metadata,
-                'quality_report': quality_report,
-                'load_results': load_results,
-                'final_data_shape': transformed_data.shape,
-                'process_duration': (self.metadata.end_time - self.metadata.start_time).total_seconds()
-            }
-            
-            logger.info(f"ETL pipeline completed successfully in {results['process_duration']:.2f} seconds")
-            return results
+            return self._finish_pipeline(load_results, quality_report, transformed_data.shape)
             
         except Exception as e:
             logger.error(f"ETL pipeline failed: {e}")
@@ -156,15 +181,126 @@ class ETLPipeline:
             self.metadata.errors.append(str(e))
             raise
     
+    def _run_chunked_transform_load(
+        self,
+        raw_chunks: Iterable[pd.DataFrame],
+        validate_data: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Transform, validate and load chunk by chunk, keeping only one chunk in memory
+        
+        Args:
+            raw_chunks: Iterable of raw DataFrames
+            validate_data: Whether to run data validation
+            
+        Returns:
+            Dict with pipeline results and metadata
+        """
+        logger.info("=== TRANSFORM + LOAD PHASE (chunked) ===")
+        n_columns = 0
+        validation = ChunkedValidation(self.validators) if validate_data else None
+        
+        def transformed_chunks() -> Iterator[pd.DataFrame]:
+            nonlocal n_columns
+            for chunk in self._transform_chunks(raw_chunks):
+                n_columns = chunk.shape[1]
+                if validation is not None:
+                    validation.add(chunk)
+                yield chunk
+        
+        load_results = self.loader.load_processed_chunks(transformed_chunks(), self._create_output_config())
+        
+        quality_report = None
+        if validation is not None:
+            logger.info("=== VALIDATION PHASE ===")
+            quality_report = validation.report()
+            self._log_quality_issues(quality_report)
+        
+        return self._finish_pipeline(load_results, quality_report, (self.metadata.records_processed, n_columns))
+    
+    def _run_polars_transform_load(
+        self,
+        input_file: Optional[str] = None,
+        validate_data: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Extract, transform, validate and load with Polars
+        
+        The query is materialized once, validated and the result written with
+        Polars' own writers, so the data never passes through pandas.
+        
+        Args:
+            input_file: Path to input data file (optional, uses config if not provided)
+            validate_data: Whether to run data validation
+            
+        Returns:
+            Dict with pipeline results and metadata
+        """
+        logger.info("=== EXTRACT + TRANSFORM + LOAD PHASE (polars) ===")
+        file_path = self._resolve_path(input_file or self.config.raw_data_path)
+        
+        query = PolarsTransformationPipeline(self.metadata).run(file_path)
+        transformed_data = query.collect(engine='streaming')
+        self.metadata.records_processed = transformed_data.height
+        
+        quality_report = None
+        if validate_data:
+            logger.info("=== VALIDATION PHASE ===")
+            quality_report = self.polars_validators.run_validation(transformed_data)
+            self._log_quality_issues(quality_report)
+        
+        load_results = self.loader.load_polars_data(transformed_data, self._create_output_config())
+        
+        return self._finish_pipeline(load_results, quality_report, transformed_data.shape)
+    
+    def _transform_chunks(self, raw_chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Transform chunks lazily, keeping the processed record count cumulative"""
+        records = 0
+        sampler = LogSampler()
+        for chunk in raw_chunks:
+            transformed = self.transformer.run_transformations(chunk, step_level="DEBUG")
+            records += len(transformed)
+            self.metadata.records_processed = records
+            if sampler.ready():
+                logger.info("Transformed {} chunks ({} records)", sampler.calls, records)
+            yield transformed
+        logger.info("Transformed {} chunks in total ({} records)", sampler.calls, records)
+    
+    def _log_quality_issues(self, quality_report: DataQualityReport):
+        """Log the number of quality issues and the first five of them"""
+        if quality_report.issues:
+            logger.warning(f"Data quality issues found: {len(quality_report.issues)}")
+            for issue in quality_report.issues[:5]:  # Log first 5 issues
+                logger.warning(f"  - {issue}")
+    
+    def _finish_pipeline(
+        self,
+        load_results: Dict[str, bool],
+        quality_report: Optional[DataQualityReport],
+        final_data_shape: tuple
+    ) -> Dict[str, Any]:
+        """Update final metadata and prepare the pipeline results"""
+        self.metadata.end_time = datetime.now()
+        if all(load_results.values()):
+            self.metadata.status = "completed"
+        else:
+            self.metadata.status = "completed_with_warnings"
+        
+        results = {
+            'metadata': self.metadata,
+            'quality_report': quality_report,
+            'load_results': load_results,
+            'final_data_shape': final_data_shape,
+            'process_duration': (self.metadata.end_time - self.metadata.start_time).total_seconds()
+        }
+        
+        logger.info(f"ETL pipeline completed successfully in {results['process_duration']:.2f} seconds")
+        return results
+    
     def run_extract_only(self, input_file: Optional[str] = None):
         """Run only the extract phase"""
         logger.info("Running extract-only pipeline")
-        
-        input_path = input_file or self.config.raw_data_path
-        return self.extractor.extract_sii_data(
-            file_path=self._resolve_path(input_path),
-            source_type='csv'
-        )
+        return self._extract(input_file)
     
     def run_transform_only(self, data):
         """Run only the transform phase"""
@@ -176,6 +312,25 @@ class ETLPipeline:
         logger.info("Running validation-only pipeline")
         return self.validators.run_validation(data)
     
+    def _extract(self, input_file: Optional[str] = None, chunksize: Optional[int] = None):
+        """
+        Extract the input file
+        
+        Args:
+            input_file: Path to input data file (optional, uses config if not provided)
+            chunksize: Rows per chunk for chunked processing
+            
+        Returns:
+            pd.DataFrame, or an iterator of chunks if chunksize is set
+        """
+        file_path = self._resolve_path(input_file or self.config.raw_data_path)
+        
+        return self.extractor.extract_sii_data(
+            file_path=file_path,
+            source_type='csv',
+            chunksize=chunksize
+        )
+    
     def _resolve_path(self, path: str) -> str:
         """Resolve relative paths from project root"""
         if Path(path).is_absolute():
@@ -185,31 +340,31 @@ class ETLPipeline:
     def _create_output_config(self) -> Dict[str, Any]:
         """Create output configuration for loading"""
         project_root = self.config_manager.get_project_root()
+        output_dir = str(project_root / "data/processed")
         
         return {
-            'formats': {
-                'csv': str(project_root / "data/processed"),
-                'parquet': str(project_root / "data/processed")
-            },
-            'base_name': f"sii_empresas_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            'formats': {format_name: output_dir for format_name in self.config.output_formats},
+            'base_name': f"sii_empresas_processed_{self._run_tag}"
         }
     
-    def _save_intermediate(self, data, filename: str):
-        """Save intermediate data for debugging"""
-        output_path = self.config_manager.get_project_root() / "data/processed" / filename
-        data.to_csv(output_path, index=False)
+    def _save_intermediate(self, data, name: str):
+        """Save intermediate data for debugging (Feather by default, CSV if configured)"""
+        output_dir = self.config_manager.get_project_root() / "data/processed"
+        if self.config.intermediate_format == 'csv':
+            output_path = output_dir / f"{name}.csv"
+            data.to_csv(output_path, index=False)
+        else:
+            # Arrow IPC copies the column buffers as they are, without text encoding
+            output_path = output_dir / f"{name}.feather"
+            data.reset_index(drop=True).to_feather(output_path, compression='lz4')
         logger.info(f"Saved intermediate data: {output_path}")
     
     def _save_quality_report(self, report: DataQualityReport):
         """Save quality report"""
         output_path = self.config_manager.get_project_root() / "data/processed" / "quality_report.json"
         
-        # Convert to dict and save
-        report_dict = report.dict()
-        
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(report_dict, f, indent=2, default=str)
+        # pydantic serializes the model to JSON in Rust, without a dict round-trip
+        output_path.write_text(report.model_dump_json(indent=2), encoding='utf-8')
         
         logger.info(f"Saved quality report: {output_path}")
 
@@ -218,7 +373,8 @@ def run_etl_pipeline(
     config_path: str = "config/etl_config.yaml",
     input_file: Optional[str] = None,
     validate_data: bool = True,
-    save_intermediates: bool = False
+    save_intermediates: bool = False,
+    chunksize: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to run ETL pipeline
@@ -228,6 +384,7 @@ def run_etl_pipeline(
         input_file: Path to input data file
         validate_data: Whether to run data validation  
         save_intermediates: Whether to save intermediate results
+        chunksize: Rows per chunk for chunked processing (None reads the whole file)
         
     Returns:
         Dict with pipeline results and metadata
@@ -236,5 +393,6 @@ def run_etl_pipeline(
     return pipeline.run_full_pipeline(
         input_file=input_file,
         validate_data=validate_data,
-        save_intermediates=save_intermediates
+        save_intermediates=save_intermediates,
+        chunksize=chunksize
     )
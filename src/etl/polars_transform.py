@@ -0,0 +1,144 @@
+"""
+Polars ETL transform component following SOLID principles
+Single Responsibility: Build the standard transformations as a Polars lazy query
+"""
+from typing import Optional
+
+from .transform import NUMERIC_COLUMNS, COUNT_COLUMNS, KEY_COLUMNS, WHITESPACE_PATTERN, SECTOR_CODE_PATTERN
+from ..utils import get_logger
+from ..utils.file_handlers import COLUMN_MAPPING
+from ..data_models import ETLMetadata
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional: the pandas pipeline is the default
+    pl = None
+
+logger = get_logger(__name__)
+
+
+class PolarsTransformationPipeline:
+    """
+    Single Responsibility: Transform SII CSV files with a Polars lazy query
+    
+    Mirrors FusedTransformer (renaming, numeric conversion, row filters and
+    derived features) as one query plan that Polars runs across all cores and
+    materializes only when it is collected or written.
+    """
+    
+    def __init__(self, metadata: Optional[ETLMetadata] = None):
+        if pl is None:
+            raise ImportError("polars is required for the Polars transform engine (pip install polars)")
+        self.metadata = metadata
+    
+    def scan(self, file_path: str) -> "pl.LazyFrame":
+        """
+        Lazily scan a raw CSV file with standardized column names
+        
+        Every column is read as text ('*' as null) so the numeric cleaning
+        below sees the original values, as the pandas path does.
+        
+        Args:
+            file_path: Path to the raw CSV file
+        
+        Returns:
+            pl.LazyFrame: Unmaterialized raw data
+        """
+        lf = pl.scan_csv(file_path, infer_schema=False, null_values=['*'])
+        names = lf.collect_schema().names()
+        return lf.rename({col: COLUMN_MAPPING[col] for col in names if col in COLUMN_MAPPING})
+    
+    def transform(self, lf: "pl.LazyFrame") -> "pl.LazyFrame":
+        """
+        Add the standard transformations to a lazy query
+        
+        Args:
+            lf: LazyFrame with standardized column names
+        
+        Returns:
+            pl.LazyFrame: Transformed (still unmaterialized) data
+        """
+        columns = set(lf.collect_schema().names())
+        key_fields = [col for col in KEY_COLUMNS if col in columns]
+        
+        # Data types: strip quotes and thousands separators before casting;
+        # counts are stored as Int32, as in the pandas path
+        converted = []
+        for col in NUMERIC_COLUMNS:
+            if col in columns:
+                value = (
+                    pl.col(col).str.replace_all('"', '', literal=True)
+                    .str.replace_all(',', '', literal=True)
+                    .cast(pl.Float64, strict=False)
+                )
+                converted.append(value.cast(pl.Int32, strict=False) if col in COUNT_COLUMNS else value)
+        if 'año_comercial' in columns:
+            converted.append(pl.col('año_comercial').cast(pl.Int64, strict=False))
+        converted.extend(
+            pl.col(col).str.strip_chars().str.replace_all(WHITESPACE_PATTERN, ' ').cast(pl.Categorical)
+            for col in key_fields
+        )
+        lf = lf.with_columns(converted)
+        
+        # Cleaning: drop empty rows and rows missing every key field
+        lf = lf.filter(pl.any_horizontal(pl.all().is_not_null()))
+        if key_fields:
+            lf = lf.filter(pl.any_horizontal([pl.col(col).is_not_null() for col in key_fields]))
+        
+        return lf.with_columns(self._features(columns))
+    
+    def run(self, file_path: str) -> "pl.LazyFrame":
+        """
+        Build the full lazy query for a raw CSV file
+        
+        Args:
+            file_path: Path to the raw CSV file
+        
+        Returns:
+            pl.LazyFrame: Query to collect or hand to FileHandler for writing
+        """
+        logger.info(f"Building Polars transformation query for {file_path}")
+        try:
+            return self.transform(self.scan(file_path))
+        except Exception as e:
+            logger.error(f"Polars transformation failed: {e}")
+            if self.metadata:
+                self.metadata.errors.append(f"Transformation error: {e}")
+            raise
+    
+    @staticmethod
+    def _features(columns: set) -> list:
+        """Derived feature expressions for the columns present"""
+        features = []
+        
+        # Non-finite ratios (division by zero) become null, as in the pandas path
+        def finite(expr):
+            return pl.when(expr.is_finite()).then(expr)
+        
+        if {'renta_neta_uf', 'numero_trabajadores_dependientes'} <= columns:
+            features.append(
+                finite(pl.col('renta_neta_uf') / pl.col('numero_trabajadores_dependientes'))
+                .alias('salario_promedio_uf')
+            )
+        
+        if {'numero_trabajadores_femenino', 'numero_trabajadores_masculino'} <= columns:
+            femenino = pl.col('numero_trabajadores_femenino')
+            total_gendered = femenino.fill_null(0) + pl.col('numero_trabajadores_masculino').fill_null(0)
+            features.append(finite(femenino / total_gendered).alias('ratio_femenino'))
+        
+        if 'numero_trabajadores_dependientes' in columns:
+            # pd.cut with bins starting at 0 leaves negative counts uncategorized
+            trabajadores = pl.col('numero_trabajadores_dependientes')
+            features.append(
+                pl.when(trabajadores >= 0)
+                .then(trabajadores.cut([10, 50, 200], labels=['Micro', 'Pequeña', 'Mediana', 'Grande']))
+                .alias('categoria_empresa')
+            )
+        
+        if 'rubro_economico' in columns:
+            features.append(
+                pl.col('rubro_economico').cast(pl.String).str.extract(SECTOR_CODE_PATTERN, 1)
+                .cast(pl.Categorical).alias('codigo_sector')
+            )
+        
+        return features
@@ -4,9 +4,13 @@ Single Responsibility: Handle data transformation and cleaning
 """
 import pandas as pd
 import numpy as np
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, List, Dict, Any, Callable
 from ..utils import DataTypeConverter, get_logger
+from ..utils.file_handlers import TEXT_DTYPE
 from ..data_models import ETLMetadata
 
 logger = get_logger(__name__)
@@ -23,6 +27,8 @@ class BaseTransformer(ABC):
         """
         Transform DataFrame
         
+        Implementations must not modify df in place; return a new DataFrame.
+        
         Args:
             df: Input DataFrame
             
@@ -32,6 +38,185 @@ class BaseTransformer(ABC):
         pass
 
 
+# Columns holding counts and UF amounts, converted to numbers
+NUMERIC_COLUMNS = [
+    'numero_empresas', 'ventas_anuales_uf', 'numero_trabajadores_dependientes',
+    'renta_neta_uf', 'trabajadores_ponderados_meses', 'numero_trabajadores_femenino',
+    'renta_neta_femenino_uf', 'trabajadores_femenino_ponderados',
+    'numero_trabajadores_masculino', 'renta_neta_masculino_uf',
+    'trabajadores_masculino_ponderados', 'numero_trabajadores_honorarios',
+    'honorarios_pagados_uf', 'trabajadores_honorarios_ponderados',
+    'numero_trabajadores_honorarios_femenino', 'honorarios_femenino_uf',
+    'trabajadores_honorarios_femenino_ponderados',
+    'numero_trabajadores_honorarios_masculino', 'honorarios_masculino_uf',
+    'trabajadores_honorarios_masculino_ponderados'
+]
+
+# Numeric columns holding whole counts, stored as nullable Int32 (UF amounts
+# and month-weighted worker figures keep float64)
+COUNT_COLUMNS = [
+    'numero_empresas', 'numero_trabajadores_dependientes',
+    'numero_trabajadores_femenino', 'numero_trabajadores_masculino',
+    'numero_trabajadores_honorarios', 'numero_trabajadores_honorarios_femenino',
+    'numero_trabajadores_honorarios_masculino'
+]
+
+# Company size categories by number of dependent workers; each bound is the
+# largest count of its category
+SIZE_CATEGORY_BOUNDS = np.array([10, 50, 200], dtype=np.float64)
+SIZE_CATEGORY_LABELS = ['Micro', 'Pequeña', 'Mediana', 'Grande']
+
+# Categorical columns identifying a record; rows missing all of them are dropped
+KEY_COLUMNS = ['comuna', 'provincia', 'region', 'rubro_economico']
+
+# Regex patterns shared by the pandas and Polars transformations. They are
+# passed as strings: pandas runs string patterns on Arrow-backed text in
+# pyarrow compute, while a compiled re.Pattern falls back to Python per value
+WHITESPACE_PATTERN = r'\s+'
+SECTOR_CODE_PATTERN = r'^([A-Z])'
+
+
+def _map_unique(series: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Apply a vectorized string operation to each distinct value of series once
+    
+    The key columns repeat a few hundred values over every row, so running
+    regexes on the distinct values and broadcasting the result back is far
+    cheaper than running them on each row.
+    
+    Args:
+        series: Text Series to transform
+        func: Operation taking and returning a Series of the same length
+        
+    Returns:
+        pd.Series: func applied row by row, with missing values kept missing;
+        series itself if it has no text values (all missing or non-text)
+    """
+    codes, uniques = pd.factorize(series)
+    if len(uniques) == 0 or not pd.api.types.is_string_dtype(uniques):
+        return series
+    mapped = func(pd.Series(uniques, dtype=series.dtype))
+    result = pd.Series(mapped.to_numpy().take(codes), index=series.index, dtype=mapped.dtype)
+    return result.where(codes >= 0)
+
+
+def _collapse_whitespace(series: pd.Series) -> pd.Series:
+    """Strip text and collapse inner runs of whitespace to a single space"""
+    return series.str.strip().str.replace(WHITESPACE_PATTERN, ' ', regex=True)
+
+
+def _to_count(series: pd.Series, name: str) -> pd.Series:
+    """
+    Store a count column as nullable Int32, keeping missing values missing
+    
+    Columns with fractional or out-of-range values are left as they are.
+    """
+    try:
+        return series.astype('Int32')
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Keeping {name} as {series.dtype}: {e}")
+        return series
+
+
+def _any_present(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Boolean mask of the rows with a value in at least one of columns"""
+    mask = np.zeros(len(df), dtype=bool)
+    for col in columns:
+        mask |= df[col].notna().to_numpy()
+    return mask
+
+
+def _convert_types(df: pd.DataFrame, converter: DataTypeConverter) -> Dict[str, pd.Series]:
+    """
+    Convert numeric, year and categorical columns of df
+    
+    Returns:
+        Dict mapping column name to its converted Series (df is not modified)
+    """
+    numeric = [col for col in NUMERIC_COLUMNS if col in df.columns]
+    
+    # Unparseable values are coerced to NaN, so a column is only reported when
+    # none of its values survive the conversion
+    converted = {col: converter.convert_to_numeric(df[col]) for col in numeric}
+    emptied = [col for col in numeric if converted[col].isna().all() and df[col].notna().any()]
+    if emptied:
+        logger.warning("No numeric values left after conversion in: {}", ", ".join(emptied))
+    logger.debug("Converted {} columns to numeric", len(converted))
+    
+    for col in COUNT_COLUMNS:
+        if col in converted:
+            converted[col] = _to_count(converted[col], col)
+    
+    if 'año_comercial' in df.columns:
+        converted['año_comercial'] = pd.to_numeric(df['año_comercial'], errors='coerce').astype('Int64')
+    
+    for col in KEY_COLUMNS:
+        if col in df.columns:
+            converted[col] = df[col].astype(TEXT_DTYPE).str.strip().replace('nan', np.nan)
+    
+    return converted
+
+
+def _as_float(series: pd.Series) -> np.ndarray:
+    """Values of a numeric Series as a float64 array, missing values as NaN"""
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    Divide element-wise in one pass, leaving NaN wherever the quotient would not be finite
+    
+    Same result as dividing and then replacing ±inf with NaN (0/0 is NaN).
+    """
+    result = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=result, where=(denominator != 0) & np.isfinite(numerator))
+    return result
+
+
+def _derive_features(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    Compute derived features from the converted columns of df
+    
+    Returns:
+        Dict mapping feature name to its Series (df is not modified)
+    """
+    features = {}
+    columns = df.columns
+    
+    # Calculate average salary per employee (if data available)
+    if 'renta_neta_uf' in columns and 'numero_trabajadores_dependientes' in columns:
+        features['salario_promedio_uf'] = pd.Series(
+            _safe_divide(_as_float(df['renta_neta_uf']), _as_float(df['numero_trabajadores_dependientes'])),
+            index=df.index
+        )
+    
+    # Calculate gender ratios
+    if 'numero_trabajadores_femenino' in columns and 'numero_trabajadores_masculino' in columns:
+        femenino = _as_float(df['numero_trabajadores_femenino'])
+        masculino = _as_float(df['numero_trabajadores_masculino'])
+        total_gendered = np.where(np.isnan(femenino), 0.0, femenino) + np.where(np.isnan(masculino), 0.0, masculino)
+        features['ratio_femenino'] = pd.Series(_safe_divide(femenino, total_gendered), index=df.index)
+    
+    # Create size categories based on number of employees: [0, 10], (10, 50],
+    # (50, 200] and above 200, as pd.cut with include_lowest would build them
+    if 'numero_trabajadores_dependientes' in columns:
+        trabajadores = _as_float(df['numero_trabajadores_dependientes'])
+        codes = np.searchsorted(SIZE_CATEGORY_BOUNDS, trabajadores, side='left')
+        codes[np.isnan(trabajadores) | (trabajadores < 0)] = -1
+        features['categoria_empresa'] = pd.Series(
+            pd.Categorical.from_codes(codes, categories=SIZE_CATEGORY_LABELS, ordered=True),
+            index=df.index
+        )
+    
+    # Extract sector code from economic activity
+    if 'rubro_economico' in columns:
+        features['codigo_sector'] = _map_unique(
+            df['rubro_economico'], lambda s: s.str.extract(SECTOR_CODE_PATTERN, expand=False)
+        ).astype('category')
+    
+    return features
+
+
 class ColumnStandardizer(BaseTransformer):
     """
     Single Responsibility: Standardize column names and structure
@@ -39,12 +224,12 @@ class ColumnStandardizer(BaseTransformer):
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names"""
-        logger.info("Standardizing column names")
+        logger.debug("Standardizing column names")
         
         converter = DataTypeConverter()
-        df_transformed = converter.standardize_column_names(df.copy())
+        df_transformed = converter.standardize_column_names(df)
         
-        logger.info("Column standardization completed")
+        logger.debug("Column standardization completed")
         return df_transformed
 
 
@@ -58,46 +243,11 @@ class DataTypeTransformer(BaseTransformer):
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform data types"""
-        logger.info("Starting data type transformation")
-        df_transformed = df.copy()
-        
-        # Define numeric columns
-        numeric_columns = [
-            'numero_empresas', 'ventas_anuales_uf', 'numero_trabajadores_dependientes',
-            'renta_neta_uf', 'trabajadores_ponderados_meses', 'numero_trabajadores_femenino',
-            'renta_neta_femenino_uf', 'trabajadores_femenino_ponderados',
-            'numero_trabajadores_masculino', 'renta_neta_masculino_uf',
-            'trabajadores_masculino_ponderados', 'numero_trabajadores_honorarios',
-            'honorarios_pagados_uf', 'trabajadores_honorarios_ponderados',
-            'numero_trabajadores_honorarios_femenino', 'honorarios_femenino_uf',
-            'trabajadores_honorarios_femenino_ponderados',
-            'numero_trabajadores_honorarios_masculino', 'honorarios_masculino_uf',
-            'trabajadores_honorarios_masculino_ponderados'
-        ]
-        
-        # Convert numeric columns
-        for col in numeric_columns:
-            if col in df_transformed.columns:
-                try:
-                    df_transformed[col] = self.converter.convert_to_numeric(df_transformed[col])
-                    logger.debug(f"Converted {col} to numeric")
-                except Exception as e:
-                    logger.warning(f"Failed to convert {col} to numeric: {e}")
-        
-        # Convert year to integer
-        if 'año_comercial' in df_transformed.columns:
-            df_transformed['año_comercial'] = pd.to_numeric(
-                df_transformed['año_comercial'], errors='coerce'
-            ).astype('Int64')
-        
-        # Clean categorical columns
-        categorical_columns = ['comuna', 'provincia', 'region', 'rubro_economico']
-        for col in categorical_columns:
-            if col in df_transformed.columns:
-                df_transformed[col] = df_transformed[col].astype(str).str.strip()
-                df_transformed[col] = df_transformed[col].replace('nan', np.nan)
-        
-        logger.info("Data type transformation completed")
+        logger.debug("Starting data type transformation")
+        
+        df_transformed = df.assign(**_convert_types(df, self.converter))
+        
+        logger.debug("Data type transformation completed")
         return df_transformed
 
 
@@ -108,31 +258,33 @@ class DataCleaner(BaseTransformer):
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean data"""
-        logger.info("Starting data cleaning")
-        df_cleaned = df.copy()
+        logger.debug("Starting data cleaning")
         
-        # Remove completely empty rows
-        df_cleaned = df_cleaned.dropna(how='all')
+        available_key_fields = [col for col in KEY_COLUMNS if col in df.columns]
         
-        # Handle asterisks (*) in data - convert to NaN
-        df_cleaned = df_cleaned.replace('*', np.nan)
-        
-        # Remove rows where all key fields are missing
-        key_fields = ['comuna', 'provincia', 'region', 'rubro_economico']
-        available_key_fields = [col for col in key_fields if col in df_cleaned.columns]
+        # Handle asterisks (*) in data - convert to NaN (replace returns a new
+        # DataFrame, so the assignments below never reach the input)
+        df_cleaned = df.replace('*', np.nan)
         
+        # Remove rows where all key fields are missing. Completely empty rows
+        # are among them, so the whole frame only needs scanning without keys
         if available_key_fields:
-            df_cleaned = df_cleaned.dropna(subset=available_key_fields, how='all')
+            df_cleaned = df_cleaned[_any_present(df_cleaned, available_key_fields)]
+        else:
+            df_cleaned = df_cleaned[df.notna().any(axis=1).to_numpy()]
         
-        # Clean text fields
-        text_columns = df_cleaned.select_dtypes(include=['object']).columns
-        for col in text_columns:
-            if col in ['comuna', 'provincia', 'region', 'rubro_economico']:
+        # Clean text fields (object or Arrow-backed text)
+        for col in available_key_fields:
+            dtype = df_cleaned[col].dtype
+            if dtype == object or isinstance(dtype, pd.StringDtype):
                 # Remove extra whitespace and standardize
-                df_cleaned[col] = df_cleaned[col].str.strip()
-                df_cleaned[col] = df_cleaned[col].str.replace(r'\s+', ' ', regex=True)
+                df_cleaned[col] = _map_unique(df_cleaned[col], _collapse_whitespace)
+        
+        # Store each key value once; rows keep small integer codes
+        for col in available_key_fields:
+            df_cleaned[col] = df_cleaned[col].astype('category')
         
-        logger.info(f"Data cleaning completed. Records: {len(df)} -> {len(df_cleaned)}")
+        logger.debug("Data cleaning completed. Records: {} -> {}", len(df), len(df_cleaned))
         return df_cleaned
 
 
@@ -143,77 +295,116 @@ class FeatureEngineer(BaseTransformer):
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Engineer new features"""
-        logger.info("Starting feature engineering")
-        df_enhanced = df.copy()
-        
-        # Calculate average salary per employee (if data available)
-        if all(col in df_enhanced.columns for col in ['renta_neta_uf', 'numero_trabajadores_dependientes']):
-            df_enhanced['salario_promedio_uf'] = (
-                df_enhanced['renta_neta_uf'] / df_enhanced['numero_trabajadores_dependientes']
-            ).replace([np.inf, -np.inf], np.nan)
-        
-        # Calculate gender ratios
-        if all(col in df_enhanced.columns for col in ['numero_trabajadores_femenino', 'numero_trabajadores_masculino']):
-            total_gendered = df_enhanced['numero_trabajadores_femenino'].fillna(0) + df_enhanced['numero_trabajadores_masculino'].fillna(0)
-            df_enhanced['ratio_femenino'] = (
-                df_enhanced['numero_trabajadores_femenino'] / total_gendered
-            ).replace([np.inf, -np.inf], np.nan)
-        
-        # Create size categories based on number of employees
-        if 'numero_trabajadores_dependientes' in df_enhanced.columns:
-            df_enhanced['categoria_empresa'] = pd.cut(
-                df_enhanced['numero_trabajadores_dependientes'],
-                bins=[0, 10, 50, 200, np.inf],
-                labels=['Micro', 'Pequeña', 'Mediana', 'Grande'],
-                include_lowest=True
-            )
-        
-        # Extract sector code from economic activity
-        if 'rubro_economico' in df_enhanced.columns:
-            df_enhanced['codigo_sector'] = df_enhanced['rubro_economico'].str.extract(r'^([A-Z])')
-        
-        logger.info("Feature engineering completed")
+        logger.debug("Starting feature engineering")
+        
+        df_enhanced = df.assign(**_derive_features(df))
+        
+        logger.debug("Feature engineering completed")
+        return df_enhanced
+
+
+class FusedTransformer(BaseTransformer):
+    """
+    Single Responsibility: Apply the standard transformations in one pass
+    
+    Produces the same result as ColumnStandardizer, DataTypeTransformer,
+    DataCleaner and FeatureEngineer run in sequence, but computes the row
+    filters as a single mask and adds converted columns and features with
+    one assign each, instead of materializing a full DataFrame per step.
+    """
+    
+    def __init__(self):
+        self.converter = DataTypeConverter()
+    
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize, convert, clean and enrich df"""
+        logger.debug("Starting fused transformation")
+        
+        df_renamed = self.converter.standardize_column_names(df)
+        df_typed = df_renamed.assign(**_convert_types(df_renamed, self.converter))
+        
+        available_key_fields = [col for col in KEY_COLUMNS if col in df_typed.columns]
+        
+        # Same row filter as DataCleaner: only the key columns are scanned
+        # unless there are none
+        df_replaced = df_typed.replace('*', np.nan)
+        if available_key_fields:
+            keep = _any_present(df_replaced, available_key_fields)
+        else:
+            keep = df_typed.notna().any(axis=1).to_numpy()
+        
+        df_cleaned = df_replaced[keep]
+        
+        # Collapse inner whitespace in the key columns and store them as
+        # categories, as DataCleaner does
+        text_columns = {
+            col: _map_unique(df_cleaned[col], _collapse_whitespace).astype('category')
+            for col in available_key_fields
+        }
+        df_cleaned = df_cleaned.assign(**text_columns)
+        
+        df_enhanced = df_cleaned.assign(**_derive_features(df_cleaned))
+        
+        logger.debug("Fused transformation completed. Records: {} -> {}", len(df), len(df_enhanced))
         return df_enhanced
 
 
+def _run_partition(transformers: List[BaseTransformer], df: pd.DataFrame) -> pd.DataFrame:
+    """Apply transformers in sequence to one row partition (module-level so workers can unpickle it)"""
+    for transformer in transformers:
+        df = transformer.transform(df)
+    return df
+
+
 class TransformationPipeline:
     """
     Single Responsibility: Orchestrate transformation pipeline
     Dependency Inversion: Depends on abstractions (BaseTransformer)
+    
+    With n_workers > 1, large DataFrames are split into row partitions that
+    are transformed in worker processes. All standard transformations work
+    row by row, so the concatenated partitions equal a single-process run.
     """
     
-    def __init__(self, transformers: List[BaseTransformer], metadata: Optional[ETLMetadata] = None):
+    # Smallest partition worth sending to a worker process
+    MIN_PARTITION_ROWS = 100_000
+    
+    def __init__(
+        self,
+        transformers: List[BaseTransformer],
+        metadata: Optional[ETLMetadata] = None,
+        n_workers: int = 1
+    ):
         self.transformers = transformers
         self.metadata = metadata
+        self.n_workers = n_workers
     
-    def run_transformations(self, df: pd.DataFrame) -> pd.DataFrame:
+    def run_transformations(self, df: pd.DataFrame, step_level: str = "INFO") -> pd.DataFrame:
         """
         Run all transformations in sequence
         
         Args:
             df: Input DataFrame
+            step_level: Log level for the per-step messages; chunked runs pass
+                "DEBUG" and report progress in batches instead
             
         Returns:
             pd.DataFrame: Fully transformed DataFrame
         """
-        logger.info("Starting transformation pipeline")
+        logger.log(step_level, "Starting transformation pipeline")
         
-        current_df = df.copy()
+        n_partitions = min(self.n_workers, len(df) // self.MIN_PARTITION_ROWS)
         
         try:
-            for i, transformer in enumerate(self.transformers):
-                logger.info(f"Running transformer {i+1}/{len(self.transformers)}: {transformer.__class__.__name__}")
-                
-                previous_shape = current_df.shape
-                current_df = transformer.transform(current_df)
-                current_shape = current_df.shape
-                
-                logger.info(f"Transformation completed. Shape: {previous_shape} -> {current_shape}")
+            if n_partitions > 1:
+                current_df = self._run_partitioned(df, n_partitions, step_level)
+            else:
+                current_df = self._run_sequential(df, step_level)
             
             if self.metadata:
                 self.metadata.records_processed = len(current_df)
             
-            logger.info("Transformation pipeline completed successfully")
+            logger.log(step_level, "Transformation pipeline completed successfully")
             return current_df
             
         except Exception as e:
@@ -221,20 +412,60 @@ class TransformationPipeline:
             if self.metadata:
                 self.metadata.errors.append(f"Transformation error: {e}")
             raise
+    
+    def _run_sequential(self, df: pd.DataFrame, step_level: str) -> pd.DataFrame:
+        """Run the transformers one after another in this process"""
+        # No defensive copy: each transformer returns a new DataFrame and leaves
+        # its input untouched
+        current_df = df
+        stage_stats = []
+        
+        # One summary line per run instead of two lines per transformer
+        for transformer in self.transformers:
+            start = time.perf_counter()
+            current_df = transformer.transform(current_df)
+            stage_stats.append(f"{transformer.__class__.__name__} {time.perf_counter() - start:.3f}s")
+        
+        logger.log(
+            step_level, "Transformation completed. Shape: {} -> {} ({})",
+            df.shape, current_df.shape, ", ".join(stage_stats)
+        )
+        return current_df
+    
+    def _run_partitioned(self, df: pd.DataFrame, n_partitions: int, step_level: str) -> pd.DataFrame:
+        """Run the transformers over row partitions in worker processes"""
+        bounds = np.linspace(0, len(df), n_partitions + 1, dtype=int)
+        partitions = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+        
+        logger.log(step_level, "Running {} transformers over {} partitions", len(self.transformers), n_partitions)
+        
+        with ProcessPoolExecutor(max_workers=n_partitions) as executor:
+            results = list(executor.map(partial(_run_partition, self.transformers), partitions))
+        
+        current_df = pd.concat(results)
+        
+        # Partitions holding different categories concatenate as plain values;
+        # converting again gives the categories a single-process run would have
+        recast = {
+            col: current_df[col].astype('category')
+            for col, dtype in results[0].dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+            and not isinstance(current_df[col].dtype, pd.CategoricalDtype)
+        }
+        if recast:
+            current_df = current_df.assign(**recast)
+        logger.log(step_level, "Transformation completed. Shape: {} -> {}", df.shape, current_df.shape)
+        return current_df
 
 
-def create_standard_pipeline() -> TransformationPipeline:
+def create_standard_pipeline(n_workers: int = 1) -> TransformationPipeline:
     """
     Factory function to create standard transformation pipeline
     
+    Args:
+        n_workers: Worker processes for large DataFrames (1 runs in-process)
+    
     Returns:
         TransformationPipeline: Configured pipeline
     """
-    transformers = [
-        ColumnStandardizer(),
-        DataTypeTransformer(),
-        DataCleaner(),
-        FeatureEngineer()
-    ]
-    
-    return TransformationPipeline(transformers)
+    return TransformationPipeline([FusedTransformer()], n_workers=n_workers)
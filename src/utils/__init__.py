@@ -1,13 +1,22 @@
 """Utils package initialization"""
+import pandas as pd
+
+# Share unmodified columns between the DataFrames each ETL step returns.
+# pandas >= 3.0 always behaves this way and deprecates the option.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 from .config import ConfigManager, ETLConfig
-from .logging import setup_project_logging, get_logger
-from .file_handlers import FileHandler, DataTypeConverter
+from .logging import setup_project_logging, get_logger, LogSampler
+from .file_handlers import FileHandler, SHARED_FILE_HANDLER, DataTypeConverter
 
 __all__ = [
     "ConfigManager", 
     "ETLConfig", 
     "setup_project_logging", 
     "get_logger",
+    "LogSampler",
     "FileHandler",
+    "SHARED_FILE_HANDLER",
     "DataTypeConverter"
 ]
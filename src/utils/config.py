@@ -5,13 +5,15 @@ Single Responsibility: Handle configuration loading and validation
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any
-from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from dotenv import load_dotenv
 
 
 class ETLConfig(BaseModel):
-    """Configuration model with validation"""
+    """Configuration model with validation (immutable once loaded)"""
+    model_config = ConfigDict(extra="allow", frozen=True)
+    
     raw_data_path: str
     processed_data_path: str
     output_data_path: str
@@ -20,9 +22,10 @@ class ETLConfig(BaseModel):
     thousands_separator: str = "."
     chunk_size: int = 10000
     max_workers: int = 4
-    
-    class Config:
-        extra = "allow"
+    parallel_transform: bool = False
+    output_formats: List[str] = ["parquet"]
+    intermediate_format: str = "feather"
+    transform_engine: str = "pandas"
 
 
 class ConfigManager:
@@ -31,23 +34,40 @@ class ConfigManager:
     Open/Closed: Easy to extend with new configuration sources
     """
     
+    # The .env file only needs loading once per process
+    _env_loaded = False
+    
     def __init__(self, config_path: str = "config/etl_config.yaml"):
         self.config_path = Path(config_path)
+        self._config: Optional[ETLConfig] = None
         self._load_environment()
     
-    def _load_environment(self) -> None:
+    @classmethod
+    def _load_environment(cls) -> None:
         """Load environment variables from .env file"""
+        if cls._env_loaded:
+            return
         env_path = Path(".env")
         if env_path.exists():
             load_dotenv(env_path)
+        cls._env_loaded = True
     
     def load_config(self) -> ETLConfig:
         """
         Load configuration from YAML file and environment variables
         
+        The result is cached: later calls on this manager return the same
+        (immutable) ETLConfig without reading the file again.
+        
         Returns:
             ETLConfig: Validated configuration object
         """
+        if self._config is None:
+            self._config = self._build_config()
+        return self._config
+    
+    def _build_config(self) -> ETLConfig:
+        """Read the YAML file and environment variables into an ETLConfig"""
         # Load from YAML
         yaml_config = self._load_yaml_config()
         
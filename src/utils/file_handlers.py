@@ -5,12 +5,80 @@ Single Responsibility: Handle file operations and data I/O
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Raw SII column names and their standardized Python names. The year header
+# is listed with and without the file's UTF-8 BOM, since the CSV readers
+# (pandas, pyarrow, Polars) strip it
+COLUMN_MAPPING = {
+    '﻿Año Comercial': 'año_comercial',
+    'Año Comercial': 'año_comercial',
+    'Comuna del domicilio o casa matriz': 'comuna',
+    'Provincia del domicilio o casa matriz': 'provincia',
+    'Region del domicilio o casa matriz': 'region',
+    'Rubro economico': 'rubro_economico',
+    'Número de empresas': 'numero_empresas',
+    'Ventas anuales en UF': 'ventas_anuales_uf',
+    'Número de trabajadores dependientes informados': 'numero_trabajadores_dependientes',
+    'Renta neta informada en UF': 'renta_neta_uf',
+    'Trabajadores ponderados por meses trabajados': 'trabajadores_ponderados_meses',
+    'Número de trabajadores dependientes de género femenino informados': 'numero_trabajadores_femenino',
+    'Renta neta informada en UF, trabajadores de género femenino': 'renta_neta_femenino_uf',
+    'Trabajadores de género femenino ponderados por meses trabajados': 'trabajadores_femenino_ponderados',
+    'Número de trabajadores dependientes de género masculino informados': 'numero_trabajadores_masculino',
+    'Renta neta informada en UF, trabajadores de género masculino': 'renta_neta_masculino_uf',
+    'Trabajadores de género masculino ponderados por meses trabajados': 'trabajadores_masculino_ponderados',
+    'Número de trabajadores a honorarios informados': 'numero_trabajadores_honorarios',
+    'Honorarios pagados informados en UF': 'honorarios_pagados_uf',
+    'Trabajadores a honorarios ponderados por meses trabajados': 'trabajadores_honorarios_ponderados',
+    'Número de trabajadores a honorarios de género femenino informados': 'numero_trabajadores_honorarios_femenino',
+    'Honorarios pagados informados a trabajadores de género femenino en UF': 'honorarios_femenino_uf',
+    'Trabajadores a honorarios de género femenino ponderados por meses trabajados': 'trabajadores_honorarios_femenino_ponderados',
+    'Número de trabajadores a honorarios de género masculino informados': 'numero_trabajadores_honorarios_masculino',
+    'Honorarios pagados informados a trabajadores de género masculino en UF': 'honorarios_masculino_uf',
+    'Trabajadores a honorarios de género masculino ponderados por meses trabajados': 'trabajadores_honorarios_masculino_ponderados'
+}
+
+
+def _arrow_text_dtype() -> Any:
+    """
+    Arrow-backed text dtype that keeps NaN as the missing value
+    
+    This is the default 'str' dtype on pandas >= 3. On pandas 2.x it is requested
+    explicitly, so .str methods run in pyarrow compute without changing a global option.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return 'str'
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)  # pandas 2.3
+    except TypeError:
+        pass
+    try:
+        return pd.StringDtype('pyarrow_numpy')  # pandas 2.1 and 2.2
+    except (ImportError, ValueError):  # older pandas keeps object text
+        return object
+
+
+TEXT_DTYPE = _arrow_text_dtype()
+
+
+def as_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the object (text) columns of df with TEXT_DTYPE"""
+    text_columns = df.columns[df.dtypes == object]
+    if TEXT_DTYPE is object or text_columns.empty:
+        return df
+    return df.astype({col: TEXT_DTYPE for col in text_columns})
+
+
+def _is_polars_frame(df: Any) -> bool:
+    """Tell whether df is a Polars DataFrame or LazyFrame (without importing polars)"""
+    return type(df).__module__.startswith('polars')
+
+
 class FileHandler:
     """
     Single Responsibility: Handle file I/O operations
@@ -36,13 +104,36 @@ class FileHandler:
         """
         try:
             logger.info(f"Reading CSV file: {file_path}")
-            df = pd.read_csv(file_path, encoding=encoding, **kwargs)
+            df = as_text_columns(pd.read_csv(file_path, encoding=encoding, **kwargs))
             logger.info(f"Successfully loaded {len(df)} records from {file_path}")
             return df
         except Exception as e:
             logger.error(f"Error reading CSV file {file_path}: {e}")
             raise
     
+    @staticmethod
+    def read_csv_chunks(
+        file_path: str,
+        chunksize: int,
+        encoding: str = 'utf-8',
+        **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file lazily in chunks
+        
+        Args:
+            file_path: Path to CSV file
+            chunksize: Rows per chunk
+            encoding: File encoding
+            **kwargs: Additional pandas read_csv parameters
+            
+        Returns:
+            Iterator[pd.DataFrame]: Chunks of at most chunksize rows, read on demand
+        """
+        logger.info(f"Reading CSV file in chunks of {chunksize} rows: {file_path}")
+        reader = pd.read_csv(file_path, encoding=encoding, chunksize=chunksize, **kwargs)
+        return (as_text_columns(chunk) for chunk in reader)
+    
     @staticmethod
     def save_csv(
         df: pd.DataFrame,
@@ -54,17 +145,24 @@ class FileHandler:
         Save DataFrame to CSV with error handling
         
         Args:
-            df: DataFrame to save
+            df: pandas or Polars DataFrame (or Polars LazyFrame) to save
             file_path: Output file path
-            index: Whether to include index
-            **kwargs: Additional pandas to_csv parameters
+            index: Whether to include index (pandas only)
+            **kwargs: Additional to_csv (pandas) or write_csv (Polars) parameters
         """
         try:
             # Create directory if it doesn't exist
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
             
+            is_polars = _is_polars_frame(df)
+            if is_polars:
+                df = FileHandler._collect(df)
+            
             logger.info(f"Saving {len(df)} records to {file_path}")
-            df.to_csv(file_path, index=index, **kwargs)
+            if is_polars:
+                df.write_csv(file_path, **kwargs)
+            else:
+                df.to_csv(file_path, index=index, **kwargs)
             logger.info(f"Successfully saved data to {file_path}")
         except Exception as e:
             logger.error(f"Error saving CSV file {file_path}: {e}")
@@ -80,21 +178,38 @@ class FileHandler:
         Save DataFrame to Parquet format
         
         Args:
-            df: DataFrame to save
+            df: pandas or Polars DataFrame (or Polars LazyFrame) to save
             file_path: Output file path
-            **kwargs: Additional pandas to_parquet parameters
+            **kwargs: Additional to_parquet (pandas) or write_parquet (Polars) parameters
         """
         try:
             # Create directory if it doesn't exist
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
             
+            is_polars = _is_polars_frame(df)
+            if is_polars:
+                df = FileHandler._collect(df)
+            
             logger.info(f"Saving {len(df)} records to {file_path} (Parquet)")
-            df.to_parquet(file_path, **kwargs)
+            if is_polars:
+                df.write_parquet(file_path, **kwargs)
+            else:
+                df.to_parquet(file_path, **kwargs)
             logger.info(f"Successfully saved data to {file_path}")
         except Exception as e:
             logger.error(f"Error saving Parquet file {file_path}: {e}")
             raise
 
+    
+    @staticmethod
+    def _collect(df: Any) -> Any:
+        """Materialize a Polars LazyFrame with the streaming engine; return DataFrames as-is"""
+        return df.collect(engine='streaming') if hasattr(df, 'collect') else df
+
+
+# FileHandler is stateless, so extractors and loaders share one instance
+SHARED_FILE_HANDLER = FileHandler()
+
 
 class DataTypeConverter:
     """
@@ -139,56 +254,56 @@ class DataTypeConverter:
         Returns:
             pd.Series: Converted series
         """
-        # Clean string formatting
-        if series.dtype == 'object':
-            series = series.astype(str).str.replace('"', '')
+        # Clean string formatting (pandas >= 3 reads text as 'str', not object)
+        if series.dtype == 'object' or pd.api.types.is_string_dtype(series.dtype):
+            series = series.astype(TEXT_DTYPE).str.replace('"', '')
             series = series.str.replace(',', '')
             series = series.replace('*', np.nan)
         
         return pd.to_numeric(series, errors=errors)
     
+    @staticmethod
+    def downcast_integers(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store int64 columns as int32 when all their values fit
+        
+        int32 is used as the floor (not int8/int16) so that sums of counts,
+        such as female + male workers, cannot overflow. Float columns keep
+        float64 since UF amounts need its precision.
+        
+        Args:
+            df: DataFrame to downcast (left unchanged)
+            
+        Returns:
+            pd.DataFrame: DataFrame with downcast integer columns
+        """
+        int32_info = np.iinfo(np.int32)
+        columns = {
+            col: df[col].astype(np.int32)
+            for col in df.select_dtypes(include=[np.int64]).columns
+            if len(df) and int32_info.min <= df[col].min() and df[col].max() <= int32_info.max
+        }
+        if columns:
+            logger.debug("Downcast {} integer columns to int32", len(columns))
+        return df.assign(**columns) if columns else df
+    
     @staticmethod
     def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
         """
         Standardize column names following Python naming conventions
         
+        The key columns renamed here (comuna, provincia, region,
+        rubro_economico) are stored as category dtype by the transformations.
+        
         Args:
             df: DataFrame with columns to standardize
             
         Returns:
             pd.DataFrame: DataFrame with standardized column names
         """
-        column_mapping = {
-            '﻿Año Comercial': 'año_comercial',
-            'Comuna del domicilio o casa matriz': 'comuna',
-            'Provincia del domicilio o casa matriz': 'provincia',
-            'Region del domicilio o casa matriz': 'region',
-            'Rubro economico': 'rubro_economico',
-            'Número de empresas': 'numero_empresas',
-            'Ventas anuales en UF': 'ventas_anuales_uf',
-            'Número de trabajadores dependientes informados': 'numero_trabajadores_dependientes',
-            'Renta neta informada en UF': 'renta_neta_uf',
-            'Trabajadores ponderados por meses trabajados': 'trabajadores_ponderados_meses',
-            'Número de trabajadores dependientes de género femenino informados': 'numero_trabajadores_femenino',
-            'Renta neta informada en UF, trabajadores de género femenino': 'renta_neta_femenino_uf',
-            'Trabajadores de género femenino ponderados por meses trabajados': 'trabajadores_femenino_ponderados',
-            'Número de trabajadores dependientes de género masculino informados': 'numero_trabajadores_masculino',
-            'Renta neta informada en UF, trabajadores de género masculino': 'renta_neta_masculino_uf',
-            'Trabajadores de género masculino ponderados por meses trabajados': 'trabajadores_masculino_ponderados',
-            'Número de trabajadores a honorarios informados': 'numero_trabajadores_honorarios',
-            'Honorarios pagados informados en UF': 'honorarios_pagados_uf',
-            'Trabajadores a honorarios ponderados por meses trabajados': 'trabajadores_honorarios_ponderados',
-            'Número de trabajadores a honorarios de género femenino informados': 'numero_trabajadores_honorarios_femenino',
-            'Honorarios pagados informados a trabajadores de género femenino en UF': 'honorarios_femenino_uf',
-            'Trabajadores a honorarios de género femenino ponderados por meses trabajados': 'trabajadores_honorarios_femenino_ponderados',
-            'Número de trabajadores a honorarios de género masculino informados': 'numero_trabajadores_honorarios_masculino',
-            'Honorarios pagados informados a trabajadores de género masculino en UF': 'honorarios_masculino_uf',
-            'Trabajadores a honorarios de género masculino ponderados por meses trabajados': 'trabajadores_honorarios_masculino_ponderados'
-        }
-        
         # Rename columns that exist in the mapping
-        existing_columns = {col: column_mapping[col] for col in df.columns if col in column_mapping}
+        existing_columns = {col: COLUMN_MAPPING[col] for col in df.columns if col in COLUMN_MAPPING}
         df_renamed = df.rename(columns=existing_columns)
         
-        logger.info(f"Standardized {len(existing_columns)} column names")
+        logger.debug("Standardized {} column names", len(existing_columns))
         return df_renamed
@@ -3,6 +3,7 @@ Logging utilities following SOLID principles
 Single Responsibility: Handle logging configuration and setup
 """
 import sys
+import time
 from pathlib import Path
 from loguru import logger
 from typing import Optional
@@ -65,7 +66,10 @@ class LoggerManager:
                 level=log_level,
                 rotation="10 MB",
                 retention="7 days",
-                compression="zip"
+                compression="zip",
+                # Format and write records on a background thread so the
+                # file I/O stays off the processing loop
+                enqueue=True
             )
         
         self._configured = True
@@ -76,6 +80,34 @@ class LoggerManager:
         return logger.bind(name=name)
 
 
+class LogSampler:
+    """
+    Single Responsibility: Rate-limit repetitive progress messages
+    
+    Lets the first call through, then one every `every` calls or once
+    `interval` seconds have passed since the last emitted message.
+    """
+    
+    def __init__(self, every: int = 10, interval: float = 5.0):
+        self.every = every
+        self.interval = interval
+        self.calls = 0
+        self._last_emit: Optional[float] = None
+    
+    def ready(self) -> bool:
+        """Count a call and tell whether its message should be emitted"""
+        self.calls += 1
+        now = time.monotonic()
+        if (
+            self._last_emit is None
+            or self.calls % self.every == 0
+            or now - self._last_emit >= self.interval
+        ):
+            self._last_emit = now
+            return True
+        return False
+
+
 # Global logger manager instance
 logger_manager = LoggerManager()
 
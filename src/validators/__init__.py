@@ -4,7 +4,11 @@ from .data_validators import (
     SchemaValidator,
     DataQualityValidator,
     BusinessRuleValidator,
-    DataValidationPipeline
+    RecordSchemaValidator,
+    DataValidationPipeline,
+    ChunkedValidation,
+    summarize_frame,
+    count_nulls
 )
 
 __all__ = [
@@ -12,5 +16,9 @@ __all__ = [
     "SchemaValidator", 
     "DataQualityValidator",
     "BusinessRuleValidator",
-    "DataValidationPipeline"
+    "RecordSchemaValidator",
+    "DataValidationPipeline",
+    "ChunkedValidation",
+    "summarize_frame",
+    "count_nulls"
 ]
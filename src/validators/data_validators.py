@@ -3,15 +3,125 @@ Data validators following SOLID principles
 Open/Closed: Easy to add new validation rules
 Single Responsibility: Each validator has a specific purpose
 """
+import hashlib
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from ..data_models import DataQualityReport
+from collections import Counter, OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
+from ..data_models import DataQualityReport, EMPRESA_COLUMN_RULES, validate_columns
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Key fields that must not be missing or blank
+REQUIRED_FIELDS = ('comuna', 'provincia', 'region', 'rubro_economico')
+
+# Prefixes of the numeric columns that cannot be negative
+NON_NEGATIVE_PREFIXES = ('numero_', 'ventas_', 'renta_', 'honorarios_')
+
+
+def count_nulls(df: pd.DataFrame) -> pd.Series:
+    """
+    Count nulls per column
+    
+    Arrow-backed columns (pyarrow strings, pd.ArrowDtype) already store their
+    null count alongside the validity bitmap, so it is read directly instead
+    of building a boolean mask. Other columns are masked one at a time, so at
+    most one column-sized mask is alive instead of one for the whole frame.
+    
+    Args:
+        df: DataFrame to inspect
+        
+    Returns:
+        pd.Series: Null count per column, indexed like df.columns
+    """
+    counts = np.zeros(df.shape[1], dtype=np.int64)
+    
+    for position in range(df.shape[1]):
+        values = df.iloc[:, position].array
+        if isinstance(values, pd.arrays.ArrowExtensionArray):
+            counts[position] = values.__arrow_array__().null_count
+        else:
+            counts[position] = np.count_nonzero(values.isna())
+    
+    return pd.Series(counts, index=df.columns)
+
+
+def count_blank(series: pd.Series) -> int:
+    """
+    Count missing or whitespace-only values of a text column
+    
+    For other than string dtypes, the strip runs on the distinct values (the categories of a categorical
+    column) instead of on every row, and rows are counted through their codes.
+    
+    Args:
+        series: Text or categorical Series to inspect
+        
+    Returns:
+        int: Number of missing or blank values
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        # String dtypes strip natively (Arrow buffers) without Python objects
+        return int((series.isna() | (series.str.strip() == '')).sum())
+    
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+    
+    blank = np.asarray(pd.Series(uniques, dtype=object).astype(str).str.strip() == '', dtype=bool)
+    present = codes[codes >= 0]
+    return int(len(codes) - len(present) + blank[present].sum())
+
+
+def summarize_frame(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute the whole-frame statistics shared by several validators
+    
+    Null counts and duplicate detection each scan every cell, so they are
+    computed once here instead of once per validator.
+    
+    Args:
+        df: DataFrame to summarize
+        
+    Returns:
+        Dict with 'total_records', 'columns', 'null_counts' (per column Series),
+        'duplicate_count' and, if 'año_comercial' exists, 'year_range'
+    """
+    summary = {
+        'total_records': len(df),
+        'columns': df.columns.tolist(),
+        'null_counts': count_nulls(df),
+        'duplicate_count': int(df.duplicated().sum()),
+    }
+    if 'año_comercial' in df.columns:
+        summary['year_range'] = (df['año_comercial'].min(), df['año_comercial'].max())
+    return summary
+
+
+def frame_fingerprint(df: pd.DataFrame) -> Optional[Tuple]:
+    """
+    Content key of a DataFrame: shape, column names, dtypes and a digest of every row
+    
+    Rows are hashed with pandas' vectorized hash (ignoring the index, as the
+    validators do), which costs a small fraction of a validation run and,
+    unlike a sample, changes with any edit to the data.
+    
+    Args:
+        df: DataFrame to fingerprint
+        
+    Returns:
+        Tuple usable as a dict key, or None if some values cannot be hashed
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        return None
+    
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+    return df.shape, tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), digest
+
 
 class BaseValidator(ABC):
     """
@@ -20,17 +130,48 @@ class BaseValidator(ABC):
     """
     
     @abstractmethod
-    def validate(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def validate(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Validate DataFrame and return validation results
         
         Args:
             df: DataFrame to validate
+            summary: Precomputed statistics from summarize_frame (optional)
             
         Returns:
             Dict containing validation results
         """
         pass
+    
+    def chunk_counts(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Counter:
+        """
+        Counts of one chunk that add up to the counts of the whole table
+        
+        Validators that only need the whole-table summary (columns, null and
+        duplicate counts) keep the default, which counts nothing.
+        
+        Args:
+            df: Chunk to count
+            summary: Statistics of the chunk (optional)
+            
+        Returns:
+            Counter to be summed over all chunks
+        """
+        return Counter()
+    
+    def validate_counts(self, counts: Counter, df: pd.DataFrame, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validation results from counts accumulated over all chunks of a table
+        
+        Args:
+            counts: Sum of chunk_counts over the chunks
+            df: Empty DataFrame with the columns and dtypes of the table
+            summary: Whole-table statistics, as returned by summarize_frame
+            
+        Returns:
+            Dict containing validation results
+        """
+        return self.validate(df, summary)
 
 
 class SchemaValidator(BaseValidator):
@@ -40,18 +181,20 @@ class SchemaValidator(BaseValidator):
     
     def __init__(self, expected_columns: List[str]):
         self.expected_columns = expected_columns
+        self.expected_set = set(expected_columns)
     
-    def validate(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def validate(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Validate DataFrame schema"""
         issues = []
+        columns = set(summary['columns'] if summary else df.columns)
         
         # Check for missing columns
-        missing_columns = set(self.expected_columns) - set(df.columns)
+        missing_columns = self.expected_set - columns
         if missing_columns:
             issues.append(f"Missing columns: {missing_columns}")
         
         # Check for extra columns
-        extra_columns = set(df.columns) - set(self.expected_columns)
+        extra_columns = columns - self.expected_set
         if extra_columns:
             issues.append(f"Extra columns: {extra_columns}")
         
@@ -74,24 +217,27 @@ class DataQualityValidator(BaseValidator):
     def __init__(self, max_null_percentage: float = 0.1):
         self.max_null_percentage = max_null_percentage
     
-    def validate(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def validate(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Validate data quality"""
         issues = []
+        summary = summary or summarize_frame(df)
+        
+        total_records = summary['total_records']
         
         # Calculate null percentages
-        null_percentages = df.isnull().sum() / len(df)
+        null_percentages = summary['null_counts'] / total_records
         high_null_columns = null_percentages[null_percentages > self.max_null_percentage]
         
         if not high_null_columns.empty:
             issues.append(f"High null percentage in columns: {high_null_columns.to_dict()}")
         
         # Check for duplicate rows
-        duplicates = df.duplicated().sum()
+        duplicates = summary['duplicate_count']
         if duplicates > 0:
             issues.append(f"Found {duplicates} duplicate rows")
         
         # Check for empty DataFrame
-        if len(df) == 0:
+        if total_records == 0:
             issues.append("DataFrame is empty")
         
         is_valid = len(issues) == 0
@@ -100,50 +246,89 @@ class DataQualityValidator(BaseValidator):
             'validator': 'DataQualityValidator',
             'is_valid': is_valid,
             'issues': issues,
-            'null_percentages': null_percentages.to_dict(),
+            'null_percentages': null_percentages,  # Series indexed by column
             'duplicate_count': duplicates,
-            'total_records': len(df)
+            'total_records': total_records
         }
 
 
 class BusinessRuleValidator(BaseValidator):
     """
     Single Responsibility: Validate business-specific rules
+    
+    Args:
+        min_year: Earliest valid commercial year
+        max_year: Latest valid commercial year
+        n_failure_cases: Maximum number of invalid years listed in the issue
+            (None lists them all)
     """
     
-    def __init__(self, min_year: int = 2005, max_year: int = 2024):
+    def __init__(self, min_year: int = 2005, max_year: int = 2024, n_failure_cases: Optional[int] = None):
         self.min_year = min_year
         self.max_year = max_year
+        self.n_failure_cases = n_failure_cases
     
-    def validate(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def validate(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Validate business rules"""
-        issues = []
+        return self.validate_counts(self.chunk_counts(df, summary), df, summary)
+    
+    def chunk_counts(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Counter:
+        """Count invalid years (per year), negative values and blank required fields"""
+        counts = Counter()
         
-        # Validate year range
-        if 'año_comercial' in df.columns:
+        # Validate year range (the scan is skipped when the known range is within bounds)
+        year_range = summary.get('year_range') if summary else None
+        years_in_bounds = (
+            year_range is not None
+            and not (pd.isna(year_range[0]) or pd.isna(year_range[1]))
+            and self.min_year <= year_range[0] and year_range[1] <= self.max_year
+        )
+        if 'año_comercial' in df.columns and not years_in_bounds:
             year_col = df['año_comercial']
-            invalid_years = year_col[
-                (year_col < self.min_year) | (year_col > self.max_year)
-            ].dropna()
+            years = year_col.to_numpy(dtype=np.float64, na_value=np.nan)
+            out_of_range = (years < self.min_year) | (years > self.max_year)
             
-            if not invalid_years.empty:
-                issues.append(f"Invalid years found: {invalid_years.unique()}")
+            # Missing years compare False, so they are never reported; counted
+            # per distinct year (in order of first appearance), not per row
+            if out_of_range.any():
+                codes, invalid_years = pd.factorize(year_col[out_of_range])
+                counts.update({
+                    ('invalid_year', year): int(count)
+                    for year, count in zip(invalid_years.tolist(), np.bincount(codes))
+                })
         
-        # Validate negative values in numeric columns
+        # Validate negative values in numeric columns (counted on the column
+        # values, without filtering the whole frame)
         numeric_columns = df.select_dtypes(include=[np.number]).columns
         for col in numeric_columns:
-            if col.startswith(('numero_', 'ventas_', 'renta_', 'honorarios_')):
-                negative_values = df[df[col] < 0][col].dropna()
-                if not negative_values.empty:
-                    issues.append(f"Negative values in {col}: {len(negative_values)} records")
+            if col.startswith(NON_NEGATIVE_PREFIXES):
+                counts['negative', col] += np.count_nonzero(
+                    df[col].to_numpy(dtype=np.float64, na_value=np.nan) < 0
+                )
         
         # Validate required categorical fields
-        categorical_required = ['comuna', 'provincia', 'region', 'rubro_economico']
-        for col in categorical_required:
+        for col in REQUIRED_FIELDS:
             if col in df.columns:
-                empty_values = df[col].isna() | (df[col].str.strip() == '')
-                if empty_values.any():
-                    issues.append(f"Empty values in required field {col}: {empty_values.sum()} records")
+                counts['blank', col] += count_blank(df[col])
+        
+        return counts
+    
+    def validate_counts(self, counts: Counter, df: pd.DataFrame, summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Business rule issues from the counts of the whole table"""
+        issues = []
+        
+        # Invalid years in order of first appearance
+        invalid_years = [key[1] for key in counts if key[0] == 'invalid_year']
+        if invalid_years:
+            issues.append(f"Invalid years found: {format_failure_cases(invalid_years, self.n_failure_cases)}")
+        
+        for col in df.columns:
+            if counts['negative', col]:
+                issues.append(f"Negative values in {col}: {counts['negative', col]} records")
+        
+        for col in REQUIRED_FIELDS:
+            if counts['blank', col]:
+                issues.append(f"Empty values in required field {col}: {counts['blank', col]} records")
         
         is_valid = len(issues) == 0
         
@@ -154,35 +339,135 @@ class BusinessRuleValidator(BaseValidator):
         }
 
 
+class RecordSchemaValidator(BaseValidator):
+    """
+    Single Responsibility: Validate all records against the EmpresaRecord rules
+    Checks whole columns at once instead of building one model per row
+    """
+    
+    def __init__(self, rules: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.rules = rules
+    
+    def validate(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Validate record-level constraints column by column"""
+        return self.validate_counts(self.chunk_counts(df, summary), df, summary)
+    
+    def chunk_counts(self, df: pd.DataFrame, summary: Optional[Dict[str, Any]] = None) -> Counter:
+        """Count the rows violating each column's rules"""
+        return Counter(validate_columns(df, self.rules))
+    
+    def validate_counts(self, counts: Counter, df: pd.DataFrame, summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Record constraint issues from the violation counts of the whole table"""
+        rules = EMPRESA_COLUMN_RULES if self.rules is None else self.rules
+        violations = {col: counts[col] for col in rules if counts[col]}
+        
+        issues = [
+            f"Records violating {col} constraints: {count}"
+            for col, count in violations.items()
+        ]
+        
+        return {
+            'validator': 'RecordSchemaValidator',
+            'is_valid': len(issues) == 0,
+            'issues': issues,
+            'violations': violations
+        }
+
+
 class DataValidationPipeline:
     """
     Single Responsibility: Orchestrate multiple validators
     Dependency Inversion: Depends on abstractions (BaseValidator)
     """
     
-    def __init__(self, validators: List[BaseValidator]):
+    def __init__(self, validators: List[BaseValidator], cache_size: int = 8):
         self.validators = validators
+        self.cache_size = cache_size
+        # Reports of the most recently validated frames, keyed by frame_fingerprint
+        self._reports: "OrderedDict[Tuple, DataQualityReport]" = OrderedDict()
     
-    def run_validation(self, df: pd.DataFrame) -> DataQualityReport:
+    def run_validation(
+        self,
+        df: pd.DataFrame,
+        summary: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None
+    ) -> DataQualityReport:
         """
         Run all validators and generate comprehensive report
         
+        A frame whose content was already validated by this pipeline (same
+        fingerprint) gets a copy of its earlier report without running the
+        validators again.
+        
         Args:
             df: DataFrame to validate
+            summary: Precomputed statistics from summarize_frame (computed here if omitted)
+            chunk_size: Validate slices of this many rows, bounding the size of
+                the temporary masks (None validates the whole frame at once)
             
         Returns:
             DataQualityReport: Comprehensive validation report
         """
-        logger.info("Starting data validation pipeline")
+        key = frame_fingerprint(df) if self.cache_size else None
+        if key is not None and key in self._reports:
+            self._reports.move_to_end(key)
+            logger.info("Data unchanged since its last validation, reusing the report")
+            return self._reports[key].model_copy(deep=True)
+        
+        if chunk_size and len(df) > chunk_size:
+            report = self.run_validation_chunked(
+                df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)
+            )
+        else:
+            logger.info("Starting data validation pipeline")
+            summary = summary or summarize_frame(df)
+            report = self._build_report(
+                lambda position, validator: validator.validate(df, summary), summary
+            )
+        
+        if key is not None:
+            self._reports[key] = report.model_copy(deep=True)
+            if len(self._reports) > self.cache_size:
+                self._reports.popitem(last=False)
+        
+        return report
+    
+    def run_validation_chunked(self, chunks: Iterable[pd.DataFrame]) -> DataQualityReport:
+        """
+        Validate a table given as chunks, holding only one chunk at a time
         
+        Args:
+            chunks: Iterable of DataFrames with the same columns
+            
+        Returns:
+            DataQualityReport: Same report as validating the concatenated chunks
+        """
+        validation = ChunkedValidation(self)
+        for chunk in chunks:
+            validation.add(chunk)
+        return validation.report()
+    
+    def _build_report(
+        self,
+        run: Callable[[int, BaseValidator], Dict[str, Any]],
+        summary: Dict[str, Any]
+    ) -> DataQualityReport:
+        """
+        Run every validator through run and combine their issues into the report
+        
+        Args:
+            run: Function returning the results of the validator at a position
+            summary: Whole-table statistics, as returned by summarize_frame
+            
+        Returns:
+            DataQualityReport: Comprehensive validation report
+        """
         all_issues = []
-        validation_results = []
         
         # Run all validators
-        for validator in self.validators:
+        for position, validator in enumerate(self.validators):
             try:
-                result = validator.validate(df)
-                validation_results.append(result)
+                result = run(position, validator)
                 
                 if not result['is_valid']:
                     all_issues.extend(result['issues'])
@@ -193,53 +478,162 @@ class DataValidationPipeline:
                 logger.error(error_msg)
                 all_issues.append(error_msg)
         
-        # Calculate quality metrics
-        total_records = len(df)
-        null_count = df.isnull().sum().sum()
-        duplicate_count = df.duplicated().sum()
-        
-        # Calculate quality score (0-1)
-        quality_score = self._calculate_quality_score(
-            total_records, null_count, duplicate_count, len(all_issues)
-        )
-        
-        report = DataQualityReport(
-            total_records=total_records,
-            valid_records=total_records - duplicate_count,
-            invalid_records=duplicate_count,
-            null_percentage=null_count / (total_records * len(df.columns)) if total_records > 0 else 0,
-            duplicate_records=duplicate_count,
-            quality_score=quality_score,
+        report = build_quality_report(
+            total_records=summary['total_records'],
+            n_columns=len(summary['columns']),
+            null_count=summary['null_counts'].sum(),
+            duplicate_count=summary['duplicate_count'],
             issues=all_issues
         )
         
-        logger.info(f"Validation completed. Quality score: {quality_score:.2f}")
+        logger.info(f"Validation completed. Quality score: {report.quality_score:.2f}")
         return report
+
+
+class ChunkedValidation:
+    """
+    Single Responsibility: Validate a table that arrives in chunks
     
-    def _calculate_quality_score(
-        self, 
-        total_records: int, 
-        null_count: int, 
-        duplicate_count: int, 
-        issue_count: int
-    ) -> float:
-        """Calculate overall data quality score"""
-        if total_records == 0:
-            return 0.0
+    Each chunk is reduced to counts that add up across chunks (nulls per
+    column, one 64-bit hash per row for the duplicate count and each
+    validator's chunk_counts), so only one chunk is in memory at a time and
+    report() matches validating the concatenated table.
+    """
+    
+    def __init__(self, pipeline: DataValidationPipeline):
+        self.pipeline = pipeline
+        self.total_records = 0
+        self._schema: Optional[pd.DataFrame] = None
+        self._null_counts: Optional[np.ndarray] = None
+        self._row_hashes: List[np.ndarray] = []
+        self._counts = [Counter() for _ in pipeline.validators]
+        self._errors: Dict[int, Exception] = {}
+    
+    def add(self, chunk: pd.DataFrame):
+        """
+        Count one chunk
         
-        # Base score
-        score = 1.0
+        Args:
+            chunk: DataFrame with the same columns as the previous chunks
+        """
+        if self._schema is None:
+            self._schema = chunk.iloc[:0]
+            self._null_counts = np.zeros(chunk.shape[1], dtype=np.int64)
         
-        # Penalize for nulls (max 20% penalty)
-        null_penalty = min(0.2, (null_count / total_records) * 0.5)
-        score -= null_penalty
+        self.total_records += len(chunk)
+        self._null_counts += count_nulls(chunk).to_numpy()
+        self._row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
         
-        # Penalize for duplicates (max 15% penalty)
-        duplicate_penalty = min(0.15, (duplicate_count / total_records) * 0.3)
-        score -= duplicate_penalty
+        summary = {}
+        if 'año_comercial' in chunk.columns:
+            summary['year_range'] = (chunk['año_comercial'].min(), chunk['año_comercial'].max())
         
-        # Penalize for validation issues (max 30% penalty)
-        issue_penalty = min(0.3, issue_count * 0.05)
-        score -= issue_penalty
+        for position, validator in enumerate(self.pipeline.validators):
+            if position in self._errors:
+                continue
+            try:
+                self._counts[position].update(validator.chunk_counts(chunk, summary))
+            except Exception as e:
+                self._errors[position] = e
+    
+    def report(self) -> DataQualityReport:
+        """
+        Build the report of all chunks added so far
+        
+        Returns:
+            DataQualityReport: Comprehensive validation report
+        """
+        if self._schema is None:
+            return self.pipeline.run_validation(pd.DataFrame())
+        
+        logger.info(f"Starting data validation pipeline ({self.total_records} records in chunks)")
+        
+        row_hashes = np.concatenate(self._row_hashes)
+        summary = {
+            'total_records': self.total_records,
+            'columns': self._schema.columns.tolist(),
+            'null_counts': pd.Series(self._null_counts, index=self._schema.columns),
+            'duplicate_count': len(row_hashes) - len(np.unique(row_hashes)),
+        }
+        
+        def run(position: int, validator: BaseValidator) -> Dict[str, Any]:
+            if position in self._errors:
+                raise self._errors[position]
+            return validator.validate_counts(self._counts[position], self._schema, summary)
+        
+        return self.pipeline._build_report(run, summary)
+
+
+def format_failure_cases(cases: List[Any], n_failure_cases: Optional[int] = None) -> str:
+    """
+    Format failure cases for an issue message, listing at most n_failure_cases
+    
+    Args:
+        cases: Failure cases in report order
+        n_failure_cases: Maximum number of cases listed (None lists them all)
+    
+    Returns:
+        str: The listed cases, followed by how many were left out
+    """
+    if n_failure_cases is None or len(cases) <= n_failure_cases:
+        return f"{cases}"
+    return f"{cases[:n_failure_cases]} and {len(cases) - n_failure_cases} more"
+
+
+def build_quality_report(
+    total_records: int,
+    n_columns: int,
+    null_count: int,
+    duplicate_count: int,
+    issues: List[str]
+) -> DataQualityReport:
+    """
+    Build the quality report from the whole-frame counts and validator issues
+    
+    Args:
+        total_records: Number of rows validated
+        n_columns: Number of columns validated
+        null_count: Null cells across the whole frame
+        duplicate_count: Rows repeating an earlier row
+        issues: Issues reported by the validators
         
-        return max(0.0, score)
+    Returns:
+        DataQualityReport: Report with the overall quality score
+    """
+    return DataQualityReport(
+        total_records=total_records,
+        valid_records=total_records - duplicate_count,
+        invalid_records=duplicate_count,
+        null_percentage=null_count / (total_records * n_columns) if total_records > 0 else 0,
+        duplicate_records=duplicate_count,
+        quality_score=calculate_quality_score(total_records, null_count, duplicate_count, len(issues)),
+        issues=issues
+    )
+
+
+def calculate_quality_score(
+    total_records: int,
+    null_count: int,
+    duplicate_count: int,
+    issue_count: int
+) -> float:
+    """Calculate overall data quality score (0-1)"""
+    if total_records == 0:
+        return 0.0
+    
+    # Base score
+    score = 1.0
+    
+    # Penalize for nulls (max 20% penalty)
+    null_penalty = min(0.2, (null_count / total_records) * 0.5)
+    score -= null_penalty
+    
+    # Penalize for duplicates (max 15% penalty)
+    duplicate_penalty = min(0.15, (duplicate_count / total_records) * 0.3)
+    score -= duplicate_penalty
+    
+    # Penalize for validation issues (max 30% penalty)
+    issue_penalty = min(0.3, issue_count * 0.05)
+    score -= issue_penalty
+    
+    return max(0.0, score)
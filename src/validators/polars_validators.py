@@ -0,0 +1,223 @@
+"""
+Polars data validators following SOLID principles
+Single Responsibility: Run the standard validators as one Polars aggregation
+"""
+from typing import Any, Dict, List, Union
+
+import pandas as pd
+
+from .data_validators import (
+    BaseValidator,
+    SchemaValidator,
+    DataQualityValidator,
+    BusinessRuleValidator,
+    RecordSchemaValidator,
+    REQUIRED_FIELDS,
+    NON_NEGATIVE_PREFIXES,
+    build_quality_report,
+    format_failure_cases
+)
+from ..data_models import DataQualityReport, EMPRESA_COLUMN_RULES
+from ..utils.logging import get_logger
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional: the pandas validators are the default
+    pl = None
+
+logger = get_logger(__name__)
+
+
+class PolarsValidationPipeline:
+    """
+    Single Responsibility: Validate Polars data with the standard validators
+    
+    Mirrors DataValidationPipeline for the same validator objects: every
+    count they need (nulls, duplicates, negatives, blanks, rule violations)
+    is one expression of a single select, so Polars computes them in one
+    parallel pass and the issues are built from the resulting row.
+    """
+    
+    def __init__(self, validators: List[BaseValidator]):
+        if pl is None:
+            raise ImportError("polars is required for the Polars validators (pip install polars)")
+        self.validators = validators
+    
+    def run_validation(
+        self,
+        data: Union["pl.DataFrame", "pl.LazyFrame", pd.DataFrame]
+    ) -> DataQualityReport:
+        """
+        Run all validators and generate comprehensive report
+        
+        Args:
+            data: Polars DataFrame or LazyFrame (a pandas DataFrame is converted)
+        
+        Returns:
+            DataQualityReport: Comprehensive validation report
+        """
+        logger.info("Starting Polars data validation pipeline")
+        
+        if isinstance(data, pd.DataFrame):
+            data = pl.from_pandas(data)
+        lf = data.lazy()
+        schema = lf.collect_schema()
+        
+        exprs = {
+            'rows': pl.len(),
+            'unique_rows': pl.struct(pl.all()).n_unique() if schema else pl.lit(0),
+        }
+        exprs.update({f'nulls:{col}': _null_count(col, schema[col]) for col in schema.names()})
+        for position, validator in enumerate(self.validators):
+            exprs.update({
+                f'{position}:{name}': expr
+                for name, expr in self._expressions(validator, schema).items()
+            })
+        
+        row = lf.select(**exprs).collect(engine='streaming').row(0, named=True)
+        
+        total_records = row['rows']
+        null_counts = {col: row[f'nulls:{col}'] for col in schema.names()}
+        duplicate_count = total_records - row['unique_rows'] if total_records else 0
+        all_issues = []
+        
+        for position, validator in enumerate(self.validators):
+            stats = {
+                name.split(':', 1)[1]: value
+                for name, value in row.items()
+                if name.startswith(f'{position}:')
+            }
+            issues = self._issues(validator, schema, stats, null_counts, total_records, duplicate_count)
+            all_issues.extend(issues)
+            logger.info(f"{validator.__class__.__name__}: {'FAILED' if issues else 'PASSED'}")
+        
+        report = build_quality_report(
+            total_records=total_records,
+            n_columns=len(schema),
+            null_count=sum(null_counts.values()),
+            duplicate_count=duplicate_count,
+            issues=all_issues
+        )
+        
+        logger.info(f"Validation completed. Quality score: {report.quality_score:.2f}")
+        return report
+    
+    @staticmethod
+    def _expressions(validator: BaseValidator, schema: "pl.Schema") -> Dict[str, "pl.Expr"]:
+        """Aggregations a validator needs beyond the shared row, null and duplicate counts"""
+        columns = schema.names()
+        
+        if isinstance(validator, BusinessRuleValidator):
+            exprs = {}
+            if 'año_comercial' in columns:
+                year = pl.col('año_comercial')
+                exprs['invalid_years'] = (
+                    year.filter((year < validator.min_year) | (year > validator.max_year))
+                    .unique(maintain_order=True).implode()
+                )
+            for col in columns:
+                if col.startswith(NON_NEGATIVE_PREFIXES) and schema[col].is_numeric():
+                    exprs[f'negative:{col}'] = (pl.col(col) < 0).sum()
+            for col in REQUIRED_FIELDS:
+                if col in columns:
+                    text = pl.col(col).cast(pl.String)
+                    exprs[f'blank:{col}'] = (text.is_null() | (text.str.strip_chars() == '')).sum()
+            return exprs
+        
+        if isinstance(validator, RecordSchemaValidator):
+            return {
+                f'violations:{col}': _rule_violations(col, rules, schema[col]).sum()
+                for col, rules in (validator.rules or EMPRESA_COLUMN_RULES).items()
+                if col in columns
+            }
+        
+        return {}
+    
+    @staticmethod
+    def _issues(
+        validator: BaseValidator,
+        schema: "pl.Schema",
+        stats: Dict[str, Any],
+        null_counts: Dict[str, int],
+        total_records: int,
+        duplicate_count: int
+    ) -> List[str]:
+        """Issues of a validator, worded as the pandas validator words them"""
+        issues = []
+        
+        if isinstance(validator, SchemaValidator):
+            columns = set(schema.names())
+            missing_columns = validator.expected_set - columns
+            if missing_columns:
+                issues.append(f"Missing columns: {missing_columns}")
+            extra_columns = columns - validator.expected_set
+            if extra_columns:
+                issues.append(f"Extra columns: {extra_columns}")
+        
+        elif isinstance(validator, DataQualityValidator):
+            high_null_columns = {
+                col: count / total_records
+                for col, count in null_counts.items()
+                if total_records and count / total_records > validator.max_null_percentage
+            }
+            if high_null_columns:
+                issues.append(f"High null percentage in columns: {high_null_columns}")
+            if duplicate_count > 0:
+                issues.append(f"Found {duplicate_count} duplicate rows")
+            if total_records == 0:
+                issues.append("DataFrame is empty")
+        
+        elif isinstance(validator, BusinessRuleValidator):
+            if stats.get('invalid_years'):
+                invalid_years = format_failure_cases(stats['invalid_years'], validator.n_failure_cases)
+                issues.append(f"Invalid years found: {invalid_years}")
+            for name, count in stats.items():
+                kind, _, col = name.partition(':')
+                if kind == 'negative' and count:
+                    issues.append(f"Negative values in {col}: {count} records")
+                elif kind == 'blank' and count:
+                    issues.append(f"Empty values in required field {col}: {count} records")
+        
+        elif isinstance(validator, RecordSchemaValidator):
+            issues.extend(
+                f"Records violating {name.partition(':')[2]} constraints: {count}"
+                for name, count in stats.items()
+                if count
+            )
+        
+        else:
+            issues.append(f"Validator {validator.__class__.__name__} failed: not supported by the Polars validators")
+        
+        return issues
+
+
+def _null_count(column: str, dtype: "pl.DataType") -> "pl.Expr":
+    """Missing values of a column, counting NaN as missing like pandas does"""
+    if dtype.is_float():
+        return (pl.col(column).is_null() | pl.col(column).is_nan()).sum()
+    return pl.col(column).null_count()
+
+
+def _rule_violations(column: str, rules: Dict[str, Any], dtype: "pl.DataType") -> "pl.Expr":
+    """Row mask of the rule violations of a column, as validate_columns checks them"""
+    values = pl.col(column)
+    invalid = pl.lit(False)
+    
+    if rules.get('required'):
+        invalid = invalid | values.is_null()
+    
+    if 'min_length' in rules:
+        lengths = values.cast(pl.String).str.strip_chars().str.len_chars()
+        invalid = invalid | (lengths < rules['min_length']).fill_null(False)
+    
+    if dtype.is_numeric():
+        if 'ge' in rules:
+            invalid = invalid | (values < rules['ge']).fill_null(False)
+        if 'gt' in rules:
+            invalid = invalid | (values <= rules['gt']).fill_null(False)
+        if 'le' in rules:
+            invalid = invalid | (values > rules['le']).fill_null(False)
+        if 'lt' in rules:
+            invalid = invalid | (values >= rules['lt']).fill_null(False)
+    
+    return invalid
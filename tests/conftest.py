@@ -28,6 +28,33 @@ def sample_raw_data():
     })
 
 
+@pytest.fixture
+def synthetic_raw_data():
+    """
+    Larger raw SII-like data with the problems the validators look for:
+    out-of-range years, '*' and blank key fields, withheld ('*') and
+    negative counts, and duplicate rows
+    """
+    rng = np.random.default_rng(7)
+    n = 300
+
+    def pick(values):
+        return rng.choice(values, n)
+
+    data = pd.DataFrame({
+        '﻿Año Comercial': rng.integers(2003, 2027, n).astype(str),
+        'Comuna del domicilio o casa matriz': pick(['Valdivia', 'La Unión', 'Río  Bueno', ' Panguipulli', '*', '  ']),
+        'Provincia del domicilio o casa matriz': pick(['Valdivia', 'Ranco', '*']),
+        'Region del domicilio o casa matriz': pick(['Región de Los Ríos', 'Región de Los Ríos', '*']),
+        'Rubro economico': pick(['A - Agricultura', 'C - Manufactura', 'G - Comercio', '*']),
+        'Número de empresas': pick(['0', '3', '12', '45', '*', '-1']),
+        'Ventas anuales en UF': [f"{value:,.1f}" for value in rng.uniform(0, 2e6, n)],
+        'Número de trabajadores dependientes informados': pick(['0', '5', '30', '120', '900', '*']),
+        'Renta neta informada en UF': pick(['1,250.5', '80', '*', '-3.5'])
+    })
+    return pd.concat([data, data.head(10)], ignore_index=True)
+
+
 @pytest.fixture
 def sample_transformed_data():
     """Sample transformed data for testing"""
@@ -55,6 +82,14 @@ def temp_csv_file(sample_raw_data):
     Path(f.name).unlink(missing_ok=True)
 
 
+@pytest.fixture
+def synthetic_csv_file(synthetic_raw_data, temp_directory):
+    """Write the synthetic raw data to a CSV file"""
+    file_path = temp_directory / 'synthetic.csv'
+    synthetic_raw_data.to_csv(file_path, index=False)
+    return str(file_path)
+
+
 @pytest.fixture
 def temp_directory():
     """Create temporary directory for testing"""
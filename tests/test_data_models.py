@@ -3,7 +3,14 @@ Tests for data models
 """
 import pytest
 from datetime import datetime
-from src.data_models import EmpresaRecord, ETLMetadata, DataQualityReport
+from src.data_models import (
+    EmpresaRecord,
+    ETLMetadata,
+    DataQualityReport,
+    EMPRESA_COLUMN_RULES,
+    parse_empresa_records,
+    validate_columns
+)
 
 
 class TestEmpresaRecord:
@@ -58,6 +65,32 @@ class TestEmpresaRecord:
                 rubro_economico="A - Agricultura",
                 numero_empresas=-1  # Negative value
             )
+    
+    def test_parse_record_batch(self):
+        """Test batch validation of raw record dicts"""
+        records = parse_empresa_records([
+            {
+                'año_comercial': 2020,
+                'comuna': " Santiago ",
+                'provincia': "Santiago",
+                'region': "RM",
+                'rubro_economico': "A - Agricultura"
+            },
+            {
+                'año_comercial': 2021,
+                'comuna': "Valdivia",
+                'provincia': "Valdivia",
+                'region': "Los Ríos",
+                'rubro_economico': "B - Minería",
+                'numero_empresas': 5
+            }
+        ])
+        
+        assert [r.comuna for r in records] == ["Santiago", "Valdivia"]
+        assert records[1].numero_empresas == 5
+        
+        with pytest.raises(ValueError):
+            parse_empresa_records([{'año_comercial': 2020}])
 
 
 class TestETLMetadata:
@@ -116,3 +149,31 @@ class TestDataQualityReport:
                 duplicate_records=10,
                 quality_score=1.5  # Invalid score > 1
             )
+
+
+class TestEmpresaSchema:
+    """Test columnar validation derived from EmpresaRecord"""
+    
+    def test_rules_follow_model_fields(self):
+        """Test that column rules mirror the EmpresaRecord constraints"""
+        assert EMPRESA_COLUMN_RULES['año_comercial'] == {'required': True, 'ge': 2005, 'le': 2030}
+        assert EMPRESA_COLUMN_RULES['comuna']['min_length'] == 1
+        assert EMPRESA_COLUMN_RULES['numero_empresas'] == {'required': False, 'ge': 0}
+    
+    def test_valid_dataframe(self, sample_transformed_data):
+        """Test that valid data reports no violations"""
+        assert validate_columns(sample_transformed_data) == {}
+    
+    def test_invalid_values_counted(self, sample_transformed_data):
+        """Test that out-of-range, empty and missing values are counted per column"""
+        df = sample_transformed_data.copy()
+        df.loc[0, 'año_comercial'] = 1999
+        df.loc[1, 'comuna'] = "  "
+        df.loc[2, 'numero_empresas'] = -1
+        df.loc[0, 'ventas_anuales_uf'] = None  # Optional field
+        
+        assert validate_columns(df) == {
+            'año_comercial': 1,
+            'comuna': 1,
+            'numero_empresas': 1
+        }
@@ -0,0 +1,25 @@
+"""
+Tests for ETL extraction
+"""
+import pandas as pd
+from src.etl.extract import CSVExtractor
+
+
+class TestCSVExtractor:
+    """Test CSV extraction"""
+    
+    def test_arrow_reader_matches_pandas(self, synthetic_csv_file):
+        """Test that the Arrow CSV reader gives the same frame as pandas read_csv"""
+        arrow = CSVExtractor(use_arrow=True).extract(synthetic_csv_file)
+        fallback = CSVExtractor(use_arrow=False).extract(synthetic_csv_file)
+        
+        pd.testing.assert_frame_equal(arrow, fallback)
+        assert arrow['Número de empresas'].isna().any()
+    
+    def test_chunks_match_whole_file(self, synthetic_csv_file):
+        """Test that chunked extraction yields the rows of the whole file in order"""
+        whole = CSVExtractor().extract(synthetic_csv_file)
+        chunks = list(CSVExtractor().extract(synthetic_csv_file, chunksize=100))
+        
+        assert [len(chunk) for chunk in chunks] == [100, 100, 100, 10]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
@@ -0,0 +1,59 @@
+"""
+Tests for ETL loading
+"""
+import pandas as pd
+from src.etl.load import StreamingLoader, PartitionedParquetLoader
+from src.etl.transform import FusedTransformer
+from src.utils.file_handlers import FileHandler
+
+
+class TestStreamingLoader:
+    """Test chunked loading"""
+    
+    def test_chunked_parquet_keeps_dtypes(self, sample_raw_data, temp_directory):
+        """Test that chunked and whole-frame Parquet outputs read back with the same dtypes"""
+        # Missing amounts ('*') make the UF columns float, as in SII data
+        sample_raw_data.loc[0, ['Ventas anuales en UF', 'Renta neta informada en UF']] = '*'
+        transformed = FusedTransformer().transform(sample_raw_data)
+        
+        whole_path = temp_directory / 'whole.parquet'
+        FileHandler.save_parquet(transformed, str(whole_path))
+        
+        loader = StreamingLoader({'parquet': str(temp_directory)}, 'chunked')
+        loader.write_chunk(transformed.iloc[:2])
+        loader.write_chunk(transformed.iloc[2:])
+        loader.close()
+        
+        whole = pd.read_parquet(whole_path)
+        chunked = pd.read_parquet(loader.paths['parquet'])
+        
+        assert chunked.dtypes.to_dict() == whole.dtypes.to_dict()
+        assert isinstance(chunked['comuna'].dtype, pd.CategoricalDtype)
+        assert str(chunked['numero_empresas'].dtype) == 'Int32'
+
+
+class TestPartitionedParquetLoader:
+    """Test the Hive-partitioned Parquet output"""
+    
+    def test_partitions_and_unpartitioned_rows(self, synthetic_raw_data, temp_directory):
+        """Test one directory per year, with rows missing the year in the sidecar file"""
+        synthetic_raw_data.loc[:4, '﻿Año Comercial'] = '*'
+        transformed = FusedTransformer().transform(synthetic_raw_data)
+        missing_year = transformed['año_comercial'].isna()
+        destination = temp_directory / 'dataset'
+        
+        assert PartitionedParquetLoader().load(transformed, str(destination))
+        
+        years = transformed.loc[~missing_year, 'año_comercial'].unique()
+        assert sorted(path.name for path in destination.iterdir()) == sorted(f'año_comercial={year}' for year in years)
+        
+        dataset = pd.read_parquet(destination)
+        assert len(dataset) == int((~missing_year).sum())
+        assert (
+            dataset['año_comercial'].astype(int).value_counts().sort_index().tolist()
+            == transformed['año_comercial'].value_counts().sort_index().tolist()
+        )
+        
+        unpartitioned = pd.read_parquet(f'{destination}_unpartitioned.parquet')
+        assert len(unpartitioned) == int(missing_year.sum()) == 5
+        assert unpartitioned['año_comercial'].isna().all()
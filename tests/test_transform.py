@@ -0,0 +1,47 @@
+"""
+Tests for ETL transformations
+"""
+import pandas as pd
+import pytest
+from src.etl.extract import CSVExtractor
+from src.etl.transform import FusedTransformer, COUNT_COLUMNS
+from src.etl.polars_transform import PolarsTransformationPipeline
+
+
+def as_values(series):
+    """Values of a Series as Python objects, with every missing value as None"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+class TestFusedTransformer:
+    """Test the fused transformation"""
+    
+    def test_key_column_all_missing(self, sample_raw_data):
+        """Test that a key column with only '*' values stays missing"""
+        sample_raw_data['Provincia del domicilio o casa matriz'] = '*'
+        
+        result = FusedTransformer().transform(sample_raw_data)
+        
+        assert len(result) == 3
+        assert result['provincia'].isna().all()
+        assert isinstance(result['provincia'].dtype, pd.CategoricalDtype)
+        assert result['comuna'].tolist() == ['Santiago', 'Valparaíso', 'Concepción']
+
+
+class TestPolarsTransformationPipeline:
+    """Test the Polars transform engine against the pandas transformations"""
+    
+    def test_same_output_as_pandas(self, synthetic_csv_file):
+        """Test that both engines produce the same columns, rows and values"""
+        pl = pytest.importorskip('polars')
+        
+        expected = FusedTransformer().transform(CSVExtractor().extract(synthetic_csv_file))
+        result = PolarsTransformationPipeline().run(synthetic_csv_file).collect()
+        
+        assert result.columns == expected.columns.tolist()
+        assert result.height == len(expected)
+        for col in expected.columns:
+            assert as_values(result[col].to_pandas()) == as_values(expected[col]), col
+        for col in COUNT_COLUMNS:
+            if col in expected.columns:
+                assert result.schema[col] == pl.Int32, col
@@ -0,0 +1,100 @@
+"""
+Tests for data validators
+"""
+import pytest
+from src.etl.extract import CSVExtractor
+from src.etl.transform import FusedTransformer
+from src.etl.polars_transform import PolarsTransformationPipeline
+from src.validators import (
+    SchemaValidator,
+    DataQualityValidator,
+    BusinessRuleValidator,
+    RecordSchemaValidator,
+    DataValidationPipeline,
+    ChunkedValidation
+)
+from src.validators.polars_validators import PolarsValidationPipeline
+
+EXPECTED_COLUMNS = [
+    'año_comercial', 'comuna', 'provincia', 'region', 'rubro_economico',
+    'numero_empresas', 'ventas_anuales_uf', 'numero_trabajadores_dependientes',
+    'renta_neta_uf', 'trabajadores_ponderados_meses'
+]
+
+
+@pytest.fixture
+def validation_pipeline():
+    """Validation pipeline with every standard validator and no report cache"""
+    return DataValidationPipeline([
+        SchemaValidator(EXPECTED_COLUMNS),
+        DataQualityValidator(max_null_percentage=0.3),
+        BusinessRuleValidator(min_year=2005, max_year=2024),
+        RecordSchemaValidator()
+    ], cache_size=0)
+
+
+@pytest.fixture
+def transformed_synthetic_data(synthetic_raw_data):
+    """Synthetic data after the standard transformations"""
+    return FusedTransformer().transform(synthetic_raw_data)
+
+
+class TestChunkedValidation:
+    """Test that validating in chunks gives the whole-frame report"""
+    
+    def test_synthetic_data_has_issues(self, validation_pipeline, transformed_synthetic_data):
+        """Test that the synthetic data exercises every kind of issue"""
+        issues = validation_pipeline.run_validation(transformed_synthetic_data).issues
+        
+        for prefix in ("Missing columns", "High null percentage", "Found 10 duplicate rows",
+                       "Invalid years found", "Negative values in", "Empty values in required field",
+                       "Records violating"):
+            assert any(issue.startswith(prefix) for issue in issues), prefix
+    
+    @pytest.mark.parametrize('chunk_size', [7, 100])
+    def test_chunked_report_matches_whole(self, validation_pipeline, transformed_synthetic_data, chunk_size):
+        """Test chunked validation of an in-memory frame"""
+        whole = validation_pipeline.run_validation(transformed_synthetic_data)
+        chunked = validation_pipeline.run_validation(transformed_synthetic_data, chunk_size=chunk_size)
+        
+        assert chunked.model_dump() == whole.model_dump()
+    
+    def test_streamed_chunks_match_whole(self, validation_pipeline, synthetic_csv_file):
+        """Test chunks extracted and transformed one at a time, as a chunked run does"""
+        transformer = FusedTransformer()
+        whole = validation_pipeline.run_validation(
+            transformer.transform(CSVExtractor().extract(synthetic_csv_file))
+        )
+        
+        validation = ChunkedValidation(validation_pipeline)
+        for chunk in CSVExtractor().extract(synthetic_csv_file, chunksize=64):
+            validation.add(transformer.transform(chunk))
+        
+        assert validation.report().model_dump() == whole.model_dump()
+
+
+class TestPolarsValidationPipeline:
+    """Test that the Polars validators give the pandas report"""
+    
+    def test_same_frame(self, validation_pipeline, transformed_synthetic_data):
+        """Test the Polars validators on the pandas-transformed data"""
+        pl = pytest.importorskip('polars')
+        
+        expected = validation_pipeline.run_validation(transformed_synthetic_data)
+        report = PolarsValidationPipeline(validation_pipeline.validators).run_validation(
+            pl.from_pandas(transformed_synthetic_data)
+        )
+        
+        assert report.model_dump() == expected.model_dump()
+    
+    def test_polars_engine_run(self, validation_pipeline, synthetic_csv_file):
+        """Test a Polars engine run (lazy transform and validation) against a pandas run"""
+        pytest.importorskip('polars')
+        
+        expected = validation_pipeline.run_validation(
+            FusedTransformer().transform(CSVExtractor().extract(synthetic_csv_file))
+        )
+        transformed = PolarsTransformationPipeline().run(synthetic_csv_file).collect()
+        report = PolarsValidationPipeline(validation_pipeline.validators).run_validation(transformed)
+        
+        assert report.model_dump() == expected.model_dump()